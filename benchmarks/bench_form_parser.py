@@ -0,0 +1,131 @@
+"""
+Measures throughput of multipart/form-data parsing on synthetic uploads,
+which are generated while they are parsed, so uploads of several
+gigabytes never exist in memory.
+
+Modes:
+    parser - only feeding chunks to MultipartParser,
+    stream - reading parts with MultipartReader as ASGI server gives body,
+    form - reading form with read_form, that writes file to disk.
+
+Run as script:
+    python -m benchmarks.bench_form_parser --size-mb 2048
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import AsyncIterator, Iterator
+
+from storm.request.form import MultipartParser, MultipartReader, read_form
+
+BOUNDARY: bytes = b"----StormBenchmarkBoundary7MA4YWxkTrZu0gW"
+
+
+def make_upload(size: int, chunk_size: int) -> Iterator[bytes]:
+    """
+    Makes multipart body with few text fields and single file.
+
+    :param size: size of file in bytes.
+    :param chunk_size: size of chunks body is given in.
+    :return: iterator of body chunks.
+    """
+    generator = random.Random(0)
+    # Random data has CRLF in it, so parser has to check for boundary
+    file_chunk: bytes = generator.randbytes(chunk_size)
+
+    yield (
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="title"\r\n\r\n'
+        b"benchmark\r\n"
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="upload"; '
+        b'filename="upload.bin"\r\n'
+        b"Content-Type: application/octet-stream\r\n\r\n"
+    )
+
+    sent: int = 0
+    while sent < size:
+        chunk: bytes = file_chunk[:size - sent]
+        sent += len(chunk)
+        yield chunk
+
+    yield b"\r\n--" + BOUNDARY + b"--\r\n"
+
+
+async def make_async_upload(
+    size: int,
+    chunk_size: int
+) -> AsyncIterator[bytes]:
+    for chunk in make_upload(size, chunk_size):
+        yield chunk
+
+
+def parse_with_parser(size: int, chunk_size: int) -> None:
+    parser = MultipartParser(BOUNDARY)
+    for chunk in make_upload(size, chunk_size):
+        parser.feed(chunk)
+
+    assert parser.is_finished
+
+
+async def parse_as_stream(size: int, chunk_size: int) -> None:
+    reader = MultipartReader(make_async_upload(size, chunk_size), BOUNDARY)
+    async for part in reader:
+        async for _ in part:
+            pass
+
+
+async def parse_as_form(size: int, chunk_size: int) -> None:
+    form = await read_form(
+        make_async_upload(size, chunk_size),
+        "multipart/form-data; boundary=" + BOUNDARY.decode()
+    )
+    assert form.files["upload"][0].size == size
+    form.close()
+
+
+def measure(mode: str, size: int, chunk_size: int) -> float:
+    """
+    Measures parsing of upload.
+
+    :param mode: parser, stream or form.
+    :param size: size of uploaded file in bytes.
+    :param chunk_size: size of chunks body is given in.
+    :return: megabytes per second.
+    """
+    started_at = time.perf_counter()
+    if mode == "parser":
+        parse_with_parser(size, chunk_size)
+
+    elif mode == "stream":
+        asyncio.run(parse_as_stream(size, chunk_size))
+
+    else:
+        asyncio.run(parse_as_form(size, chunk_size))
+
+    return size / 2 ** 20 / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument(
+        "--modes", nargs="+", choices=("parser", "stream", "form"),
+        default=["parser", "stream", "form"]
+    )
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        megabytes_per_second = measure(
+            mode, args.size_mb * 2 ** 20, args.chunk_kb * 1024
+        )
+        print(f"{mode:>8}: {megabytes_per_second:>10.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
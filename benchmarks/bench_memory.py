@@ -0,0 +1,175 @@
+"""
+Measures memory that storm keeps for every request that is in flight,
+like long-poll request waiting for data, and for every open websocket.
+Scope dictionaries are made before measuring, since ASGI server
+allocates them, so only objects made by storm are counted: scope
+wrapper, matched handler, handler instance with bound parameters,
+headers, query and cookies.
+
+Run as script: python -m benchmarks.bench_memory --requests 10000
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Optional, Type
+
+from storm.app import StormApp
+from storm.internal_types.asgi import (
+    HttpASGIConnectionScope,
+    WebSocketASGIConnectionScope
+)
+from storm.request.handlers import (
+    HttpHandler,
+    StormBaseHandler,
+    WebSocketHandler
+)
+from storm.request.parameters import (
+    CookieParameter,
+    QueryParameter,
+    URLParameter
+)
+from storm.routing import Router
+
+
+class LongPollHandler(HttpHandler):
+    channel_id: URLParameter[int]
+    cursor: QueryParameter[Optional[int]] = 0
+    session: CookieParameter[Optional[str]] = None
+
+
+class SlottedLongPollHandler(HttpHandler, slotted=True):
+    channel_id: URLParameter[int]
+    cursor: QueryParameter[Optional[int]] = 0
+    session: CookieParameter[Optional[str]] = None
+
+
+class ChatSocketHandler(WebSocketHandler):
+    room_id: URLParameter[int]
+
+    async def execute(self) -> None:
+        await super().execute()
+
+
+class SlottedChatSocketHandler(WebSocketHandler, slotted=True):
+    room_id: URLParameter[int]
+
+    async def execute(self) -> None:
+        await super().execute()
+
+
+def make_raw_scope(connection_type: str, path: str) -> dict[str, Any]:
+    return {
+        "type": connection_type,
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http" if connection_type == "http" else "ws",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"cursor=1200",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"user-agent", b"benchmark"),
+            (b"accept", b"*/*"),
+            (b"cookie", b"session=4b1d7f; theme=dark"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+
+def start_connection(
+    app: StormApp,
+    raw_scope: dict[str, Any]
+) -> StormBaseHandler:
+    """
+    Does everything storm does for connection before handler starts
+    waiting: wraps scope, finds handler, binds parameters.
+
+    :param app: storm app.
+    :param raw_scope: scope from ASGI server.
+    :return: handler instance.
+    """
+    if raw_scope["type"] == "http":
+        scope: Any = HttpASGIConnectionScope(raw_scope)
+        matched_handler = app.router.find_http_handler(scope)
+
+    else:
+        scope = WebSocketASGIConnectionScope(raw_scope)
+        matched_handler = app.router.find_ws_handler(scope)
+
+    handler: StormBaseHandler = matched_handler.handler(
+        app, scope, None, matched_handler.arguments  # type: ignore
+    )
+    handler._bind_parameters()
+    return handler
+
+
+def measure(
+    app: StormApp,
+    connection_type: str,
+    prefix: str,
+    count: int
+) -> float:
+    """
+    Measures memory kept by open connections.
+
+    :param app: storm app.
+    :param connection_type: http or websocket.
+    :param prefix: url prefix of handler.
+    :param count: how many connections are open at once.
+    :return: bytes per connection.
+    """
+    raw_scopes = [
+        make_raw_scope(connection_type, f"{prefix}/{index}")
+        for index in range(count)
+    ]
+    # Warming up caches of router and handlers
+    start_connection(app, make_raw_scope(connection_type, f"{prefix}/0"))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        connections = [
+            start_connection(app, raw_scope) for raw_scope in raw_scopes
+        ]
+        after, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    assert len(connections) == count
+    return (after - before) / count
+
+
+def make_app(
+    http_handler: Type[HttpHandler],
+    ws_handler: Type[WebSocketHandler]
+) -> StormApp:
+    router = Router()
+    router.add_handler(http_handler, "/poll/<channel_id>")
+    router.add_handler(ws_handler, "/chat/<room_id>")
+    return StormApp(router, {})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for title, app in (
+        ("regular", make_app(LongPollHandler, ChatSocketHandler)),
+        ("slotted", make_app(SlottedLongPollHandler, SlottedChatSocketHandler))
+    ):
+        request_bytes = measure(app, "http", "/poll", args.requests)
+        websocket_bytes = measure(app, "websocket", "/chat", args.requests)
+        print(
+            f"{title:>8}: {request_bytes:>7.0f} bytes per request, "
+            f"{websocket_bytes:>7.0f} bytes per websocket"
+        )
+
+
+if __name__ == "__main__":
+    main()
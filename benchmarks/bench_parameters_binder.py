@@ -0,0 +1,139 @@
+"""
+Compares binding request parameters of handler with ten typed parameters
+by generated binder and by loops over parameters properties, the way
+it was done before binders were generated.
+
+Run as script: python -m benchmarks.bench_parameters_binder
+"""
+import argparse
+import time
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from storm.request.handlers import HttpHandler
+from storm.request.handlers.utils import MatchedArguments
+from storm.request.parameters import (
+    CookieParameter,
+    QueryParameter,
+    URLParameter
+)
+from .bench_routing_dispatch import make_scope
+
+
+class TenParametersHandler(HttpHandler):
+    page: QueryParameter[int]
+    per_page: QueryParameter[Optional[int]] = 20
+    search: QueryParameter[Optional[str]] = None
+    ratio: QueryParameter[float]
+    session: CookieParameter[str]
+    theme: CookieParameter[Optional[str]] = "light"
+    visits: CookieParameter[int]
+    user_id: URLParameter[int]
+    item_uuid: URLParameter[UUID]
+    slug: URLParameter[str]
+
+
+def bind_with_loops(handler: HttpHandler) -> None:
+    query_parameters: dict[str, list[str]] = \
+        handler.query_parameters.select(handler._query_parameters_properties)
+
+    for attr_key, attr_properties in \
+            handler._query_parameters_properties.items():
+        try:
+            attr_value: Any = attr_properties.casted_to_type(
+                query_parameters[attr_key][-1]
+            )
+
+        except KeyError:
+            if not attr_properties.is_optional:
+                raise
+
+            attr_value = attr_properties.default_value
+
+        setattr(handler, attr_key, attr_value)
+
+    for attr_key, attr_properties in handler._cookies_properties.items():
+        try:
+            attr_value = attr_properties.casted_to_type(
+                handler.cookies[attr_key]
+            )
+
+        except KeyError:
+            if not attr_properties.is_optional:
+                raise
+
+            attr_value = attr_properties.default_value
+
+        setattr(handler, attr_key, attr_value)
+
+    for attr_key, attr_properties in \
+            handler._url_parameters_properties.items():
+        try:
+            attr_value = attr_properties.casted_to_type(
+                handler._parsed_arguments.group(attr_key)
+            )
+
+        except IndexError as err:
+            raise KeyError(attr_key) from err
+
+        setattr(handler, attr_key, attr_value)
+
+
+def bind_with_binder(handler: HttpHandler) -> None:
+    handler._bind_parameters()
+
+
+def make_handlers(count: int) -> list[TenParametersHandler]:
+    scope = make_scope(
+        "/users/42/items/6f1c7c5e-8e4b-4a8e-9d0b-1b2c3d4e5f60/some-slug"
+    )
+    scope.query_string = b"page=3&ratio=0.5&utm_source=mail&search=storm"
+    scope.headers = [
+        (b"host", b"localhost"),
+        (b"cookie", b"_ga=GA1.2.3; session=abcdef; visits=12"),
+    ]
+    arguments = MatchedArguments(
+        user_id="42",
+        item_uuid="6f1c7c5e-8e4b-4a8e-9d0b-1b2c3d4e5f60",
+        slug="some-slug"
+    )
+    return [
+        TenParametersHandler(None, scope, None, arguments)  # type: ignore
+        for _ in range(count)
+    ]
+
+
+def measure(bind: Callable[[HttpHandler], None], count: int) -> float:
+    """
+    Measures binding of parameters to fresh handlers.
+
+    :param bind: function that binds parameters.
+    :param count: how many handlers to bind.
+    :return: ns per handler.
+    """
+    handlers = make_handlers(count)
+    started_at = time.perf_counter_ns()
+    for handler in handlers:
+        bind(handler)
+
+    return (time.perf_counter_ns() - started_at) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--handlers", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Warming up
+    measure(bind_with_loops, 1000)
+    measure(bind_with_binder, 1000)
+
+    loops_ns = measure(bind_with_loops, args.handlers)
+    binder_ns = measure(bind_with_binder, args.handlers)
+    print(f"   loops: {loops_ns:>8.0f} ns per handler")
+    print(f"  binder: {binder_ns:>8.0f} ns per handler")
+    print(f"  binder is {loops_ns / binder_ns:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Measures how fast routers find handlers in synthetic route tables of
+different sizes, with Zipf-skewed, uniform and all-miss request paths.
+Reports ns per lookup, allocated memory blocks per lookup and p99 latency.
+
+Run as script:
+    python -m benchmarks.bench_router_lookup --save baseline.json
+    python -m benchmarks.bench_router_lookup --compare baseline.json
+
+Or with pytest-benchmark:
+    pytest benchmarks/bench_router_lookup.py
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Optional, Type
+
+from storm.routing import (
+    CompiledRegexRouter,
+    HandlerNotFound,
+    RadixRouter,
+    Router
+)
+from .route_tables import make_paths, make_router, make_routes
+
+try:
+    import pytest
+
+except ImportError:
+    pytest = None
+
+ROUTERS: dict[str, Type[Router]] = {
+    "router": Router,
+    "radix": RadixRouter,
+    "compiled": CompiledRegexRouter,
+}
+SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000)
+DISTRIBUTIONS: tuple[str, ...] = ("zipf", "uniform", "miss")
+
+
+def lookup_all(router: Router, scopes: list[SimpleNamespace]) -> None:
+    find_http_handler = router.find_http_handler
+    for scope in scopes:
+        try:
+            find_http_handler(scope)
+
+        except HandlerNotFound:
+            pass
+
+
+def measure(
+    router: Router, scopes: list[SimpleNamespace], rounds: int
+) -> dict[str, float]:
+    """
+    Measures lookups of all scopes.
+
+    :param router: router to measure.
+    :param scopes: scopes to look up.
+    :param rounds: how many times all scopes are looked up.
+    :return: ns per lookup, allocated blocks per lookup and p99 in ns.
+    """
+    lookup_all(router, scopes)
+    gc.collect()
+    gc.disable()
+    try:
+        started_at = time.perf_counter_ns()
+        for _ in range(rounds):
+            lookup_all(router, scopes)
+
+        total_ns = time.perf_counter_ns() - started_at
+
+        # Found handlers are kept alive, so their blocks are counted
+        found: list[Any] = []
+        blocks_before = sys.getallocatedblocks()
+        for scope in scopes:
+            try:
+                found.append(router.find_http_handler(scope))
+
+            except HandlerNotFound:
+                found.append(None)
+
+        allocated_blocks = sys.getallocatedblocks() - blocks_before
+
+        latencies: list[int] = []
+        find_http_handler = router.find_http_handler
+        timer = time.perf_counter_ns
+        for scope in scopes:
+            started_at = timer()
+            try:
+                find_http_handler(scope)
+
+            except HandlerNotFound:
+                pass
+
+            latencies.append(timer() - started_at)
+
+    finally:
+        gc.enable()
+
+    latencies.sort()
+    return {
+        "ns_per_lookup": total_ns / (rounds * len(scopes)),
+        "blocks_per_lookup": max(allocated_blocks, 0) / len(scopes),
+        "p99_ns": float(latencies[int(len(latencies) * 0.99) - 1]),
+    }
+
+
+def run(
+    routers: list[str],
+    sizes: list[int],
+    distributions: list[str],
+    lookups: int,
+    rounds: int,
+    match_cache_size: int
+) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for size in sizes:
+        routes = make_routes(size)
+        for router_name in routers:
+            router = make_router(
+                ROUTERS[router_name], routes, match_cache_size
+            )
+            for distribution in distributions:
+                scopes = [
+                    SimpleNamespace(path=path)
+                    for path in make_paths(routes, distribution, lookups)
+                ]
+                results[f"{router_name}/{size}/{distribution}"] = measure(
+                    router, scopes, rounds
+                )
+
+    return results
+
+
+def print_results(
+    results: dict[str, dict[str, float]],
+    baseline: Optional[dict[str, dict[str, float]]] = None
+) -> None:
+    print(
+        f"{'case':<28}{'ns/lookup':>12}{'blocks/lookup':>15}"
+        f"{'p99 ns':>10}{'vs baseline':>14}"
+    )
+    for case, result in results.items():
+        comparison = ""
+        if baseline is not None and case in baseline:
+            ratio = result["ns_per_lookup"] / baseline[case]["ns_per_lookup"]
+            comparison = f"{ratio:>13.2f}x"
+
+        print(
+            f"{case:<28}{result['ns_per_lookup']:>12.0f}"
+            f"{result['blocks_per_lookup']:>15.2f}"
+            f"{result['p99_ns']:>10.0f}{comparison}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--routers", nargs="+", choices=list(ROUTERS), default=list(ROUTERS)
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument(
+        "--distributions", nargs="+", choices=DISTRIBUTIONS,
+        default=list(DISTRIBUTIONS)
+    )
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--match-cache-size", type=int, default=1024,
+        help="size of routers match cache, 0 disables it"
+    )
+    parser.add_argument("--save", help="save results as baseline to file")
+    parser.add_argument("--compare", help="compare with baseline from file")
+    args = parser.parse_args()
+
+    results = run(
+        args.routers, args.sizes, args.distributions,
+        args.lookups, args.rounds, args.match_cache_size
+    )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+
+
+if pytest is not None:
+    @pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+    @pytest.mark.parametrize("size", SIZES)
+    @pytest.mark.parametrize("router_name", list(ROUTERS))
+    def test_router_lookup(
+        benchmark: Any, router_name: str, size: int, distribution: str
+    ) -> None:
+        routes = make_routes(size)
+        router = make_router(ROUTERS[router_name], routes)
+        scopes = [
+            SimpleNamespace(path=path)
+            for path in make_paths(routes, distribution, 1_000)
+        ]
+        benchmark(lookup_all, router, scopes)
+
+
+if __name__ == "__main__":
+    main()
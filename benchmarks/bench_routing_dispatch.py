@@ -0,0 +1,109 @@
+"""
+Compares requests per second that app handles when routing is done
+inline on event loop and when it's done in routing executor.
+
+Run as script: python -m benchmarks.bench_routing_dispatch
+"""
+import argparse
+import asyncio
+import time
+
+from storm.app import StormApp
+from storm.headers import Headers
+from storm.internal_types import CustomCookie
+from storm.internal_types.asgi import HttpASGIConnectionScope
+from storm.request.handlers import HttpHandler
+from storm.request.parameters import URLParameter
+from storm.responses import BaseHttpResponse
+from storm.responses.http import ResponseBody
+from storm.routing import Router, RoutingDispatch
+
+
+class PlainResponse(BaseHttpResponse):
+    def __init__(self, body: bytes):
+        self.status = 200
+        self.headers = Headers()
+        self.cookies = CustomCookie()
+        self.body = body
+
+    async def get_body(self) -> ResponseBody:
+        return ResponseBody(self.body)
+
+
+class ItemHandler(HttpHandler):
+    item_id: URLParameter[int]
+
+    async def get(self) -> BaseHttpResponse:
+        return PlainResponse(b"item")
+
+
+def make_router(routes_count: int) -> Router:
+    router = Router()
+    for index in range(routes_count):
+        handler = type(f"ItemHandler{index}", (ItemHandler,), {})
+        router.add_handler(handler, f"/api/section{index}/items/<item_id>")
+
+    return router
+
+
+def make_scope(path: str) -> HttpASGIConnectionScope:
+    return HttpASGIConnectionScope(
+        type="http",
+        asgi={"version": "3.0", "spec_version": "2.1"},
+        extensions={},
+        http_version="1.1",
+        method="GET",
+        scheme="http",
+        path=path,
+        root_path="",
+        raw_path=None,
+        query_string=b"",
+        headers=[(b"host", b"localhost")],
+        client=("127.0.0.1", 50000),
+        server=("127.0.0.1", 8000),
+    )
+
+
+async def receive() -> dict:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: dict) -> None:
+    pass
+
+
+async def measure(
+    app: StormApp, scope: HttpASGIConnectionScope, requests_count: int
+) -> float:
+    # Warming up executor and caches
+    for _ in range(100):
+        await app.http_asgi_app(scope, receive, send)
+
+    started_at = time.perf_counter()
+    for _ in range(requests_count):
+        await app.http_asgi_app(scope, receive, send)
+
+    return requests_count / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--routes", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    scope = make_scope(f"/api/section{args.routes // 2}/items/42")
+    for dispatch in (RoutingDispatch.inline, RoutingDispatch.executor):
+        app = StormApp(
+            make_router(args.routes), {}, routing_dispatch=dispatch
+        )
+        requests_per_second = asyncio.run(
+            measure(app, scope, args.requests)
+        )
+        print(
+            f"{dispatch.value:>10}: {requests_per_second:12.0f} requests/sec"
+        )
+
+
+if __name__ == "__main__":
+    main()
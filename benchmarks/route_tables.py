@@ -0,0 +1,177 @@
+"""
+Synthetic route tables and request paths for routing benchmarks.
+"""
+import random
+from datetime import datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, NamedTuple, Type
+from uuid import UUID
+
+from storm.request.handlers import HttpHandler
+from storm.request.parameters import URLParameter
+from storm.routing import Router
+
+
+class StaticHandler(HttpHandler):
+    pass
+
+
+class IntHandler(HttpHandler):
+    item_id: URLParameter[int]
+
+
+class UUIDHandler(HttpHandler):
+    item_uuid: URLParameter[UUID]
+
+
+class PathHandler(HttpHandler):
+    file_path: URLParameter[Path]
+
+
+class DatetimeHandler(HttpHandler):
+    moment: URLParameter[datetime]
+
+
+class Route(NamedTuple):
+    url: str
+    make_path: Callable[[random.Random], str]
+
+
+def make_moment(generator: random.Random) -> str:
+    moment = datetime(2021, 1, 1) + timedelta(
+        minutes=generator.randrange(10 ** 5)
+    )
+    return moment.isoformat()
+
+
+def make_routes(routes_count: int, seed: int = 0) -> list[Route]:
+    """
+    Makes routes, where half are static and the rest have
+    int, UUID, Path and datetime url parameters.
+
+    :param routes_count: how many routes to make.
+    :param seed: seed of random generator.
+    :return: list of routes with functions that make paths matching them.
+    """
+    generator = random.Random(seed)
+    routes: list[Route] = []
+
+    for index in range(routes_count):
+        section = f"/api/v{index % 3 + 1}/section{index}"
+        kind = index % 8
+
+        if kind < 4:
+            url = f"{section}/items"
+            routes.append(Route(url, lambda _, url=url: url))
+
+        elif kind == 4:
+            routes.append(Route(
+                f"{section}/items/<item_id>",
+                lambda rnd, s=section: f"{s}/items/{rnd.randrange(10 ** 6)}"
+            ))
+
+        elif kind == 5:
+            routes.append(Route(
+                f"{section}/objects/<item_uuid>",
+                lambda rnd, s=section: (
+                    f"{s}/objects/{UUID(int=rnd.getrandbits(128), version=4)}"
+                )
+            ))
+
+        elif kind == 6:
+            routes.append(Route(
+                f"{section}/files/<file_path>",
+                lambda rnd, s=section: (
+                    f"{s}/files/dir{rnd.randrange(100)}/"
+                    f"file{rnd.randrange(1000)}.txt"
+                )
+            ))
+
+        else:
+            routes.append(Route(
+                f"{section}/history/<moment>",
+                lambda rnd, s=section: f"{s}/history/{make_moment(rnd)}"
+            ))
+
+    generator.shuffle(routes)
+    return routes
+
+
+def get_handler_for_url(url: str) -> Type[HttpHandler]:
+    if "<item_id>" in url:
+        return IntHandler
+
+    elif "<item_uuid>" in url:
+        return UUIDHandler
+
+    elif "<file_path>" in url:
+        return PathHandler
+
+    elif "<moment>" in url:
+        return DatetimeHandler
+
+    return StaticHandler
+
+
+def make_router(
+    router_type: Type[Router],
+    routes: list[Route],
+    match_cache_size: int = 1024
+) -> Router:
+    """
+    Makes router of given type that knows all routes.
+
+    :param router_type: Router or its subclass.
+    :param routes: routes to add.
+    :param match_cache_size: size of routers match cache.
+    :return: ordered router.
+    """
+    router = router_type(match_cache_size)
+    for route in routes:
+        router.add_handler(get_handler_for_url(route.url), route.url)
+
+    router.order_routes()
+    return router
+
+
+def make_paths(
+    routes: list[Route],
+    distribution: str,
+    paths_count: int,
+    seed: int = 1
+) -> list[str]:
+    """
+    Makes requested paths.
+
+    :param routes: routes that are known to router.
+    :param distribution: "zipf" - few routes get most of requests,
+        "uniform" - every route is requested equally,
+        "miss" - none of paths match any route.
+    :param paths_count: how many paths to make.
+    :param seed: seed of random generator.
+    :return: list of paths.
+    """
+    generator = random.Random(seed)
+
+    if distribution == "miss":
+        return [
+            f"/wp-admin/{generator.randrange(10 ** 6)}/setup.php"
+            for _ in range(paths_count)
+        ]
+
+    if distribution == "uniform":
+        chosen_routes = generator.choices(routes, k=paths_count)
+
+    elif distribution == "zipf":
+        cumulative_weights = list(
+            accumulate(1 / rank for rank in range(1, len(routes) + 1))
+        )
+        chosen_routes = generator.choices(
+            routes, cum_weights=cumulative_weights, k=paths_count
+        )
+
+    else:
+        raise ValueError(f"Unknown distribution {distribution}")
+
+    return [route.make_path(generator) for route in chosen_routes]
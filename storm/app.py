@@ -1,9 +1,11 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, Executor
-from typing import Generic, TypeVar, Mapping, Optional, Type
+from typing import Callable, Generic, TypeVar, Mapping, Optional, Type
 
 from storm.internal_types.asgi import (
+    ASGI_SUPPORTED_TYPES,
     ASGIApp,
+    ASGIConnectionScope,
     HttpASGIConnectionScope,
     LifetimeASGIScope,
     WebSocketASGIConnectionScope,
@@ -11,24 +13,60 @@ from storm.internal_types.asgi import (
     receive_typehint,
     lifespan_events
 )
+from storm.i18n import Translations
 from storm.loggers import events_logger
 from storm.request.handlers import HttpHandler, WebSocketHandler
 from storm.responses.http.http_errors import InternalServerError
 from .internal_types.asgi import events
 from .responses import BaseHttpResponse
-from .routing import Router, HandlerNotFound, MatchedHandler
+from .routing import (
+    Router,
+    HandlerNotFound,
+    MatchedHandler,
+    RoutingDispatch
+)
+from .routing.rule import HandlerType
 
 ConfigType = TypeVar("ConfigType", bound=Mapping)
 
+# Type of messages with parts of response body
+HTTP_RESPONSE_BODY: str = events.HttpResponseBody.type
+HTTP_DISCONNECT: str = events.HttpDisconnect.type
+
+# Messages of response to requests that no handler is found for. They are
+# assembled once, so unmatched requests are rejected without making any
+# response objects.
+NOT_FOUND_RESPONSE_START: ASGI_SUPPORTED_TYPES = events.HttpResponseStart(
+    404,
+    [
+        (b"content-type", b"text/plain; charset=utf-8"),
+        (b"content-length", b"9")
+    ]
+).to_dict()
+NOT_FOUND_RESPONSE_BODY: ASGI_SUPPORTED_TYPES = events.HttpResponseBody(
+    b"Not found"
+).to_dict()
+EMPTY_RESPONSE_BODY: ASGI_SUPPORTED_TYPES = events.HttpResponseBody().to_dict()
+# Closing websocket before accepting it makes server reject handshake
+WEBSOCKET_NOT_FOUND_CLOSE: ASGI_SUPPORTED_TYPES = {
+    "type": "websocket.close",
+    "code": 1000
+}
+WEBSOCKET_INTERNAL_ERROR_CLOSE: ASGI_SUPPORTED_TYPES = {
+    "type": "websocket.close",
+    "code": 1011
+}
+
 
 class StormApp(ASGIApp, Generic[ConfigType]):
     def __init__(
         self,
         router: Router,
         config: ConfigType,
-        routing_executor: Executor = ThreadPoolExecutor(
-            thread_name_prefix="routing_"
-        ),
+        routing_executor: Optional[Executor] = None,
+        routing_dispatch: RoutingDispatch = RoutingDispatch.auto,
+        import_handlers_on_startup: bool = False,
+        translations: Optional[Translations] = None,
         debug: bool = __debug__,
         name: str = "Storm App",
         host: str = "localhost",
@@ -38,10 +76,68 @@ class StormApp(ASGIApp, Generic[ConfigType]):
         self.host = host
         self.config: ConfigType = config
         self.router = router
-        self.routing_executor: Executor = routing_executor
+        self.routing_dispatch: RoutingDispatch = routing_dispatch
+        # Imports handlers, that were given to router by path, when
+        # app starts, so workers are warmed up before first requests
+        self.import_handlers_on_startup: bool = import_handlers_on_startup
+        # Gettext catalogs, that are loaded once per worker on startup
+        self.translations: Optional[Translations] = translations
+        self._routing_executor: Optional[Executor] = routing_executor
+        self._owns_routing_executor: bool = False
 
         self.router.order_routes()
 
+    @property
+    def routing_executor(self) -> Executor:
+        """
+        Executor that is used for routing when lookups
+        must not run on event loop. Created on first use if
+        none was given to app.
+
+        :return: executor instance.
+        """
+        if self._routing_executor is None:
+            self._routing_executor = ThreadPoolExecutor(
+                thread_name_prefix="routing_"
+            )
+            self._owns_routing_executor = True
+
+        return self._routing_executor
+
+    @property
+    def is_routing_inline(self) -> bool:
+        """
+        Tells if handlers are looked up right on event loop.
+
+        :return: is routing done without executor.
+        """
+        if self.routing_dispatch is RoutingDispatch.auto:
+            return not self.router.is_expensive
+
+        return self.routing_dispatch is RoutingDispatch.inline
+
+    async def find_handler(
+        self,
+        find_handler: Callable[..., MatchedHandler[HandlerType]],
+        scope: ASGIConnectionScope
+    ) -> MatchedHandler[HandlerType]:
+        """
+        Runs routers lookup according to apps routing dispatch mode.
+
+        :param find_handler: routers method that looks for handler.
+        :param scope: prefetched data.
+        :return: MatchedHandler instance.
+        :raises HandlerNotFound: if router doesn't know handler for scope.
+        """
+        if self.is_routing_inline:
+            return find_handler(scope)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.routing_executor,
+            find_handler,
+            scope
+        )
+
     async def http_asgi_app(
         self,
         scope: HttpASGIConnectionScope,
@@ -59,18 +155,27 @@ class StormApp(ASGIApp, Generic[ConfigType]):
         try:
             matched_handler: MatchedHandler[
                 Type[HttpHandler]
-            ] = await asyncio.get_running_loop(
-                ).run_in_executor(
-                    self.routing_executor,
-                    self.router.find_http_handler,
-                    scope
-                )
+            ] = await self.find_handler(self.router.find_http_handler, scope)
 
         except HandlerNotFound:
-            # TODO: return not found default response
+            await self.send_not_found(send, send_body=scope.method != "HEAD")
+            return
+
+        try:
+            handler: Type[HttpHandler] = matched_handler.handler
+
+        # Handler given to router by path failed to import
+        except Exception as err:
+            events_logger.error(
+                f"Failed to import http handler for {scope.path}",
+                exc_info=err
+            )
+            await self.send_http_response(
+                send, InternalServerError(),
+                send_body=scope.method != "HEAD"
+            )
             return
 
-        handler: Type[HttpHandler] = matched_handler.handler
         handler_instance: HttpHandler = handler(
             self, scope, receive, matched_handler.arguments
         )
@@ -80,7 +185,10 @@ class StormApp(ASGIApp, Generic[ConfigType]):
         )
 
         try:
-            await self.send_http_response(send, response)
+            await self.send_http_response(
+                send, response, send_body=scope.method != "HEAD",
+                receive=receive
+            )
 
         except Exception as err:
             events_logger.error(
@@ -100,6 +208,9 @@ class StormApp(ASGIApp, Generic[ConfigType]):
             if self.debug:
                 raise
 
+        finally:
+            handler_instance.close_body()
+
     async def websocket_asgi_app(
         self,
         scope: WebSocketASGIConnectionScope,
@@ -118,18 +229,24 @@ class StormApp(ASGIApp, Generic[ConfigType]):
         try:
             matched_handler: MatchedHandler[
                 Type[WebSocketHandler]
-            ] = await asyncio.get_running_loop(
-            ).run_in_executor(
-                self.routing_executor,
-                self.router.find_ws_handler,
-                scope
-            )
+            ] = await self.find_handler(self.router.find_ws_handler, scope)
 
         except HandlerNotFound:
-            # TODO: return not found default response
+            await send(WEBSOCKET_NOT_FOUND_CLOSE)
+            return
+
+        try:
+            handler: Type[WebSocketHandler] = matched_handler.handler
+
+        # Handler given to router by path failed to import
+        except Exception as err:
+            events_logger.error(
+                f"Failed to import websocket handler for {scope.path}",
+                exc_info=err
+            )
+            await send(WEBSOCKET_INTERNAL_ERROR_CLOSE)
             return
 
-        handler: Type[WebSocketHandler] = matched_handler.handler
         handler_instance: WebSocketHandler = handler(
             self, scope, receive, matched_handler.arguments
         )
@@ -141,50 +258,66 @@ class StormApp(ASGIApp, Generic[ConfigType]):
         receive: receive_typehint,
         send: send_typehint
     ):
-        try:
-            event = lifespan_events.dispatch_incoming_lifetime_event(
-                scope.type
-            )
-
-        except KeyError as err:
-            raise KeyError(
-                f"Unknown event type of lifetime events: {scope.type}"
-            ) from err
-
-        if isinstance(event, lifespan_events.Startup):
+        while True:
+            message: dict = await receive()  # type: ignore
             try:
-                events_logger.info("Server started")
-                await self.on_start()
-
-            except Exception as err:
-                events_logger.error("Server failed to start", exc_info=err)
-                await send(
-                    lifespan_events.StartupFailed(
-                        message=str(err)
-                    ).emit_startup_failed()
+                event = lifespan_events.dispatch_incoming_lifetime_event(
+                    message["type"]
                 )
 
-            else:
-                await send(
-                    lifespan_events.StartupComplete().emit_startup_finished()
-                )
+            except KeyError as err:
+                raise KeyError(
+                    f"Unknown event type of lifetime events: {message}"
+                ) from err
 
-        else:
-            try:
-                await self.on_shutdown()
-
-            except Exception as err:
-                events_logger.error("Server failed to shut down", exc_info=err)
-                await send(
-                    lifespan_events.ShutdownFailed(
-                        message=str(err)
-                    ).emit_server_shutdown_failure()
-                )
+            if isinstance(event, lifespan_events.Startup):
+                try:
+                    events_logger.info("Server started")
+                    if self.import_handlers_on_startup:
+                        self.router.import_lazy_handlers()
+
+                    if self.translations is not None:
+                        self.translations.load()
+
+                    await self.on_start()
+
+                except Exception as err:
+                    events_logger.error("Server failed to start", exc_info=err)
+                    await send(
+                        lifespan_events.StartupFailed(
+                            message=str(err)
+                        ).emit_startup_failed()
+                    )
+
+                else:
+                    await send(
+                        lifespan_events.StartupComplete(
+                        ).emit_startup_finished()
+                    )
 
             else:
-                await send(
-                    lifespan_events.ShutdownComplete.emit_shutdown_complete()
-                )
+                try:
+                    await self.on_shutdown()
+                    if self._owns_routing_executor:
+                        self.routing_executor.shutdown(wait=False)
+
+                except Exception as err:
+                    events_logger.error(
+                        "Server failed to shut down", exc_info=err
+                    )
+                    await send(
+                        lifespan_events.ShutdownFailed(
+                            message=str(err)
+                        ).emit_server_shutdown_failure()
+                    )
+
+                else:
+                    await send(
+                        lifespan_events.ShutdownComplete
+                        .emit_shutdown_complete()
+                    )
+
+                return
 
     async def on_start(self) -> None:
         """
@@ -233,20 +366,128 @@ class StormApp(ASGIApp, Generic[ConfigType]):
 
         return response
 
+    @staticmethod
+    async def send_not_found(
+        send: send_typehint,
+        send_body: bool = True
+    ) -> None:
+        """
+        Sends prebuilt response for requests that no handler is found for.
+
+        :param send: method for sending response.
+        :param send_body: if set to False, body is sent empty
+            (used for HEAD requests).
+        :return: nothing.
+        """
+        await send(NOT_FOUND_RESPONSE_START)
+        await send(
+            NOT_FOUND_RESPONSE_BODY if send_body else EMPTY_RESPONSE_BODY
+        )
+
     @staticmethod
     async def send_http_response(
         send: send_typehint,
-        response: BaseHttpResponse
+        response: BaseHttpResponse,
+        send_body: bool = True,
+        receive: Optional[receive_typehint] = None
     ) -> None:
-        await send(response.response_start().to_dict())
-        response_body = await response.get_body()
+        """
+        Sends response to ASGI server. Next part of body is requested only
+        after previous one was sent. Streaming responses are stopped if
+        receive is given and client disconnects, or if server can't send
+        to client anymore.
 
-        while True:
-            response_body_event = events.HttpResponseBody(
-                response_body.body,
-                more_body=response_body.more_body
+        :param send: method for sending response.
+        :param response: response instance.
+        :param send_body: if set to False, only headers are sent and
+            responses body is never requested (used for HEAD requests).
+        :param receive: method for receiving messages from client, which
+            is used to know when client disconnects.
+        :return: nothing.
+        """
+        try:
+            await send(response.response_start())
+            if not send_body:
+                await send(EMPTY_RESPONSE_BODY)
+                return
+
+            if not response.is_streaming or receive is None:
+                await StormApp.send_http_body(send, response)
+                return
+
+            sending = asyncio.ensure_future(
+                StormApp.send_http_body(send, response)
+            )
+            disconnect = asyncio.ensure_future(
+                StormApp.wait_for_disconnect(receive)
+            )
+            try:
+                await asyncio.wait(
+                    (sending, disconnect),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+            finally:
+                disconnect.cancel()
+                if not sending.done():
+                    sending.cancel()
+                    events_logger.debug(
+                        "Client disconnected before response was streamed"
+                    )
+
+                await asyncio.gather(
+                    sending, disconnect, return_exceptions=True
+                )
+
+            if not sending.cancelled():
+                # Raises errors of response
+                sending.result()
+
+        except OSError as err:
+            if not response.is_streaming:
+                raise
+
+            events_logger.debug(
+                "Client disconnected before response was streamed",
+                exc_info=err
             )
-            await send(response_body_event.to_dict())
 
-            if not response_body_event.more_body:
+        finally:
+            await response.close()
+
+    @staticmethod
+    async def send_http_body(
+        send: send_typehint,
+        response: BaseHttpResponse
+    ) -> None:
+        """
+        Sends parts of body until response has no more of them.
+
+        :param send: method for sending response.
+        :param response: response instance.
+        :return: nothing.
+        """
+        while True:
+            response_body = await response.get_body()
+            await send({
+                "type": HTTP_RESPONSE_BODY,
+                "body": response_body.body,
+                "more_body": response_body.more_body
+            })
+
+            if not response_body.more_body:
                 break
+
+    @staticmethod
+    async def wait_for_disconnect(receive: receive_typehint) -> None:
+        """
+        Receives messages from client until it disconnects. Parts of
+        request body, which handler didn't read, are dropped.
+
+        :param receive: method for receiving messages from client.
+        :return: nothing.
+        """
+        while True:
+            message = await receive()
+            if message["type"] == HTTP_DISCONNECT:
+                return
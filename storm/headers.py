@@ -1,7 +1,36 @@
+from __future__ import annotations
+
 from string import printable
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+printable_bytes: bytes = printable.encode("ascii")
+
+
+def is_bytes_printable(raw: bytes) -> bool:
+    """
+    Checks if bytes are ascii printable characters in single pass.
+
+    :param raw: some bytes.
+    :return: is raw fully of printable ascii characters or not.
+    """
+    return not raw.translate(None, printable_bytes)
 
 
 class Headers(dict):
+    """
+    Headers of response. Encoded headers are cached and encoded again only
+    after headers are changed, so response that is sent many times encodes
+    its headers once. Changes must be made through methods of Headers,
+    since appending to lists of values directly isn't noticed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Incremented on every change, to know when cache is outdated
+        self._version: int = 0
+        self._encoded: Optional[list[tuple[bytes, bytes]]] = None
+        self._encoded_version: int = -1
+
     @staticmethod
     def is_string_printable(string: str) -> bool:
         """
@@ -31,11 +60,36 @@ class Headers(dict):
             " (headers must only contain ascii chars that are printable)."
         )
         lowered_key = key.lower()
+        self._version += 1
         if lowered_key in self.keys():
             self[lowered_key].append(value)
 
         else:
-            super().__setattr__(lowered_key, [value])
+            super().__setitem__(lowered_key, [value])
+
+    def __delitem__(self, key: str) -> None:
+        self._version += 1
+        super().__delitem__(key.lower())
+
+    def clear(self) -> None:
+        self._version += 1
+        super().clear()
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self._version += 1
+        return super().pop(key.lower(), *default)
+
+    def popitem(self) -> tuple[str, list[str]]:
+        self._version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._version += 1
+        return super().setdefault(key.lower(), default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._version += 1
+        super().update(*args, **kwargs)
 
     def __getitem__(self, item: str) -> list[str]:
         return super().__getitem__(item.lower())
@@ -43,10 +97,23 @@ class Headers(dict):
     def to_list(self) -> list[tuple[bytes, bytes]]:
         """
         This method encodes headers to how they must be
-        given to ASGI server.
-        :return: a tuple of tuples with headers key and value,
+        given to ASGI server. Headers are encoded again only if they
+        were changed since previous call.
+        :return: new list of tuples with headers key and value,
         all encoded in utf-8.
         """
+        if self._encoded is None or self._encoded_version != self._version:
+            self._encoded = self._encode()
+            self._encoded_version = self._version
+
+        return list(self._encoded)
+
+    def _encode(self) -> list[tuple[bytes, bytes]]:
+        """
+        Encodes headers.
+        :return: list of tuples with headers key and value.
+        :raises ValueError: if some headers value isn't list.
+        """
         headers_list: list[tuple[bytes, bytes]] = []
         for key, value in self.items():
             if isinstance(value, list):
@@ -64,3 +131,91 @@ class Headers(dict):
                 )
 
         return headers_list
+
+
+class RequestHeaders(Mapping[str, list[str]]):
+    """
+    Read only headers of request, that are built on top of raw headers
+    from ASGI scope. Headers are decoded and indexed by lower cased names
+    only when they are accessed for the first time, so requests which
+    headers are never read don't pay for them.
+    """
+    __slots__ = ("_raw_headers", "_index")
+
+    def __init__(self, raw_headers: Iterable[tuple[bytes, bytes]]):
+        self._raw_headers: Iterable[tuple[bytes, bytes]] = raw_headers
+        self._index: Optional[dict[str, list[str]]] = None
+
+    @property
+    def raw(self) -> Iterable[tuple[bytes, bytes]]:
+        """
+        Gives headers the way they were received from ASGI server.
+
+        :return: iterable of headers names and values.
+        """
+        return self._raw_headers
+
+    def get_first(
+        self,
+        key: str,
+        default: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Gives first value of header.
+
+        :param key: header name in any case.
+        :param default: value returned if there's no such header.
+        :return: headers value or default.
+        """
+        values: Optional[list[str]] = self._get_index().get(key.lower())
+        if not values:
+            return default
+
+        return values[0]
+
+    def _get_index(self) -> dict[str, list[str]]:
+        """
+        Decodes headers and indexes them by lower cased names once.
+
+        :return: dictionary of headers values lists.
+        :raises AssertionError: raised when some header contains
+            unprintable characters. Works only when run without -O flag.
+        """
+        if self._index is not None:
+            return self._index
+
+        index: dict[str, list[str]] = {}
+        for raw_key, raw_value in self._raw_headers:
+            assert (
+                is_bytes_printable(raw_key) and
+                is_bytes_printable(raw_value)
+            ), (
+                "Headers key or value containing not printable characters"
+                " (headers must only contain ascii chars that are printable)."
+            )
+            key: str = raw_key.decode("latin-1").lower()
+            value: str = raw_value.decode("latin-1")
+
+            try:
+                index[key].append(value)
+
+            except KeyError:
+                index[key] = [value]
+
+        self._index = index
+        return index
+
+    def __getitem__(self, key: str) -> list[str]:
+        return self._get_index()[key.lower()]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.lower() in self._get_index()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_index())
+
+    def __len__(self) -> int:
+        return len(self._get_index())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._get_index()!r})"
@@ -0,0 +1,6 @@
+from .accept_language import (
+    LocaleNegotiator,
+    normalize_locale,
+    parse_accept_language
+)
+from .catalogs import TranslationCatalog, Translations
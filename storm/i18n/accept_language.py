@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from storm.internal_types import LocaleProbability
+
+
+def normalize_locale(locale: str) -> str:
+    """
+    Turns language tag like "en-us" into locale name like "en_US",
+    which gettext catalogs are named by.
+
+    :param locale: language tag or locale name.
+    :return: locale name.
+    """
+    language, _, region = locale.strip().replace("-", "_").partition("_")
+    if not region:
+        return language.lower()
+
+    return f"{language.lower()}_{region.upper()}"
+
+
+def get_language(locale: str) -> str:
+    """
+    Gives language of locale.
+
+    :param locale: locale name like "en_US".
+    :return: language like "en".
+    """
+    return locale.partition("_")[0]
+
+
+@lru_cache(maxsize=256)
+def parse_accept_language(
+    accept_language: str
+) -> tuple[LocaleProbability, ...]:
+    """
+    Parses Accept-Language header. Results are cached, since clients send
+    the same header with every request. Locales that have zero or invalid
+    weight aren't acceptable and are left out.
+
+    :param accept_language: value of Accept-Language header.
+    :return: locales sorted by weight from the highest, locales with equal
+        weight are kept in order they were given.
+    """
+    locales: list[LocaleProbability] = []
+    for language in accept_language.split(","):
+        locale, *parameters = language.split(";")
+        locale = locale.strip()
+        if not locale:
+            continue
+
+        weight: float = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() != "q":
+                continue
+
+            try:
+                weight = min(float(value), 1.0)
+
+            except ValueError:
+                weight = 0.0
+
+        if weight > 0:
+            locales.append(LocaleProbability(
+                locale if locale == "*" else normalize_locale(locale),
+                weight
+            ))
+
+    locales.sort(key=lambda locale_probability: -locale_probability.weight)
+    return tuple(locales)
+
+
+class LocaleNegotiator:
+    """
+    Chooses locale of response from locales that app supports by
+    Accept-Language header. Choice for every header is remembered
+    in LRU cache.
+    """
+
+    def __init__(
+        self,
+        supported_locales: Iterable[str],
+        default_locale: str,
+        cache_size: int = 256
+    ):
+        """
+        :param supported_locales: locales app has translations for.
+        :param default_locale: locale used when client accepts none
+            of supported locales.
+        :param cache_size: how many headers are remembered.
+        """
+        self.default_locale: str = normalize_locale(default_locale)
+        self.supported_locales: frozenset[str] = frozenset(
+            normalize_locale(locale) for locale in supported_locales
+        ) | {self.default_locale}
+
+        # Locales by their language, to match "en_GB" to "en" or "en_US".
+        # Locale without region is preferred, then default locale, so
+        # choice doesn't depend on names of other locales.
+        self._locales_by_language: dict[str, str] = {}
+        for locale in sorted(
+            self.supported_locales,
+            key=lambda locale: (
+                locale != get_language(locale),
+                locale != self.default_locale,
+                locale
+            )
+        ):
+            self._locales_by_language.setdefault(get_language(locale), locale)
+
+        self.negotiate = lru_cache(maxsize=cache_size)(self._negotiate)
+
+    def find_supported_locale(self, locale: str) -> Optional[str]:
+        """
+        Finds supported locale for locale client asked for. If exact
+        locale isn't supported, locale of the same language is used.
+
+        :param locale: normalized locale name.
+        :return: supported locale or None.
+        """
+        if locale in self.supported_locales:
+            return locale
+
+        return self._locales_by_language.get(get_language(locale))
+
+    def _negotiate(self, accept_language: str) -> str:
+        """
+        Chooses locale client wants the most.
+
+        :param accept_language: value of Accept-Language header.
+        :return: supported locale name.
+        """
+        for locale, _ in parse_accept_language(accept_language):
+            if locale == "*":
+                return self.default_locale
+
+            supported_locale: Optional[str] = self.find_supported_locale(
+                locale
+            )
+            if supported_locale is not None:
+                return supported_locale
+
+        return self.default_locale
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import gettext
+import os
+from typing import Iterable, Optional
+
+from .accept_language import LocaleNegotiator, normalize_locale
+
+
+class TranslationCatalog:
+    """
+    Translations of single locale. Singular messages are kept in plain
+    dictionary, so translating them is single dictionary lookup.
+    """
+    def __init__(
+        self,
+        locale: str,
+        translations: Optional[gettext.NullTranslations] = None
+    ):
+        """
+        :param locale: locale name.
+        :param translations: loaded gettext translations, if there are none
+            messages are given back untranslated.
+        """
+        self.locale: str = locale
+        self._translations: gettext.NullTranslations = \
+            translations or gettext.NullTranslations()
+
+        # GNUTranslations keeps messages in private _catalog, which is
+        # copied. Translations without it, like other subclasses of
+        # NullTranslations, are asked for every message.
+        catalog: Optional[dict] = getattr(translations, "_catalog", None)
+        self._is_catalog_copied: bool = \
+            translations is None or catalog is not None
+        self.messages: dict[str, str] = {
+            message_id: message
+            for message_id, message in (catalog or {}).items()
+            if isinstance(message_id, str) and message_id
+        }
+
+    def gettext(self, message: str) -> str:
+        """
+        Translates message.
+
+        :param message: message id.
+        :return: translated message, or message itself if there's
+            no translation.
+        """
+        if self._is_catalog_copied:
+            return self.messages.get(message, message)
+
+        return self._translations.gettext(message)
+
+    def ngettext(self, singular: str, plural: str, n: int) -> str:
+        """
+        Translates message which form depends on number.
+
+        :param singular: message id in singular form.
+        :param plural: message id in plural form.
+        :param n: number.
+        :return: translated message.
+        """
+        return self._translations.ngettext(singular, plural, n)
+
+    def pgettext(self, context: str, message: str) -> str:
+        """
+        Translates message in context.
+
+        :param context: context of message.
+        :param message: message id.
+        :return: translated message.
+        """
+        message_id: str = f"{context}\x04{message}"
+        if self._is_catalog_copied:
+            return self.messages.get(message_id, message)
+
+        translated: str = self._translations.gettext(message_id)
+        return message if translated == message_id else translated
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(locale={self.locale!r}, "
+            f"messages={len(self.messages)})"
+        )
+
+
+class Translations:
+    """
+    Compiled gettext catalogs of app. Catalogs are read from disk once
+    per worker, on app start or when they are first needed, and then are
+    shared by all handlers.
+
+    Catalogs are looked up as
+    ``<locale_dir>/<locale>/LC_MESSAGES/<domain>.mo``.
+    """
+
+    def __init__(
+        self,
+        locale_dir: str,
+        domain: str = "messages",
+        supported_locales: Optional[Iterable[str]] = None,
+        default_locale: str = "en_US",
+        cache_size: int = 256
+    ):
+        """
+        :param locale_dir: directory with catalogs.
+        :param domain: name of .mo files.
+        :param supported_locales: locales that are loaded, if not given
+            every locale in locale_dir is loaded.
+        :param default_locale: locale used when client accepts none
+            of supported locales.
+        :param cache_size: how many Accept-Language headers are remembered.
+        """
+        self.locale_dir: str = locale_dir
+        self.domain: str = domain
+        self.default_locale: str = normalize_locale(default_locale)
+        self.cache_size: int = cache_size
+
+        self._supported_locales: Optional[tuple[str, ...]] = None
+        if supported_locales is not None:
+            self._supported_locales = tuple(
+                normalize_locale(locale) for locale in supported_locales
+            )
+
+        self._catalogs: Optional[dict[str, TranslationCatalog]] = None
+        self._negotiator: Optional[LocaleNegotiator] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._catalogs is not None
+
+    def load(self) -> None:
+        """
+        Reads catalogs from disk. Does nothing if they are already read.
+
+        :return: nothing.
+        """
+        if self._catalogs is not None:
+            return
+
+        locales: Iterable[str] = self._supported_locales \
+            if self._supported_locales is not None \
+            else self._find_locales()
+
+        catalogs: dict[str, TranslationCatalog] = {}
+        for locale in locales:
+            catalogs[locale] = self._load_catalog(locale)
+
+        if self.default_locale not in catalogs:
+            catalogs[self.default_locale] = self._load_catalog(
+                self.default_locale
+            )
+
+        self._negotiator = LocaleNegotiator(
+            catalogs, self.default_locale, self.cache_size
+        )
+        self._catalogs = catalogs
+
+    def _find_locales(self) -> list[str]:
+        """
+        Finds locales that have catalog of domain in locale_dir.
+
+        :return: list of normalized locale names.
+        """
+        if not os.path.isdir(self.locale_dir):
+            return []
+
+        return [
+            normalize_locale(locale)
+            for locale in sorted(os.listdir(self.locale_dir))
+            if os.path.isfile(self._get_catalog_path(locale))
+        ]
+
+    def _get_catalog_path(self, locale: str) -> str:
+        return os.path.join(
+            self.locale_dir, locale, "LC_MESSAGES", f"{self.domain}.mo"
+        )
+
+    def _load_catalog(self, locale: str) -> TranslationCatalog:
+        """
+        Reads catalog of locale. Directory may be named as language tag
+        ("en-US") or as locale ("en_US").
+
+        :param locale: normalized locale name.
+        :return: TranslationCatalog instance, which is empty if there's
+            no catalog file.
+        """
+        for directory in (locale, locale.replace("_", "-")):
+            path: str = self._get_catalog_path(directory)
+            if os.path.isfile(path):
+                with open(path, "rb") as catalog_file:
+                    return TranslationCatalog(
+                        locale, gettext.GNUTranslations(catalog_file)
+                    )
+
+        return TranslationCatalog(locale)
+
+    @property
+    def catalogs(self) -> dict[str, TranslationCatalog]:
+        """
+        Gives loaded catalogs by locale names, loading them if needed.
+
+        :return: dictionary of catalogs.
+        """
+        if self._catalogs is None:
+            self.load()
+
+        return self._catalogs  # type: ignore
+
+    @property
+    def negotiator(self) -> LocaleNegotiator:
+        if self._negotiator is None:
+            self.load()
+
+        return self._negotiator  # type: ignore
+
+    def negotiate_locale(self, accept_language: str) -> str:
+        """
+        Chooses locale of loaded catalogs by Accept-Language header.
+
+        :param accept_language: value of Accept-Language header.
+        :return: locale name.
+        """
+        return self.negotiator.negotiate(accept_language)
+
+    def get_catalog(self, locale: str) -> TranslationCatalog:
+        """
+        Gives catalog of locale. If there's no catalog for exact locale,
+        catalog of the same language or of default locale is given.
+
+        :param locale: locale name.
+        :return: TranslationCatalog instance.
+        """
+        catalogs: dict[str, TranslationCatalog] = self.catalogs
+        try:
+            return catalogs[locale]
+
+        except KeyError:
+            supported_locale: Optional[str] = \
+                self.negotiator.find_supported_locale(
+                    normalize_locale(locale)
+                )
+            return catalogs[supported_locale or self.default_locale]
+
+    @property
+    def supported_locales(self) -> frozenset[str]:
+        return self.negotiator.supported_locales
@@ -1,4 +1,6 @@
 from . import asgi
 from .custom_cookie import CustomCookie
 from .locale_probability import LocaleProbability
+from .request_cookies import RequestCookies
+from .request_query import RequestQuery
 
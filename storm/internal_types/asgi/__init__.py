@@ -5,6 +5,7 @@ from .scope import (
     ASGIConnectionScope,
     HttpASGIConnectionScope,
     WebSocketASGIConnectionScope,
-    LifetimeASGIScope
+    LifetimeASGIScope,
+    check_asgi_version
 )
 from .supported_types import ASGI_SUPPORTED_TYPES
@@ -4,7 +4,8 @@ from typing import Callable, Awaitable
 from .scope import (
     HttpASGIConnectionScope,
     WebSocketASGIConnectionScope,
-    LifetimeASGIScope
+    LifetimeASGIScope,
+    check_asgi_version
 )
 from .supported_types import ASGI_SUPPORTED_TYPES
 
@@ -23,6 +24,9 @@ class ASGIApp(ABC):
     Base ASGI app that has minimal functionality to separate http
     and websockets requests.
     """
+    # ASGI version is checked once, on lifespan startup or first request
+    _is_asgi_version_checked: bool = False
+
     async def __call__(
         self, scope: dict,
         receive: Callable[
@@ -44,25 +48,28 @@ class ASGIApp(ABC):
         :param send: function that is used to respond on received ASGI events.
         :return: nothing.
 
-        :raises RuntimeError: if connection type is not http or websocket.
+        :raises RuntimeError: if connection type is not http or websocket,
+            or if ASGI version isn't supported.
         """
+        if not self._is_asgi_version_checked:
+            check_asgi_version(scope.get("asgi", {}))
+            self._is_asgi_version_checked = True
 
         connection_type: str = scope["type"]
         if connection_type == "http":
-            http_scope: HttpASGIConnectionScope = HttpASGIConnectionScope(
-                **scope
+            await self.http_asgi_app(
+                HttpASGIConnectionScope(scope), receive, send
             )
-            await self.http_asgi_app(http_scope, receive, send)
 
         elif connection_type == "websocket":
-            ws_scope: WebSocketASGIConnectionScope = WebSocketASGIConnectionScope(
-                **scope
+            await self.websocket_asgi_app(
+                WebSocketASGIConnectionScope(scope), receive, send
             )
-            await self.websocket_asgi_app(ws_scope, receive, send)
 
-        elif connection_type == "lifetime":
-            lifetime_scope: LifetimeASGIScope = LifetimeASGIScope(**scope)
-            await self.lifetime_asgi_app(lifetime_scope, receive, send)
+        elif connection_type == "lifespan":
+            await self.lifetime_asgi_app(
+                LifetimeASGIScope(scope), receive, send
+            )
 
         else:
             # Something must've gone very wrong on asgi server side
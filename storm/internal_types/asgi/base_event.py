@@ -6,5 +6,7 @@ class Event(ABC):
     Class that is used as base for any
     events related to ASGI app.
     """
+    __slots__ = ()
+
     type: str
 
@@ -8,12 +8,14 @@ class HttpEvent(Event, ABC):
     """
     Base class for http related events.
     """
+    __slots__ = ()
 
 
 class HttpSendEvent(HttpEvent, ABC):
     """
     Event for sending data via http protocol.
     """
+    __slots__ = ()
 
     @abstractmethod
     def to_dict(self) -> ASGI_SUPPORTED_TYPES:
@@ -30,13 +32,15 @@ class HttpReceiveEvent(HttpEvent):
     """
     Event for sending data via http protocol.
     """
+    __slots__ = ()
 
 
 class HttpResponseStart(HttpSendEvent):
     """
     Event that is used to start sending a response.
     """
-    type: str = "http.request"
+    __slots__ = ("status", "headers")
+    type: str = "http.response.start"
 
     def __init__(self, status: int, headers: list[tuple[bytes, bytes]]):
         self.status: int = status
@@ -54,7 +58,8 @@ class HttpResponseBody(HttpSendEvent):
     """
     Event that is used for sending responses body.
     """
-    type: str = "http.request.body"
+    __slots__ = ("body", "more_body")
+    type: str = "http.response.body"
 
     def __init__(self, body: bytes = b"", more_body: bool = False):
         self.body: bytes = body
@@ -72,6 +77,7 @@ class HttpRequest(HttpReceiveEvent):
     """
     Event sent to Storm when got new request.
     """
+    __slots__ = ("body", "more_body")
     type: str = "http.request"
 
     def __init__(self, body: bytes = b"", more_body: bool = False):
@@ -83,6 +89,7 @@ class HttpDisconnect(HttpReceiveEvent):
     """
     Event send to Storm when connection is closed.
     """
+    __slots__ = ()
     type: str = "http.disconnect"
 
     def __init__(self):
@@ -8,12 +8,14 @@ class LifetimeEvent(Event):
     """
     Event that is related to lifecycle of app.
     """
+    __slots__ = ()
 
 
 class Startup(LifetimeEvent):
     """
     Server starts up.
     """
+    __slots__ = ()
     type: str = "lifespan.startup"
 
 
@@ -21,6 +23,7 @@ class StartupComplete(LifetimeEvent):
     """
     Server finished startup.
     """
+    __slots__ = ()
     type: str = "lifespan.startup.complete"
 
     @classmethod
@@ -34,6 +37,7 @@ class StartupFailed(LifetimeEvent):
     """
     Framework failed to start due to some issue.
     """
+    __slots__ = ("message",)
     type: str = "lifespan.startup.failed"
 
     def __init__(self, message: Optional[str] = None):
@@ -50,6 +54,7 @@ class Shutdown(LifetimeEvent):
     """
     Server is shutting down.
     """
+    __slots__ = ()
     type: str = "lifespan.shutdown"
 
 
@@ -57,22 +62,26 @@ class ShutdownComplete(LifetimeEvent):
     """
     Framework been successfully shut down.
     """
+    __slots__ = ()
     type: str = "lifespan.shutdown.complete"
 
     @classmethod
-    def emit_shutdown_complete(cls) -> str:
+    def emit_shutdown_complete(cls) -> dict:
         """
-        Gives text that needs to be sent to ASGI server to complete shutdown.
+        Gives dict that needs to be sent to ASGI server to complete shutdown.
 
-        :return: string that will shut down ASGI server.
+        :return: dictionary that will shut down ASGI server.
         """
-        return cls.type
+        return {
+            "type": cls.type
+        }
 
 
 class ShutdownFailed(LifetimeEvent):
     """
     Framework failed to shut down.
     """
+    __slots__ = ("message",)
     type: str = "lifespan.shutdown.failed"
 
     def __init__(self, message: Optional[str] = None):
@@ -1,156 +1,151 @@
+"""
+Scopes wrap dictionary that ASGI server gives without copying it. Fields
+are read from dictionary only when they are accessed, and setting field
+writes it back into dictionary.
+"""
 from abc import ABC
-from typing import Iterable, Optional
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, MutableMapping, Optional
+
+SUPPORTED_ASGI_VERSIONS = frozenset({"3.0"})
+
+
+class ScopeField:
+    """
+    Descriptor of scope field, which is read from scopes dictionary.
+    """
+    __slots__ = ("key", "default")
+
+    def __init__(self, key: str, default: Any = None):
+        """
+        :param key: key of field in ASGI scope.
+        :param default: value used when server didn't send field.
+        """
+        self.key: str = key
+        self.default: Any = default
+
+    def __get__(
+        self,
+        instance: Optional["BaseASGIScope"],
+        owner: type
+    ) -> Any:
+        if instance is None:
+            return self
+
+        return instance.raw.get(self.key, self.default)
+
+    def __set__(self, instance: "BaseASGIScope", value: Any) -> None:
+        instance.raw[self.key] = value
+
+
+def check_asgi_version(asgi: Mapping[str, str]) -> None:
+    """
+    Checks that ASGI server speaks version of protocol storm supports.
+    Servers don't change version while working, so it's checked once
+    and not on every request.
+
+    :param asgi: "asgi" field of scope.
+    :return: nothing.
+    :raises RuntimeError: if version isn't supported.
+    """
+    version: str = asgi.get("version", "2.0")
+    if version not in SUPPORTED_ASGI_VERSIONS:
+        raise RuntimeError(
+            "Asgi version doesn't match with supported by storm"
+            f" (must be 3.0 only, got {version})"
+        )
+
+    spec_version: str = asgi.get("spec_version", "2.0")
+    if not spec_version.startswith("2."):
+        raise RuntimeError(
+            f"Asgi spec_version must be 2.X (got {spec_version})"
+        )
 
 
 class BaseASGIScope(ABC):
     """
     Base class for any ASGI scope.
     """
-    type: str
-    asgi: dict[str, str]
-    extensions: dict[str, dict]
+    __slots__ = ("raw",)
+
+    type: str = ScopeField("type")
+    asgi: Mapping[str, str] = ScopeField("asgi", MappingProxyType({}))
+    extensions: Mapping[str, dict] = ScopeField(
+        "extensions", MappingProxyType({})
+    )
+
+    def __init__(
+        self,
+        raw: Optional[MutableMapping[str, Any]] = None,
+        **fields: Any
+    ):
+        """
+        :param raw: scope dictionary from ASGI server, which is kept
+            as it is.
+        :param fields: fields of scope, used when there's no dictionary.
+        :raises TypeError: if both dictionary and fields are given.
+        """
+        if raw is None:
+            raw = fields
+
+        elif fields:
+            raise TypeError(
+                "Scope is made either from dictionary or from fields"
+            )
+
+        self.raw: MutableMapping[str, Any] = raw
 
     @property
     def asgi_version(self) -> str:
-        return self.asgi.get("version", default="2.0")
+        return self.asgi.get("version", "2.0")
 
     @property
     def asgi_spec_version(self) -> str:
-        return self.asgi.get("spec_version", default="2.0")
+        return self.asgi.get("spec_version", "2.0")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.raw!r})"
 
 
 class ASGIConnectionScope(BaseASGIScope):
     """
     Base class for any connection from ASGI server.
     """
-    def __init__(
-        self,
-        *,
-        type: str,  # noqa: following naming in ASGI spec
-        asgi: dict[str, str],
-        extensions: dict[str, dict],
-        http_version: str,
-        scheme: str,
-        path: str,
-        root_path: str,
-        raw_path: Optional[str],
-        query_string: Optional[bytes],
-        headers: Iterable[tuple[bytes, bytes]],
-        client: tuple[str, Optional[int]],
-        server: tuple[str, Optional[int]],
-    ):
-        self.type: str = type
-        self.asgi: dict[str, str] = asgi
-        self.extensions: dict[str, dict] = extensions
-        self.http_version: str = http_version
-        self.scheme: str = scheme
-        self.path: str = path
-        self.root_path: str = root_path
-        self.raw_path: Optional[str] = raw_path
-        self.query_string: Optional[bytes] = query_string
-        self.headers: Iterable[tuple[bytes, bytes]] = headers
-        self.client: tuple[str, Optional[int]] = client
-        self.server: tuple[str, Optional[int]] = server
-
-        self.__post_init__()
-
-    def __post_init__(self):
-        assert self.asgi_version in {"3.0"}, (
-            "Asgi version doesn't match with supported by storm"
-            " (must be 3.0 only)"
-        )
+    __slots__ = ()
 
-        assert self.asgi_spec_version in {"2.0", "2.1"}, (
-            "Asgi spec_version must be only 2.1 or 2.0"
-        )
+    http_version: str = ScopeField("http_version", "1.1")
+    scheme: str = ScopeField("scheme")
+    path: str = ScopeField("path")
+    root_path: str = ScopeField("root_path", "")
+    raw_path: Optional[bytes] = ScopeField("raw_path")
+    query_string: bytes = ScopeField("query_string", b"")
+    headers: Iterable[tuple[bytes, bytes]] = ScopeField("headers", ())
+    client: Optional[tuple[str, Optional[int]]] = ScopeField("client")
+    server: Optional[tuple[str, Optional[int]]] = ScopeField("server")
 
 
 class HttpASGIConnectionScope(ASGIConnectionScope):
     """
     Class for HTTP connection scope parameters.
     """
-    def __init__(
-        self,
-        *,
-        type: str,  # noqa: following naming in ASGI spec
-        asgi: dict[str, str],
-        extensions: dict[str, dict],
-        http_version: str,
-        method: str,
-        scheme: str,
-        path: str,
-        root_path: str,
-        raw_path: Optional[str],
-        query_string: Optional[bytes],
-        headers: Iterable[tuple[bytes, bytes]],
-        client: tuple[str, Optional[int]],
-        server: tuple[str, Optional[int]]
-    ):
-        self.method: str = method
-        super(HttpASGIConnectionScope, self).__init__(
-            type=type or "http", asgi=asgi, extensions=extensions,
-            http_version=http_version, scheme=scheme or "http",
-            path=path, root_path=root_path, raw_path=raw_path or None,
-            query_string=query_string, headers=headers,
-            client=client, server=server
-        )
+    __slots__ = ()
 
-    def __post_init__(self):
-        super().__post_init__()
-        assert self.scheme in {"http", "https"}, (
-            f"Invalid scheme for HttpAsgiConnectionScope (got {self.scheme}"
-        )
+    method: str = ScopeField("method")
+    scheme: str = ScopeField("scheme", "http")
 
 
 class WebSocketASGIConnectionScope(ASGIConnectionScope):
     """
     Class for WebSockets ASGI connections scope.
     """
+    __slots__ = ()
 
-    def __init__(
-        self,
-        *,
-        type: str,  # noqa: following naming in ASGI spec
-        asgi: dict[str, str],
-        extensions: dict[str, dict],
-        http_version: str,
-        scheme: str,
-        path: str,
-        root_path: str,
-        raw_path: Optional[str],
-        query_string: Optional[bytes],
-        headers: Iterable[tuple[bytes, bytes]],
-        client: tuple[str, Optional[int]],
-        server: tuple[str, Optional[int]],
-        subprotocols: Iterable[str]
-    ):
-        self.subprotocols: Iterable[str] = subprotocols or []
-        super(WebSocketASGIConnectionScope, self).__init__(
-            type=type or "websocket", asgi=asgi, extensions=extensions,
-            http_version=http_version, scheme=scheme or "ws",
-            path=path, root_path=root_path, raw_path=raw_path or None,
-            query_string=query_string, headers=headers,
-            client=client, server=server
-        )
-
-    def __post_init__(self):
-        super().__post_init__()
-        assert self.scheme in {"ws", "wss"}, (
-            "Invalid scheme for WebSocketAsgiConnectionScope "
-            f"(got {self.scheme})"
-        )
+    scheme: str = ScopeField("scheme", "ws")
+    subprotocols: Iterable[str] = ScopeField("subprotocols", ())
 
 
 class LifetimeASGIScope(BaseASGIScope):
     """
     Class that represents lifetime messages from ASGI server.
     """
-    def __init__(
-        self,
-        type: str,  # noqa: following naming in ASGI spec
-        asgi: dict[str, str],
-        extensions: dict[str, dict],
-    ):
-        self.type: str = type
-        self.asgi: dict[str, str] = asgi
-        self.extensions: dict[str, dict] = extensions
+    __slots__ = ()
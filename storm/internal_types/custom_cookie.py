@@ -1,18 +1,57 @@
 from http.cookies import SimpleCookie
+from typing import Any, Optional
 
 
 class CustomCookie(SimpleCookie):
+    """
+    Cookies of response. Encoded headers are cached and encoded again only
+    after cookies are added, removed or loaded. Changes of attributes of
+    morsels, that were made after headers were encoded, aren't noticed.
+    """
+
+    def __init__(self, input: Optional[Any] = None):  # noqa: as in parent
+        # Incremented on every change, to know when cache is outdated
+        self._version: int = 0
+        self._encoded: Optional[list[tuple[bytes, bytes]]] = None
+        self._encoded_version: int = -1
+        self._encoded_header: bytes = b""
+        super().__init__(input)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._version += 1
+        super().__delitem__(key)
+
+    def clear(self) -> None:
+        self._version += 1
+        super().clear()
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self._version += 1
+        return super().pop(key, *default)
+
+    def load(self, rawdata: Any) -> None:
+        self._version += 1
+        super().load(rawdata)
+
     def as_headers_list(
         self,
         header: bytes = b"set-cookie"
     ) -> list[tuple[bytes, bytes]]:
-        result = []
-        items = sorted(self.items())
-        for _, value in items:
-            result.append(
+        if self._encoded is None or \
+                self._encoded_version != self._version or \
+                self._encoded_header != header:
+            self._encoded = [
                 (
                     header,
                     value.output(header="").strip(" ").encode('utf-8')
                 )
-            )
-        return result
+                for _, value in sorted(self.items())
+            ]
+            self._encoded_version = self._version
+            self._encoded_header = header
+
+        return list(self._encoded)
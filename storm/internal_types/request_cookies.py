@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Iterator, Mapping, Optional
+
+
+def unquote_cookie_value(value: str) -> str:
+    """
+    Removes double quotes around cookies value. Quoted values can't contain
+    escaped characters, so nothing else must be done to them.
+
+    :param value: cookies value as it was sent.
+    :return: unquoted value.
+    """
+    if len(value) > 1 and value[0] == value[-1] == '"':
+        return value[1:-1]
+
+    return value
+
+
+def find_cookie(cookie_header: str, name: str) -> Optional[str]:
+    """
+    Looks for value of single cookie in Cookie header without
+    parsing other cookies. If cookie is sent several times,
+    first value is taken.
+
+    :param cookie_header: value of Cookie header.
+    :param name: cookies name.
+    :return: cookies value or None if there's no such cookie.
+    """
+    key: str = name + "="
+    position: int = cookie_header.find(key)
+
+    while position != -1:
+        # Name must not be ending of other cookies name
+        if position == 0 or cookie_header[position - 1] in "; ":
+            value_start: int = position + len(key)
+            value_end: int = cookie_header.find(";", value_start)
+            if value_end == -1:
+                value_end = len(cookie_header)
+
+            return unquote_cookie_value(
+                cookie_header[value_start:value_end].strip()
+            )
+
+        position = cookie_header.find(key, position + 1)
+
+    return None
+
+
+def parse_cookies(cookie_header: str) -> dict[str, str]:
+    """
+    Parses all cookies from Cookie header. If cookie is sent several times,
+    first value is taken.
+
+    :param cookie_header: value of Cookie header.
+    :return: dictionary of cookies values.
+    """
+    cookies: dict[str, str] = {}
+    for pair in cookie_header.split(";"):
+        name, separator, value = pair.partition("=")
+        name = name.strip()
+        if not separator or not name or name in cookies:
+            continue
+
+        cookies[name] = unquote_cookie_value(value.strip())
+
+    return cookies
+
+
+class RequestCookies(Mapping[str, str]):
+    """
+    Read only cookies that were sent with request. Single cookies are looked
+    up right in Cookie header, and all of cookies are parsed only when
+    they are iterated over.
+    """
+    __slots__ = ("_cookie_header", "_cookies")
+
+    def __init__(self, cookie_header: str = ""):
+        self._cookie_header: str = cookie_header
+        self._cookies: Optional[dict[str, str]] = None
+
+    def _get_cookies(self) -> dict[str, str]:
+        if self._cookies is None:
+            self._cookies = parse_cookies(self._cookie_header)
+
+        return self._cookies
+
+    def __getitem__(self, name: str) -> str:
+        if self._cookies is not None:
+            return self._cookies[name]
+
+        value: Optional[str] = find_cookie(self._cookie_header, name)
+        if value is None:
+            raise KeyError(name)
+
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+
+        if self._cookies is not None:
+            return name in self._cookies
+
+        return find_cookie(self._cookie_header, name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_cookies())
+
+    def __len__(self) -> int:
+        return len(self._get_cookies())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._get_cookies()!r})"
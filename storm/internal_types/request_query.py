@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Collection, Iterator, Mapping, Optional
+from urllib.parse import unquote_to_bytes
+
+
+def decode_query_component(raw: bytes) -> str:
+    """
+    Decodes name or value from query string. Components that have nothing
+    escaped are decoded right away.
+
+    :param raw: part of query string.
+    :return: decoded string.
+    """
+    if b"+" in raw:
+        raw = raw.replace(b"+", b" ")
+
+    if b"%" in raw:
+        raw = unquote_to_bytes(raw)
+
+    return raw.decode("utf-8", "replace")
+
+
+def parse_query_string(
+    query_string: bytes,
+    names: Optional[Collection[str]] = None
+) -> dict[str, list[str]]:
+    """
+    Parses query string the way urllib.parse.parse_qs does, but works with
+    bytes and can skip parameters that aren't needed without decoding them.
+    Parameters with blank values are skipped.
+
+    :param query_string: raw query string from scope.
+    :param names: names of parameters to extract or None to extract all.
+    :return: dictionary of parameters values lists.
+    """
+    raw_names: Optional[frozenset[bytes]] = None
+    if names is not None:
+        raw_names = frozenset(name.encode("utf-8") for name in names)
+
+    parameters: dict[str, list[str]] = {}
+    for pair in query_string.split(b"&"):
+        raw_name, _, raw_value = pair.partition(b"=")
+        if not raw_value:
+            continue
+
+        if raw_names is not None and raw_name not in raw_names and (
+            b"%" not in raw_name and b"+" not in raw_name
+        ):
+            # Name has nothing escaped, so it is surely not needed
+            continue
+
+        name: str = decode_query_component(raw_name)
+        if names is not None and name not in names:
+            continue
+
+        value: str = decode_query_component(raw_value)
+        try:
+            parameters[name].append(value)
+
+        except KeyError:
+            parameters[name] = [value]
+
+    return parameters
+
+
+class RequestQuery(Mapping[str, list[str]]):
+    """
+    Read only query parameters of request, that are parsed from raw query
+    string only when they are accessed. Handlers extract only parameters
+    they declare, and query string is fully parsed only if it's iterated
+    over or other parameters are requested.
+    """
+    __slots__ = ("_query_string", "_parameters")
+
+    def __init__(self, query_string: Optional[bytes] = b""):
+        self._query_string: bytes = query_string or b""
+        self._parameters: Optional[dict[str, list[str]]] = None
+
+    @property
+    def raw(self) -> bytes:
+        return self._query_string
+
+    def select(self, names: Collection[str]) -> dict[str, list[str]]:
+        """
+        Gives values of specific parameters.
+
+        :param names: names of needed parameters.
+        :return: dictionary of found parameters values lists.
+        """
+        if self._parameters is not None:
+            return {
+                name: self._parameters[name]
+                for name in names
+                if name in self._parameters
+            }
+
+        return parse_query_string(self._query_string, names)
+
+    def get_last(
+        self,
+        name: str,
+        default: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Gives last value of parameter, like most of frameworks do when
+        parameter is sent several times.
+
+        :param name: parameters name.
+        :param default: value returned if there's no such parameter.
+        :return: parameters value or default.
+        """
+        values: Optional[list[str]] = self.get(name)
+        if not values:
+            return default
+
+        return values[-1]
+
+    def _get_parameters(self) -> dict[str, list[str]]:
+        if self._parameters is None:
+            self._parameters = parse_query_string(self._query_string)
+
+        return self._parameters
+
+    def __getitem__(self, name: str) -> list[str]:
+        return self._get_parameters()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_parameters())
+
+    def __len__(self) -> int:
+        return len(self._get_parameters())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._get_parameters()!r})"
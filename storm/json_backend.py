@@ -0,0 +1,89 @@
+"""
+JSON functions of the fastest library that is installed. Libraries are
+tried in order: orjson, ujson and json from standard library. Only orjson
+encodes straight into bytes, others encode into str first.
+
+orjson is told to accept dictionary keys that aren't str and to encode
+subclasses of tuple, like NamedTuple, as lists, so data that json from
+standard library encodes is encoded by orjson too. orjson also encodes
+some types json can't, like datetime, dataclasses and UUID, so default
+function is called for such types only by ujson and json.
+"""
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+
+except ImportError:
+    ujson = None
+
+json_default = Optional[Callable[[Any], Any]]
+
+if orjson is not None:
+    backend_name: str = "orjson"
+    JSONDecodeError: type = orjson.JSONDecodeError
+
+    def _tuple_as_list(obj: Any) -> Any:
+        """
+        Turns subclasses of tuple, that orjson doesn't encode, into lists.
+
+        :param obj: object orjson can't encode.
+        :return: list of tuples items.
+        :raises TypeError: if obj isn't tuple.
+        """
+        if isinstance(obj, tuple):
+            return list(obj)
+
+        raise TypeError(f"Type is not JSON serializable: {type(obj)}")
+
+    def dumps(data: Any, default: json_default = None) -> bytes:
+        if default is None:
+            return orjson.dumps(
+                data, default=_tuple_as_list, option=orjson.OPT_NON_STR_KEYS
+            )
+
+        def tuple_as_list_or_default(obj: Any) -> Any:
+            if isinstance(obj, tuple):
+                return list(obj)
+
+            return default(obj)  # type: ignore
+
+        return orjson.dumps(
+            data,
+            default=tuple_as_list_or_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+elif ujson is not None:
+    backend_name = "ujson"
+    JSONDecodeError = ujson.JSONDecodeError
+
+    def dumps(data: Any, default: json_default = None) -> bytes:
+        return ujson.dumps(
+            data, ensure_ascii=False, default=default
+        ).encode("utf-8")
+
+    def loads(data: bytes) -> Any:
+        return ujson.loads(data)
+
+else:
+    backend_name = "json"
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(data: Any, default: json_default = None) -> bytes:
+        return json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), default=default
+        ).encode("utf-8")
+
+    def loads(data: bytes) -> Any:
+        return json.loads(data)
@@ -0,0 +1,5 @@
+from .json_decoder import JsonDecoder
+from .request_decoder import BaseRequestDecoder
+from .msgpack_decoder import MsgpackDecoder
+from .cbor_decoder import CborDecoder
+from .default_decoders import find_decoder, get_default_decoders
@@ -0,0 +1,30 @@
+from typing import Any
+
+from .request_decoder import BaseRequestDecoder
+
+try:
+    import cbor2
+
+except ImportError:
+    cbor2 = None
+
+
+class CborDecoder(BaseRequestDecoder):
+    """
+    Decodes CBOR bodies. Requires cbor2 package.
+    """
+    content_type: str = "application/cbor"
+    is_available: bool = cbor2 is not None
+
+    def __init__(self):
+        if cbor2 is None:
+            raise ImportError("CborDecoder requires cbor2 package")
+
+        self._loads = cbor2.loads
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._loads(data)
+
+        except (ValueError, cbor2.CBORDecodeError) as err:
+            raise ValueError(f"Malformed CBOR: {err}") from err
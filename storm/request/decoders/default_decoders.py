@@ -0,0 +1,41 @@
+from typing import Optional, Sequence
+
+from .cbor_decoder import CborDecoder
+from .json_decoder import JsonDecoder
+from .msgpack_decoder import MsgpackDecoder
+from .request_decoder import BaseRequestDecoder
+
+
+def get_default_decoders() -> list[BaseRequestDecoder]:
+    """
+    Gives decoders which libraries are installed.
+
+    :return: list of decoders.
+    """
+    decoders: list[BaseRequestDecoder] = [JsonDecoder()]
+    if MsgpackDecoder.is_available:
+        decoders.append(MsgpackDecoder())
+
+    if CborDecoder.is_available:
+        decoders.append(CborDecoder())
+
+    return decoders
+
+
+def find_decoder(
+    decoders: Sequence[BaseRequestDecoder],
+    content_type: str
+) -> Optional[BaseRequestDecoder]:
+    """
+    Finds decoder for body by its Content-Type header.
+
+    :param decoders: decoders to choose from.
+    :param content_type: value of Content-Type header.
+    :return: decoder or None if no decoder understands body.
+    """
+    media_type: str = content_type.partition(";")[0].strip().lower()
+    for decoder in decoders:
+        if media_type in decoder.media_types:
+            return decoder
+
+    return None
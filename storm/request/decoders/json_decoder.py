@@ -0,0 +1,15 @@
+from typing import Any
+
+from storm import json_backend
+from .request_decoder import BaseRequestDecoder
+
+
+class JsonDecoder(BaseRequestDecoder):
+    content_type: str = "application/json"
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return json_backend.loads(data)
+
+        except json_backend.JSONDecodeError as err:
+            raise ValueError(f"Malformed JSON: {err}") from err
@@ -0,0 +1,34 @@
+from typing import Any
+
+from .request_decoder import BaseRequestDecoder
+
+try:
+    import msgpack
+
+except ImportError:
+    msgpack = None
+
+
+class MsgpackDecoder(BaseRequestDecoder):
+    """
+    Decodes MessagePack bodies. Requires msgpack package.
+    """
+    content_type: str = "application/msgpack"
+    is_available: bool = msgpack is not None
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("MsgpackDecoder requires msgpack package")
+
+        self._unpackb = msgpack.unpackb
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._unpackb(data, raw=False)
+
+        except (ValueError, msgpack.UnpackException) as err:
+            raise ValueError(f"Malformed MessagePack: {err}") from err
+
+    @property
+    def media_types(self) -> tuple[str, ...]:
+        return "application/msgpack", "application/x-msgpack"
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class BaseRequestDecoder(ABC):
+    # Value of Content-Type header of bodies decoder understands
+    content_type: str
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """
+        Decodes request body.
+
+        :param data: body bytes.
+        :return: decoded data.
+        :raises ValueError: if body is malformed.
+        """
+        pass
+
+    @property
+    def media_types(self) -> tuple[str, ...]:
+        """
+        Media types of bodies which decoder understands.
+
+        :return: media types without parameters.
+        """
+        return (self.content_type,)
@@ -0,0 +1,11 @@
+from .form import (
+    FORM_MEDIA_TYPES,
+    Form,
+    FormPart,
+    MultipartReader,
+    UploadedFile,
+    is_form_media_type,
+    make_multipart_reader,
+    read_form
+)
+from .multipart_parser import MultipartParser, MultipartParseError
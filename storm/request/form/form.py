@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+from collections import deque
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Optional
+
+from storm.internal_types.request_query import parse_query_string
+from storm.request.spooled_file import write_spooled
+from storm.responses.http import http_errors
+from .multipart_parser import (
+    FORM_END,
+    PART_END,
+    MultipartParseError,
+    MultipartParser,
+    PartHeaders,
+    get_boundary,
+    multipart_event
+)
+
+# Media types of bodies that can be read as form
+FORM_MEDIA_TYPES: frozenset[str] = frozenset({
+    "multipart/form-data", "application/x-www-form-urlencoded"
+})
+
+
+def get_media_type(content_type: str) -> str:
+    """
+    Gives media type of Content-Type header without its parameters.
+
+    :param content_type: value of Content-Type header.
+    :return: lower cased media type.
+    """
+    return content_type.partition(";")[0].strip().lower()
+
+
+def is_form_media_type(content_type: str) -> bool:
+    """
+    Checks if body with such Content-Type can be read as form.
+
+    :param content_type: value of Content-Type header.
+    :return: is body multipart or urlencoded form.
+    """
+    return get_media_type(content_type) in FORM_MEDIA_TYPES
+
+
+class UploadedFile:
+    """
+    File from multipart form, which is kept in memory until it's larger
+    than spool threshold and then is written to temporary file.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        filename: str,
+        content_type: str,
+        headers: dict[str, str],
+        file: SpooledTemporaryFile,
+        spool_threshold: int
+    ):
+        """
+        :param name: name of form field.
+        :param filename: name of file given by client.
+        :param content_type: Content-Type of file.
+        :param headers: headers of multipart part.
+        :param file: empty file, which max_size is spool_threshold.
+        :param spool_threshold: how many bytes file keeps in memory.
+        """
+        self.name: str = name
+        self.filename: str = filename
+        self.content_type: str = content_type
+        self.headers: dict[str, str] = headers
+        self.file: SpooledTemporaryFile = file
+        self.spool_threshold: int = spool_threshold
+        self.size: int = 0
+
+    @property
+    def is_rolled_over(self) -> bool:
+        """
+        Tells if file was written to disk. File is written to disk as
+        soon as it's larger than spool threshold.
+
+        :return: is file on disk.
+        """
+        return self.size > self.spool_threshold
+
+    async def write(self, chunk: bytes) -> None:
+        """
+        Appends chunk to file. Chunk, that makes file roll over to disk,
+        and all following ones are written in default executor of event
+        loop, so writing to disk doesn't block event loop.
+
+        :param chunk: part of files data.
+        :return: nothing.
+        """
+        await write_spooled(self.file, chunk, self.size, self.spool_threshold)
+        self.size += len(chunk)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, "
+            f"filename={self.filename!r}, size={self.size})"
+        )
+
+
+class Form:
+    """
+    Parsed form: text fields and uploaded files by their names.
+    """
+
+    def __init__(self):
+        self.fields: dict[str, list[str]] = {}
+        self.files: dict[str, list[UploadedFile]] = {}
+
+    def add_field(self, name: str, value: str) -> None:
+        try:
+            self.fields[name].append(value)
+
+        except KeyError:
+            self.fields[name] = [value]
+
+    def add_file(self, uploaded_file: UploadedFile) -> None:
+        try:
+            self.files[uploaded_file.name].append(uploaded_file)
+
+        except KeyError:
+            self.files[uploaded_file.name] = [uploaded_file]
+
+    def close(self) -> None:
+        """
+        Closes all uploaded files, which removes them from disk.
+
+        :return: nothing.
+        """
+        for uploaded_files in self.files.values():
+            for uploaded_file in uploaded_files:
+                uploaded_file.close()
+
+
+class FormPart:
+    """
+    Part of multipart form, which data is received when part is iterated
+    over. Parts must be read in order they come, and data of part which
+    wasn't read is skipped when next part is requested.
+    """
+
+    def __init__(self, reader: MultipartReader, headers: PartHeaders):
+        self.headers: dict[str, str] = headers.headers
+        disposition_parameters: dict[str, str] = \
+            headers.disposition_parameters
+        self.name: str = disposition_parameters.get("name", "")
+        self.filename: Optional[str] = disposition_parameters.get("filename")
+        self.content_type: str = self.headers.get(
+            "content-type", "text/plain"
+        )
+
+        self._reader: MultipartReader = reader
+        self._is_finished: bool = False
+
+    @property
+    def is_file(self) -> bool:
+        return self.filename is not None
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while not self._is_finished:
+            event: multipart_event = await self._reader.next_event()
+            if event is PART_END:
+                self._is_finished = True
+
+            elif isinstance(event, bytes):
+                yield event
+
+            else:
+                raise http_errors.BadRequest(
+                    message="Malformed multipart body"
+                )
+
+    async def read(self) -> bytes:
+        """
+        Reads whole part into memory.
+
+        :return: parts data.
+        """
+        return b"".join([chunk async for chunk in self])
+
+    async def skip(self) -> None:
+        """
+        Skips rest of parts data.
+
+        :return: nothing.
+        """
+        async for _ in self:
+            pass
+
+
+class MultipartReader:
+    """
+    Reads parts of multipart/form-data body while it's received.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], boundary: bytes):
+        self._chunks: AsyncIterator[bytes] = chunks
+        self._parser: MultipartParser = MultipartParser(boundary)
+        self._events: deque[multipart_event] = deque()
+
+    async def next_event(self) -> multipart_event:
+        """
+        Gives next event of parser, receiving body if needed.
+
+        :return: event of multipart parser.
+        :raises HttpError: BadRequest if body is malformed or ends before
+            closing boundary.
+        """
+        while not self._events:
+            try:
+                chunk: bytes = await self._chunks.__anext__()
+
+            except StopAsyncIteration:
+                raise http_errors.BadRequest(
+                    message="Multipart body ended unexpectedly"
+                )
+
+            try:
+                self._events.extend(self._parser.feed(chunk))
+
+            except MultipartParseError as err:
+                raise http_errors.BadRequest(
+                    message="Malformed multipart body"
+                ) from err
+
+        return self._events.popleft()
+
+    async def __aiter__(self) -> AsyncIterator[FormPart]:
+        while True:
+            event: multipart_event = await self.next_event()
+            if event is FORM_END:
+                return
+
+            if not isinstance(event, PartHeaders):
+                raise http_errors.BadRequest(
+                    message="Malformed multipart body"
+                )
+
+            part = FormPart(self, event)
+            yield part
+            await part.skip()
+
+
+async def read_multipart_form(
+    reader: MultipartReader,
+    spool_threshold: int,
+    max_field_size: int,
+    max_parts: int = 1000,
+    max_files: int = 100
+) -> Form:
+    """
+    Reads multipart form into fields and files.
+
+    :param reader: reader of multipart body.
+    :param spool_threshold: how many bytes of file are kept in memory
+        before it's written to disk.
+    :param max_field_size: how many bytes text field can have.
+    :param max_parts: how many parts form can have, files included.
+    :param max_files: how many files form can have.
+    :return: Form instance.
+    :raises HttpError: PayloadTooLarge if some field is too large or form
+        has too many parts or files, or BadRequest if body is malformed.
+    """
+    form = Form()
+    parts_count: int = 0
+    files_count: int = 0
+    try:
+        async for part in reader:
+            parts_count += 1
+            if parts_count > max_parts:
+                raise http_errors.PayloadTooLarge(
+                    message="Form has too many parts"
+                )
+
+            if part.filename is None:
+                value = bytearray()
+                async for chunk in part:
+                    value += chunk
+                    if len(value) > max_field_size:
+                        raise http_errors.PayloadTooLarge()
+
+                form.add_field(part.name, value.decode("utf-8", "replace"))
+                continue
+
+            files_count += 1
+            if files_count > max_files:
+                raise http_errors.PayloadTooLarge(
+                    message="Form has too many files"
+                )
+
+            uploaded_file = UploadedFile(
+                part.name, part.filename, part.content_type, part.headers,
+                SpooledTemporaryFile(max_size=spool_threshold),
+                spool_threshold
+            )
+            form.add_file(uploaded_file)
+            async for chunk in part:
+                await uploaded_file.write(chunk)
+
+            uploaded_file.file.seek(0)
+
+    except BaseException:
+        form.close()
+        raise
+
+    return form
+
+
+async def read_urlencoded_form(
+    chunks: AsyncIterator[bytes],
+    max_field_size: int,
+    max_fields: int = 1000
+) -> Form:
+    """
+    Reads application/x-www-form-urlencoded form while it's received.
+    Only part of body after last "&" is kept between chunks.
+
+    :param chunks: body chunks.
+    :param max_field_size: how many bytes single field can take.
+    :param max_fields: how many fields form can have.
+    :return: Form instance.
+    :raises HttpError: PayloadTooLarge if some field is too large
+        or form has too many fields.
+    """
+    form = Form()
+    tail: bytes = b""
+    fields_count: int = 0
+
+    async for chunk in chunks:
+        data: bytes = tail + chunk if tail else chunk
+        fields_end: int = data.rfind(b"&")
+
+        if fields_end == -1:
+            tail = data
+
+        else:
+            fields_count += data.count(b"&", 0, fields_end) + 1
+            if fields_count > max_fields:
+                raise http_errors.PayloadTooLarge(
+                    message="Form has too many fields"
+                )
+
+            for name, values in parse_query_string(
+                data[:fields_end]
+            ).items():
+                for value in values:
+                    form.add_field(name, value)
+
+            tail = data[fields_end + 1:]
+
+        if len(tail) > max_field_size:
+            raise http_errors.PayloadTooLarge()
+
+    if tail and fields_count >= max_fields:
+        raise http_errors.PayloadTooLarge(message="Form has too many fields")
+
+    for name, values in parse_query_string(tail).items():
+        for value in values:
+            form.add_field(name, value)
+
+    return form
+
+
+def make_multipart_reader(
+    chunks: AsyncIterator[bytes],
+    content_type: str
+) -> MultipartReader:
+    """
+    Makes reader of multipart body.
+
+    :param chunks: body chunks.
+    :param content_type: value of Content-Type header.
+    :return: MultipartReader instance.
+    :raises HttpError: UnsupportedMediaType if body isn't
+        multipart/form-data, or BadRequest if boundary is missing.
+    """
+    if get_media_type(content_type) != "multipart/form-data":
+        raise http_errors.UnsupportedMediaType()
+
+    boundary: Optional[bytes] = get_boundary(content_type)
+    if boundary is None:
+        raise http_errors.BadRequest(message="Multipart boundary is missing")
+
+    return MultipartReader(chunks, boundary)
+
+
+async def read_form(
+    chunks: AsyncIterator[bytes],
+    content_type: str,
+    spool_threshold: int = 1024 * 1024,
+    max_field_size: int = 1024 * 1024,
+    max_parts: int = 1000,
+    max_files: int = 100
+) -> Form:
+    """
+    Reads multipart/form-data or application/x-www-form-urlencoded form.
+
+    :param chunks: body chunks.
+    :param content_type: value of Content-Type header.
+    :param spool_threshold: how many bytes of file are kept in memory
+        before it's written to disk.
+    :param max_field_size: how many bytes text field can have.
+    :param max_parts: how many fields and files form can have.
+    :param max_files: how many files form can have.
+    :return: Form instance.
+    :raises HttpError: UnsupportedMediaType if body isn't form,
+        PayloadTooLarge if some field is too large or form has too many
+        parts or files, or BadRequest if body is malformed.
+    """
+    if get_media_type(content_type) == "application/x-www-form-urlencoded":
+        return await read_urlencoded_form(chunks, max_field_size, max_parts)
+
+    return await read_multipart_form(
+        make_multipart_reader(chunks, content_type),
+        spool_threshold,
+        max_field_size,
+        max_parts,
+        max_files
+    )
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import re
+from typing import NamedTuple, Optional, Union
+
+# Parameters of headers like Content-Disposition: name="value" or name=value
+header_parameter_regex = re.compile(
+    r';\s*([\w\-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^;]*))'
+)
+
+
+class PartHeaders(NamedTuple):
+    """
+    Headers of multipart part, with lower cased names.
+    """
+    headers: dict[str, str]
+
+    @property
+    def disposition_parameters(self) -> dict[str, str]:
+        return parse_header_parameters(
+            self.headers.get("content-disposition", "")
+        )
+
+
+class PartEnd:
+    """
+    Marker of end of multipart part.
+    """
+
+
+class FormEnd:
+    """
+    Marker of closing boundary of multipart body.
+    """
+
+
+PART_END = PartEnd()
+FORM_END = FormEnd()
+
+multipart_event = Union[PartHeaders, bytes, PartEnd, FormEnd]
+
+
+class MultipartParseError(ValueError):
+    """
+    Raised when multipart body is malformed.
+    """
+
+
+def parse_header_parameters(header_value: str) -> dict[str, str]:
+    """
+    Parses parameters of header like Content-Type or Content-Disposition.
+
+    :param header_value: value of header.
+    :return: dictionary of lower cased parameters names and their values.
+    """
+    parameters: dict[str, str] = {}
+    for name, quoted_value, value in header_parameter_regex.findall(
+        header_value
+    ):
+        if quoted_value:
+            value = re.sub(r"\\(.)", r"\1", quoted_value)
+
+        parameters[name.lower()] = value.strip()
+
+    return parameters
+
+
+def get_boundary(content_type: str) -> Optional[bytes]:
+    """
+    Gives boundary of multipart body.
+
+    :param content_type: value of Content-Type header.
+    :return: boundary bytes or None if there's no boundary.
+    """
+    boundary: Optional[str] = parse_header_parameters(content_type).get(
+        "boundary"
+    )
+    if not boundary or len(boundary) > 70:
+        return None
+
+    return boundary.encode("latin-1")
+
+
+class MultipartParser:
+    """
+    Incremental multipart/form-data parser. Body is fed in chunks of any
+    size, and parser gives events: PartHeaders when part starts, bytes of
+    its data, PART_END after its data and FORM_END at closing boundary.
+    Data is given out as soon as it can't be part of boundary, so parser
+    keeps no more than length of boundary between chunks.
+    """
+    # Parser states
+    preamble = 0
+    after_boundary = 1
+    headers = 2
+    data = 3
+    epilogue = 4
+
+    def __init__(self, boundary: bytes, max_headers_size: int = 16 * 1024):
+        """
+        :param boundary: boundary from Content-Type header.
+        :param max_headers_size: how many bytes headers of single part
+            can take.
+        """
+        self.max_headers_size: int = max_headers_size
+
+        self._first_boundary: bytes = b"--" + boundary
+        self._boundary: bytes = b"\r\n--" + boundary
+        self._buffer: bytes = b""
+        self._state: int = self.preamble
+
+    @property
+    def is_finished(self) -> bool:
+        return self._state == self.epilogue
+
+    def feed(self, chunk: bytes) -> list[multipart_event]:
+        """
+        Parses next chunk of body.
+
+        :param chunk: bytes of body.
+        :return: list of events found in data received so far.
+        :raises MultipartParseError: if body is malformed.
+        """
+        events: list[multipart_event] = []
+        buffer: bytes = self._buffer + chunk if self._buffer else chunk
+        position: int = 0
+
+        while True:
+            if self._state == self.data:
+                boundary_position: int = buffer.find(self._boundary, position)
+
+                if boundary_position == -1:
+                    # Tail can be beginning of boundary,
+                    # so it's kept until next chunk
+                    data_end: int = max(
+                        position, len(buffer) - len(self._boundary) + 1
+                    )
+                    if data_end > position:
+                        events.append(buffer[position:data_end])
+
+                    position = data_end
+                    break
+
+                if boundary_position > position:
+                    events.append(buffer[position:boundary_position])
+
+                events.append(PART_END)
+                position = boundary_position + len(self._boundary)
+                self._state = self.after_boundary
+
+            elif self._state == self.after_boundary:
+                if len(buffer) - position < 2:
+                    break
+
+                ending: bytes = buffer[position:position + 2]
+                if ending == b"--":
+                    events.append(FORM_END)
+                    self._state = self.epilogue
+
+                elif ending == b"\r\n":
+                    self._state = self.headers
+
+                else:
+                    raise MultipartParseError(
+                        "Boundary must be followed by CRLF or --"
+                    )
+
+                position += 2
+
+            elif self._state == self.headers:
+                if len(buffer) - position < 2:
+                    break
+
+                if buffer.startswith(b"\r\n", position):
+                    # Part has no headers, CRLF after boundary
+                    # is followed by empty line right away
+                    events.append(PartHeaders({}))
+                    position += 2
+                    self._state = self.data
+                    continue
+
+                headers_end: int = buffer.find(b"\r\n\r\n", position)
+                if headers_end == -1:
+                    if len(buffer) - position > self.max_headers_size:
+                        raise MultipartParseError("Part headers are too large")
+
+                    break
+
+                if headers_end - position > self.max_headers_size:
+                    raise MultipartParseError("Part headers are too large")
+
+                events.append(
+                    self._parse_headers(buffer[position:headers_end])
+                )
+                position = headers_end + 4
+                self._state = self.data
+
+            elif self._state == self.preamble:
+                boundary_position = buffer.find(self._first_boundary, position)
+                if boundary_position == -1:
+                    position = max(
+                        position, len(buffer) - len(self._first_boundary) + 1
+                    )
+                    break
+
+                position = boundary_position + len(self._first_boundary)
+                self._state = self.after_boundary
+
+            else:
+                # Epilogue is ignored
+                position = len(buffer)
+                break
+
+        self._buffer = buffer[position:]
+        return events
+
+    @staticmethod
+    def _parse_headers(raw_headers: bytes) -> PartHeaders:
+        """
+        Parses headers of part.
+
+        :param raw_headers: headers block without trailing empty line.
+        :return: PartHeaders instance.
+        :raises MultipartParseError: if some header has no colon.
+        """
+        headers: dict[str, str] = {}
+        for line in raw_headers.split(b"\r\n"):
+            name, separator, value = line.partition(b":")
+            if not separator:
+                raise MultipartParseError(f"Invalid part header: {line!r}")
+
+            headers[name.decode("latin-1").strip().lower()] = \
+                value.decode("utf-8", "replace").strip()
+
+        return PartHeaders(headers)
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import re
 from abc import ABC, abstractmethod
-from functools import cached_property
+from inspect import isclass
+from types import MemberDescriptorType
 from typing import (
     Any, Optional, Type,
     get_args, get_type_hints, get_origin,
     TYPE_CHECKING, Mapping
 )
-from urllib.parse import parse_qs
 
-from storm.headers import Headers
-from storm.internal_types import LocaleProbability, CustomCookie
+from storm.headers import RequestHeaders
+from storm.i18n import TranslationCatalog, parse_accept_language
+from storm.internal_types import (
+    LocaleProbability,
+    RequestCookies,
+    RequestQuery
+)
 from storm.internal_types.asgi import ASGIConnectionScope
 from storm.internal_types.asgi import ConnectionProperties
 from storm.internal_types.asgi import receive_typehint
@@ -20,74 +24,80 @@ from storm.request.parameters import (
     BaseRequestParameter,
     QueryParameter,
     CookieParameter,
+    FormParameter,
     URLParameter
 )
-from storm.request.parameters.url import compile_type_to_named_group
-from .utils import parse_parameter_typehint, ParameterProperties
+from .utils import (
+    compile_url,
+    parse_parameter_typehint,
+    ParameterProperties,
+    UrlArguments
+)
 from ._compiled_url_return import CompiledUrl
+from .parameters_binder import make_parameters_binder
+from .slotted import HandlerMeta, slot_cached_property
+from .preloaded_parameters import (
+    PreloadedParameters,
+    pop_preloaded_parameters
+)
 
 if TYPE_CHECKING:
     from storm.app import StormApp
 
 
-class StormBaseHandler(ABC):
+class StormBaseHandler(ABC, metaclass=HandlerMeta):
+    __slots__ = (
+        "app", "scope", "url", "request_origin_path", "headers",
+        "query_parameters", "logger", "_receive", "_parsed_arguments",
+        "_cookies", "_client", "_server", "_locale", "_translation"
+    )
+
     url: str
     is_static_url: bool = True
+    # Default values of parameters of slotted handlers
+    _slotted_defaults: dict[str, Any] = {}
 
     _query_parameters_properties: dict[str, ParameterProperties]
     _url_parameters_properties: dict[str, ParameterProperties]
     _cookies_properties: dict[str, ParameterProperties]
+    _form_parameters_properties: dict[str, ParameterProperties]
 
     def __init__(
         self,
         app: StormApp,
         scope: ASGIConnectionScope,
         receive: receive_typehint,
-        parsed_arguments: re.Match
+        parsed_arguments: UrlArguments
     ):
         self.app = app
         self.scope: ASGIConnectionScope = scope
         self.url: str = scope.path
         self.request_origin_path: str = scope.path
-        self.headers: Headers = Headers()
-        for header, values_str in scope.headers:
-            self.headers[header.decode('utf-8')] = values_str.decode('utf-8')
-
-        self.cookies: CustomCookie = CustomCookie()
-        self.cookies.load(
-            self.headers.get("Cookie", "")
+        self.headers: RequestHeaders = RequestHeaders(scope.headers)
+        self.query_parameters: RequestQuery = RequestQuery(
+            scope.query_string
         )
-        self.query_parameters: dict[str, list[str]] = {}
-
-        if scope.query_string is not None:
-            for key, values in parse_qs(
-                scope.query_string.decode("utf-8")
-            ).items():
-                assert (
-                    isinstance(key, str) and
-                    all([isinstance(value, str)for value in values])
-                ), (
-                    "After string was decoded parse_qs must only "
-                    "return strings."
-                )
-
-                self.query_parameters[
-                    key
-                ] = [v for v in values]
 
         self.logger = handler_logger
         self._receive: receive_typehint = receive
-        self._parsed_arguments: re.Match = parsed_arguments
+        self._parsed_arguments: UrlArguments = parsed_arguments
 
     @abstractmethod
     async def execute(self) -> Any:
-        self._init_query_parameters()
-        self._init_cookie_parameters()
-        self._init_url_parameters()
+        self._bind_parameters()
         # TODO: add init of injectables
         await self.prepare()
 
-    @cached_property
+    @slot_cached_property
+    def cookies(self) -> RequestCookies:
+        """
+        Return cookies that were sent with request. Cookies are looked up
+        only when they are accessed.
+        :return: RequestCookies instance.
+        """
+        return RequestCookies("; ".join(self.headers.get("Cookie", ())))
+
+    @slot_cached_property
     def client(self) -> ConnectionProperties:
         """
         Return connection information about connected client.
@@ -95,7 +105,7 @@ class StormBaseHandler(ABC):
         """
         return ConnectionProperties(*self.scope.client)
 
-    @cached_property
+    @slot_cached_property
     def server(self) -> ConnectionProperties:
         """
         Return connection information about server, to which request was made.
@@ -142,131 +152,117 @@ class StormBaseHandler(ABC):
         """
         return None
 
-    def get_browsers_locales(self, default: str = "en_US") -> list[LocaleProbability]:
+    def get_browsers_locales(
+        self, default: str = "en_US"
+    ) -> list[LocaleProbability]:
         """
         This method is used to fetch locales from requests headers.
+        Parsed headers are cached, so it's cheap to call on every request.
         :param default: default locale if none are found.
-        :return: list of named tuples, sorted by weight.
+        :return: list of named tuples, sorted by weight from the highest.
         """
-        # Based on tornado implementation:
-        # https://github.com/tornadoweb/tornado/blob/208672f3bf6cbb7e37f54c356e02a71ca29f1e02/tornado/web.py#L1279
-        if 'Accept-Language' not in self.headers:
-            return [LocaleProbability(default, 1.0)]
-
-        try:
-            languages = self.headers['Accept-Language'][0].split(',')
-
-        except IndexError:
-            return [LocaleProbability(default, 1.0)]
-
-        locales = []
-
-        for language in languages:
-            parts = language.strip().partition(";")
-            score = 0.0
-            if parts[1].startswith('q='):
-                try:
-                    score = float(parts[1][:2])
-
-                except (ValueError, TypeError):
-                    pass
-
-            else:
-                score = 1.0
-
-            locales.append(LocaleProbability(parts[0], score))
-
-        if locales:
-            locales.sort(key=lambda v: v.weight)
-            return locales
+        accept_language: Optional[str] = self.headers.get_first(
+            "Accept-Language"
+        )
+        if accept_language is not None:
+            locales: tuple[LocaleProbability, ...] = parse_accept_language(
+                accept_language
+            )
+            if locales:
+                return list(locales)
 
         return [LocaleProbability(default, 1.0)]
 
-    @property
-    def config(self) -> Mapping:
-        return self.app.config
-
-    def __init_subclass__(cls, **kwargs) -> None:
-        cls.is_static_url = True
-        cls._query_parameters_properties = {}
-        cls._url_parameters_properties = {}
-        cls._cookies_properties = {}
-
-        for attr_key, attr_value in get_type_hints(cls).items():
-            origin: Optional[Any] = get_origin(attr_value)
-
-            if isinstance(origin, BaseRequestParameter):
-                cls.__initialize_request_parameter(
-                    cls, origin, attr_key, attr_value
-                )
-
-    def _init_query_parameters(self) -> None:
+    @slot_cached_property
+    def locale(self) -> str:
         """
-        Initializes query parameters as attributes of handler.
-        :returns: nothing.
+        Gives locale of apps translations, that client wants the most
+        according to Accept-Language header.
+        :return: locale name.
+        :raises RuntimeError: if app has no translations.
         """
-        for attr_key, attr_properties in self. \
-                _query_parameters_properties.items():
+        if self.app.translations is None:
+            raise RuntimeError("App has no translations")
 
-            if attr_properties.is_optional:
-                attr_value: Any = self.query_parameters.get(
-                    attr_key,
-                    attr_properties.default_value
-                )
-
-            else:
-                attr_value = self.query_parameters[attr_key]
-
-            attr_value = attr_properties.casted_to_type(attr_value)
-            setattr(self, attr_key, attr_value)
+        return self.app.translations.negotiate_locale(
+            self.headers.get_first("Accept-Language", "")  # type: ignore
+        )
 
-    def _init_cookie_parameters(self) -> None:
+    @slot_cached_property
+    def translation(self) -> TranslationCatalog:
         """
-        Initializes received cookies as attributes of handler. Before
-        being assigned they are casted
-        :returns: nothing.
+        Gives catalog of translations for handlers locale.
+        :return: TranslationCatalog instance.
+        :raises RuntimeError: if app has no translations.
         """
-        for attr_key, attr_properties in self. \
-                _cookies_properties.items():
+        if self.app.translations is None:
+            raise RuntimeError("App has no translations")
 
-            try:
-                attr_value: Any = self.cookies[attr_key].value
+        return self.app.translations.get_catalog(self.locale)
 
-            except KeyError:
-                if attr_properties.is_optional:
-                    attr_value = attr_properties.default_value
+    def gettext(self, message: str) -> str:
+        """
+        Translates message to handlers locale.
+        :param message: message id.
+        :return: translated message.
+        """
+        return self.translation.gettext(message)
 
-                else:
-                    raise
+    @property
+    def config(self) -> Mapping:
+        return self.app.config
 
-            casted_value: type = attr_properties.casted_to_type(attr_value)
-            setattr(self, attr_key, casted_value)
+    def __init_subclass__(cls, **kwargs) -> None:
+        preloaded_parameters: Optional[PreloadedParameters] = \
+            pop_preloaded_parameters(cls)
+
+        if preloaded_parameters is not None:
+            # Parameters were loaded from compiled routing table
+            cls.is_static_url = preloaded_parameters.is_static_url
+            cls._query_parameters_properties = \
+                preloaded_parameters.query_parameters
+            cls._url_parameters_properties = \
+                preloaded_parameters.url_parameters
+            cls._cookies_properties = preloaded_parameters.cookies
+            cls._form_parameters_properties = \
+                preloaded_parameters.form_parameters
+
+        else:
+            cls.is_static_url = True
+            cls._query_parameters_properties = {}
+            cls._url_parameters_properties = {}
+            cls._cookies_properties = {}
+            cls._form_parameters_properties = {}
+
+            for attr_key, attr_value in get_type_hints(cls).items():
+                origin: Optional[Any] = get_origin(attr_value)
+
+                if isclass(origin) and \
+                        issubclass(origin, BaseRequestParameter):
+                    cls.__initialize_request_parameter(
+                        cls, origin, attr_key, attr_value
+                    )
+
+        cls._bind_parameters = make_parameters_binder(  # type: ignore
+            cls._query_parameters_properties,
+            cls._url_parameters_properties,
+            cls._cookies_properties,
+            cls._form_parameters_properties,
+            cls.__qualname__
+        )
 
-    def _init_url_parameters(self) -> None:
+    def _bind_parameters(self) -> None:
         """
-        Initializes query parameters as attributes of handler.
+        Sets query parameters, cookies and url parameters as attributes
+        of handler. Every subclass gets its own version of this method,
+        which is generated for its parameters.
         :returns: nothing.
         """
-        for attr_key, attr_properties in self. \
-                _url_parameters_properties.items():
-            try:
-                attr_value: Any = self._parsed_arguments.group(
-                    attr_key
-                )
-                attr_value = attr_properties.casted_to_type(attr_value)
-                setattr(self, attr_key, attr_value)
-
-            except IndexError as err:
-                raise KeyError(
-                    f"Group with name {attr_key} not found"
-                    f" in url parameters, but url was matched."
-                    f"(\n\tfound_parameters: {self._parsed_arguments}\n"
-                ) from err
 
     @staticmethod
     def __initialize_request_parameter(
         cls: Type[StormBaseHandler],
-        origin: BaseRequestParameter,
+        origin: Type[BaseRequestParameter],
         attr_key: str,
         attr_value: Any
     ) -> None:
@@ -291,23 +287,35 @@ class StormBaseHandler(ABC):
         parameter_typehint: tuple[Any, ...] = get_args(
             attr_value
         )
+        if len(parameter_typehint) != 1:
+            raise TypeError(
+                f"Request parameter {attr_key} of {cls.__name__} must "
+                "be type hinted with exactly one type argument."
+            )
+
         parameter_properties: ParameterProperties = \
             parse_parameter_typehint(
-                parameter_typehint
+                parameter_typehint[0]
             )
 
         if parameter_properties.is_optional:
-            parameter_properties.default_value = getattr(
-                cls, attr_key, None
-            )
+            default_value: Any = getattr(cls, attr_key, None)
+            if isinstance(default_value, MemberDescriptorType):
+                # Slotted handlers keep defaults apart from class body
+                default_value = cls._slotted_defaults.get(attr_key)
+
+            parameter_properties.default_value = default_value
 
-        if isinstance(origin, QueryParameter):
+        if issubclass(origin, QueryParameter):
             cls._query_parameters_properties[attr_key] = parameter_properties
 
-        elif isinstance(origin, CookieParameter):
+        elif issubclass(origin, CookieParameter):
             cls._cookies_properties[attr_key] = parameter_properties
 
-        elif isinstance(origin, URLParameter):
+        elif issubclass(origin, FormParameter):
+            cls._form_parameters_properties[attr_key] = parameter_properties
+
+        elif issubclass(origin, URLParameter):
             if parameter_properties.is_optional:
                 raise ValueError("URL parameters can not be optional")
 
@@ -326,62 +334,14 @@ class StormBaseHandler(ABC):
         :param cls: subclass of StormBaseHandler we are initializing.
         :return: re.compile output after manipulations and is url static.
         """
-        parameters_names_regex = re.compile(r"<(\w+)>")
-        parameters_names: set[str] = set(
-            parameters_names_regex.findall(
-                url
-            )
-        )
-
-        # Validating all names in url
-        invalid_names = []
-        for parameter_name in parameters_names:
-            if not parameter_name.isidentifier():
-                invalid_names.append(parameter_name)
-
-        if invalid_names:
-            raise KeyError(
-                f"Following url parameters are invalid "
-                f"in handler {cls.__name__}: {invalid_names}. "
-                f"All parameters names must be a valid python identifiers."
-            )
-
-        # We have to make sure all url parameters are used in url
-        url_params_difference = set(
-            cls._url_parameters_properties.keys()
-        ).difference(parameters_names)
-
-        if url_params_difference:
-            raise KeyError(
-                "Following url parameters aren't "
-                "represented in handlers url "
-                f"({url}):\n{url_params_difference}"
-            )
-
-        compiled_url = url
-        for parameter in parameters_names:
-            url_parameters_properties: Optional[ParameterProperties] = \
-                cls._url_parameters_properties.get(
-                    parameter
-                )
-
-            if url_parameters_properties is None:
-                continue
-
-            compiled_url = re.sub(
-                r"<%s>" % parameter, compiled_url,
-                compile_type_to_named_group(
-                    parameter,
-                    url_parameters_properties.casted_to_type
-                )
-            )
-
-        has_url_parameters = bool(cls._url_parameters_properties)
-        compiled_url_regex = re.compile(compiled_url)
-        return CompiledUrl(
-            url_pattern=compiled_url_regex,
-            is_static_url=has_url_parameters
+        return compile_url(
+            url,
+            {
+                name: properties.casted_to_type
+                for name, properties in cls._url_parameters_properties.items()
+            },
+            cls.__name__
         )
 
     def __str__(self):
-        return f"{self.__name__} on url {self.url}"
+        return f"{type(self).__name__} on url {self.url}"
@@ -1,36 +1,290 @@
-import re
-from functools import lru_cache
-from typing import TYPE_CHECKING
+from __future__ import annotations
 
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Any, Awaitable,
+    Callable, Mapping, Optional
+)
+
+from storm.headers import Headers
 from storm.internal_types.asgi import HttpASGIConnectionScope, receive_typehint
-from storm.responses import BaseHttpResponse
+from storm.request.decoders import (
+    BaseRequestDecoder,
+    JsonDecoder,
+    find_decoder,
+    get_default_decoders
+)
+from storm.request.form import (
+    Form,
+    MultipartReader,
+    is_form_media_type,
+    make_multipart_reader,
+    read_form
+)
+from storm.request.request_body import RequestBody
+from storm.responses import BaseHttpResponse, EncodedResponse
+from storm.responses.encoders import (
+    BaseResponseEncoder,
+    ContentNegotiator,
+    get_default_encoders
+)
 from .base_request_handler import StormBaseHandler
+from .slotted import slot_cached_property
+from .utils import UrlArguments
 from ...responses.http import http_errors
 
 if TYPE_CHECKING:
     from storm.app import StormApp
 
+http_method_coroutine = Callable[..., Awaitable[BaseHttpResponse]]
+
+# Marks body that wasn't decoded yet, since decoded body can be None
+_not_decoded = object()
+
 
 class HttpHandler(StormBaseHandler):
+    __slots__ = ("_form", "_json", "_decoded_body", "_body")
+
     scope: HttpASGIConnectionScope
     supported_methods = {
         "GET", "POST", "DELETE",
         "PATCH", "PUT", "OPTIONS"
     }
 
+    # How many bytes requests body can have, None disables limit
+    max_body_size: Optional[int] = 10 * 1024 * 1024
+    # How many bytes spooled body keeps in memory before writing it to disk
+    body_spool_threshold: int = 1024 * 1024
+    # How many bytes text field of form can have
+    max_form_field_size: int = 1024 * 1024
+    # How many fields and files form can have
+    max_form_parts: int = 1000
+    # How many files multipart form can have
+    max_form_files: int = 100
+
+    json_decoder: BaseRequestDecoder = JsonDecoder()
+    # Decoders of bodies chosen by Content-Type header
+    request_decoders: tuple[BaseRequestDecoder, ...] = tuple(
+        get_default_decoders()
+    )
+    # Chooses encoder of responses by Accept header
+    response_negotiator: ContentNegotiator = ContentNegotiator(
+        get_default_encoders()
+    )
+
+    # Only methods that are implemented by handler, built once per class
+    _methods: Mapping[str, http_method_coroutine] = MappingProxyType({})
+    _method_not_allowed_response: BaseHttpResponse
+
     def __init__(
         self,
         app: StormApp,
         scope: HttpASGIConnectionScope,
         receive: receive_typehint,
-        parsed_arguments: re.Match
+        parsed_arguments: UrlArguments
     ):
         super().__init__(app, scope, receive, parsed_arguments)
+        self._form: Optional[Form] = None
+        self._json: Any = _not_decoded
+        self._decoded_body: Any = _not_decoded
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        methods: dict[str, http_method_coroutine] = {}
+        for http_method in cls.supported_methods:
+            method_name: str = http_method.lower()
+            # Custom methods, like PROPFIND, may have no coroutine
+            # in handler or in its bases
+            method: Optional[http_method_coroutine] = getattr(
+                cls, method_name, None
+            )
+            if method is not None and \
+                    method is not getattr(HttpHandler, method_name, None):
+                methods[http_method] = method
+
+        # HEAD is answered with GET, but body is never sent
+        if "GET" in methods:
+            methods["HEAD"] = methods["GET"]
+
+        cls._methods = MappingProxyType(methods)
+
+        allow_headers = Headers()
+        allow_headers["Allow"] = ", ".join(sorted(methods))
+        cls._method_not_allowed_response = http_errors.PrebuiltHttpError(
+            405, "Method not allowed", allow_headers
+        )
+
+    @slot_cached_property
+    def body(self) -> RequestBody:
+        """
+        Gives body of request, that is received only when it's read.
+        :return: RequestBody instance.
+        """
+        content_length: Optional[str] = self.headers.get_first(
+            "Content-Length"
+        )
+        return RequestBody(
+            self._receive,
+            max_size=self.max_body_size,
+            spool_threshold=self.body_spool_threshold,
+            content_length=int(content_length)
+            if content_length is not None and content_length.isdigit()
+            else None
+        )
+
+    async def form(self) -> Form:
+        """
+        Reads multipart/form-data or application/x-www-form-urlencoded
+        form from body while it's received. Uploaded files are kept in
+        memory until they are larger than body_spool_threshold.
+        :return: Form instance.
+        :raises HttpError: UnsupportedMediaType if body isn't form,
+            PayloadTooLarge if body or some field is too large or form
+            has too many parts, or BadRequest if body is malformed.
+        """
+        if self._form is None:
+            self._form = await read_form(
+                self.body.iter_chunks(),
+                self.headers.get_first("Content-Type", ""),  # type: ignore
+                spool_threshold=self.body_spool_threshold,
+                max_field_size=self.max_form_field_size,
+                max_parts=self.max_form_parts,
+                max_files=self.max_form_files
+            )
+
+        return self._form
+
+    async def json(self) -> Any:
+        """
+        Reads body and decodes it as JSON. Body is decoded only once,
+        and following calls give the same data.
+        :return: decoded data.
+        :raises HttpError: BadRequest if body isn't valid JSON,
+            or PayloadTooLarge if body is too large.
+        """
+        if self._json is _not_decoded:
+            body: bytes = await self.body.read()
+            try:
+                self._json = self.json_decoder.decode(body)
+
+            except ValueError as err:
+                raise http_errors.BadRequest(
+                    message="Malformed JSON body"
+                ) from err
+
+        return self._json
+
+    async def decoded_body(self) -> Any:
+        """
+        Reads body and decodes it by decoder from request_decoders, that
+        understands its Content-Type. Body is decoded only once.
+        :return: decoded data.
+        :raises HttpError: UnsupportedMediaType if no decoder understands
+            body, BadRequest if body is malformed,
+            or PayloadTooLarge if body is too large.
+        """
+        if self._decoded_body is _not_decoded:
+            decoder: Optional[BaseRequestDecoder] = find_decoder(
+                self.request_decoders,
+                self.headers.get_first("Content-Type", "")  # type: ignore
+            )
+            if decoder is None:
+                raise http_errors.UnsupportedMediaType()
+
+            body: bytes = await self.body.read()
+            try:
+                self._decoded_body = decoder.decode(body)
+
+            except ValueError as err:
+                raise http_errors.BadRequest(
+                    message="Malformed body"
+                ) from err
+
+        return self._decoded_body
+
+    def negotiate_encoder(self) -> Optional[BaseResponseEncoder]:
+        """
+        Chooses encoder of response by Accept header.
+        :return: encoder or None if client accepts none of them.
+        """
+        return self.response_negotiator.choose_encoder(
+            self.headers.get_first("Accept", "")  # type: ignore
+        )
+
+    def respond(
+        self,
+        data: Any,
+        status: int = 200,
+        headers: Optional[Headers] = None
+    ) -> EncodedResponse:
+        """
+        Makes response which data is encoded in format client asked for.
+        :param data: data to encode.
+        :param status: status of response.
+        :param headers: headers of response.
+        :return: EncodedResponse instance.
+        :raises HttpError: NotAcceptable if client accepts none
+            of the formats.
+        """
+        response_encoder: Optional[BaseResponseEncoder] = \
+            self.negotiate_encoder()
+        if response_encoder is None:
+            raise http_errors.NotAcceptable()
+
+        return EncodedResponse(data, response_encoder, status, headers)
+
+    def _encode_error(
+        self,
+        http_err: http_errors.HttpError
+    ) -> http_errors.HttpError:
+        """
+        Gives error, which message is encoded in format client accepts.
+        Errors own encoder is kept if client accepts it.
+        :param http_err: some error.
+        :return: the same error or its copy with other encoder.
+        """
+        accept: str = self.headers.get_first("Accept", "")  # type: ignore
+        if ContentNegotiator.is_acceptable(http_err.response_encoder, accept):
+            return http_err
+
+        response_encoder: Optional[BaseResponseEncoder] = \
+            self.response_negotiator.choose_encoder(accept)
+        if response_encoder is None:
+            return http_err
+
+        return http_err.with_encoder(response_encoder)
+
+    def form_parts(self) -> MultipartReader:
+        """
+        Gives parts of multipart/form-data body, which can be read
+        as streams while body is received.
+
+        .. code-block:: python
+
+            async for part in self.form_parts():
+                async for chunk in part:
+                    ...
+
+        :return: MultipartReader instance.
+        :raises HttpError: UnsupportedMediaType if body isn't multipart
+            form, or BadRequest if it has no boundary.
+        """
+        return make_multipart_reader(
+            self.body.iter_chunks(),
+            self.headers.get_first("Content-Type", "")  # type: ignore
+        )
+
+    def close_body(self) -> None:
+        """
+        Frees resources taken by body, like spooled temporary files.
+        :return: nothing.
+        """
+        if HttpHandler.body.is_computed(self):
+            self.body.close()
 
-    @staticmethod
-    @lru_cache(maxsize=256)
-    def http_method_to_python_method(http_method_name: str) -> str:
-        return http_method_name.lower()
+        if self._form is not None:
+            self._form.close()
 
     @property
     def default_not_implemented_response(self) -> BaseHttpResponse:
@@ -42,24 +296,37 @@ class HttpHandler(StormBaseHandler):
         return http_errors.NotImplementedHTTP()
 
     async def execute(self) -> BaseHttpResponse:
-        await super().execute()
-        python_method_name: str = self.http_method_to_python_method(
-            self.scope.method
-        )
-        method = getattr(self, python_method_name, None)
+        method = self._methods.get(self.scope.method)
 
         if method is None:
+            if self.scope.method in self.supported_methods or \
+                    self.scope.method == "HEAD":
+                return self._method_not_allowed_response
+
             return self.default_not_implemented_response
 
-        # TODO: handle method isn't implemented
         try:
-            return await method()
+            # Form is read only if it's sent, so optional form parameters
+            # get their defaults and required ones are reported as missing
+            if self._form_parameters_properties and is_form_media_type(
+                self.headers.get_first("Content-Type", "")  # type: ignore
+            ):
+                await self.form()
+
+            # Binding parameters and prepare can reject request
+            await super().execute()
+
+        except http_errors.HttpError as http_err:
+            return self._encode_error(http_err)
+
+        try:
+            return await method(self)
 
         except NotImplementedError:
             return self.default_not_implemented_response
 
         except http_errors.HttpError as http_err:
-            return http_err
+            return self._encode_error(http_err)
 
         except Exception as unhandled_error:
             return await self.on_unexpected_error(unhandled_error)
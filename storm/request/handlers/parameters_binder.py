@@ -0,0 +1,205 @@
+"""
+Generates functions that set request parameters as attributes of handler.
+Every handler class gets function with casts, defaults and checks of its
+own parameters written out one by one, so binding doesn't iterate over
+parameters properties on every request.
+"""
+from typing import Any, Callable
+
+from storm.request.parameters.url import get_url_parameter_converter
+from storm.responses.http import http_errors
+from .utils import ParameterProperties
+
+parameters_binder = Callable[[Any], None]
+
+
+def _make_missing_value_lines(
+    name: str,
+    properties: ParameterProperties,
+    default_name: str,
+    namespace: dict[str, Any],
+    parameter_kind: str
+) -> list[str]:
+    """
+    Makes lines that handle parameter which wasn't sent.
+
+    :param name: parameters name.
+    :param properties: parameters properties.
+    :param default_name: name under which default value is put in namespace.
+    :param namespace: globals of generated function.
+    :param parameter_kind: what parameter is, used in message of error.
+    :return: lines of code, indented to be inside of if statement.
+    """
+    if properties.is_optional:
+        namespace[default_name] = properties.default_value
+        return [f"        self.{name} = {default_name}"]
+
+    message: str = f"{parameter_kind} {name} is required"
+    return [f"        raise _bad_request(message={message!r})"]
+
+
+def _make_cast_lines(
+    name: str,
+    cast_name: str,
+    value_expression: str,
+    parameter_kind: str
+) -> list[str]:
+    """
+    Makes lines that cast sent value of parameter.
+
+    :param name: parameters name.
+    :param cast_name: name of cast function in namespace.
+    :param value_expression: expression that gives sent value.
+    :param parameter_kind: what parameter is, used in message of error.
+    :return: lines of code, indented to be inside of else statement.
+    """
+    message: str = f"{parameter_kind} {name} has invalid value"
+    return [
+        "        try:",
+        f"            self.{name} = {cast_name}({value_expression})",
+        "        except (TypeError, ValueError) as err:",
+        f"            raise _bad_request(message={message!r}) from err",
+    ]
+
+
+def make_parameters_binder(
+    query_parameters: dict[str, ParameterProperties],
+    url_parameters: dict[str, ParameterProperties],
+    cookies: dict[str, ParameterProperties],
+    form_parameters: dict[str, ParameterProperties],
+    owner_name: str
+) -> parameters_binder:
+    """
+    Generates function that sets request parameters as attributes
+    of handler. If parameter is sent several times in query or form, its
+    last value is used. Form must be read into handlers _form before
+    binding, if body of request is form. Url parameters are parsed by
+    converters of their types. Default values of optional parameters are
+    set without being cast. Missing required parameters and values that
+    can't be cast make function raise BadRequest. Url parameters, which
+    converters can't parse, make it raise NotFound.
+
+    :param query_parameters: properties of query parameters.
+    :param url_parameters: properties of url parameters.
+    :param cookies: properties of cookies.
+    :param form_parameters: properties of form fields.
+    :param owner_name: name of handler, that function is made for.
+    :return: function that takes handler instance and returns nothing.
+    :raises ValueError: if some parameters name isn't valid identifier.
+    """
+    namespace: dict[str, Any] = {
+        "_bad_request": http_errors.BadRequest,
+        "_not_found": http_errors.NotFound
+    }
+    lines: list[str] = ["def bind_parameters(self):"]
+
+    invalid_names: list[str] = [
+        name
+        for name in (
+            *query_parameters, *url_parameters, *cookies, *form_parameters
+        )
+        if not name.isidentifier()
+    ]
+    if invalid_names:
+        raise ValueError(
+            f"Request parameters names of {owner_name} must be valid "
+            f"identifiers: {invalid_names}"
+        )
+
+    if query_parameters:
+        namespace["_query_names"] = frozenset(query_parameters)
+        lines.append("    query = self.query_parameters.select(_query_names)")
+
+    for index, (name, properties) in enumerate(query_parameters.items()):
+        namespace[f"_query_cast_{index}"] = properties.casted_to_type
+        lines.extend([
+            f"    values = query.get({name!r})",
+            "    if values is None:",
+            *_make_missing_value_lines(
+                name, properties, f"_query_default_{index}", namespace,
+                "Query parameter"
+            ),
+            "    else:",
+            *_make_cast_lines(
+                name, f"_query_cast_{index}", "values[-1]", "Query parameter"
+            ),
+        ])
+
+    if cookies:
+        lines.append("    cookies = self.cookies")
+
+    for index, (name, properties) in enumerate(cookies.items()):
+        namespace[f"_cookie_cast_{index}"] = properties.casted_to_type
+        lines.extend([
+            f"    value = cookies.get({name!r})",
+            "    if value is None:",
+            *_make_missing_value_lines(
+                name, properties, f"_cookie_default_{index}", namespace,
+                "Cookie"
+            ),
+            "    else:",
+            *_make_cast_lines(
+                name, f"_cookie_cast_{index}", "value", "Cookie"
+            ),
+        ])
+
+    if form_parameters:
+        # Form isn't read for bodies that aren't forms
+        namespace["_no_form_fields"] = {}
+        lines.append(
+            "    form = _no_form_fields if self._form is None "
+            "else self._form.fields"
+        )
+
+    for index, (name, properties) in enumerate(form_parameters.items()):
+        namespace[f"_form_cast_{index}"] = properties.casted_to_type
+        lines.extend([
+            f"    values = form.get({name!r})",
+            "    if values is None:",
+            *_make_missing_value_lines(
+                name, properties, f"_form_default_{index}", namespace,
+                "Form field"
+            ),
+            "    else:",
+            *_make_cast_lines(
+                name, f"_form_cast_{index}", "values[-1]", "Form field"
+            ),
+        ])
+
+    if url_parameters:
+        lines.append("    arguments = self._parsed_arguments")
+
+    for index, (name, properties) in enumerate(url_parameters.items()):
+        namespace[f"_url_cast_{index}"] = get_url_parameter_converter(
+            properties.casted_to_type
+        ).parse
+        namespace[f"_url_error_{index}"] = (
+            f"Group with name {name} not found in url parameters, "
+            "but url was matched. (found parameters: {})"
+        )
+        lines.extend([
+            "    try:",
+            f"        value = arguments.group({name!r})",
+            "    except IndexError as err:",
+            f"        raise KeyError(_url_error_{index}.format(arguments))"
+            " from err",
+            "    try:",
+            f"        self.{name} = _url_cast_{index}(value)",
+            "    except (TypeError, ValueError) as err:",
+            # Url matched regex of type, but doesn't name valid value,
+            # like 2024-13-45 for date
+            "        raise _not_found() from err",
+        ])
+
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    exec(
+        compile(
+            "\n".join(lines), f"<parameters binder of {owner_name}>", "exec"
+        ),
+        namespace
+    )
+    binder: parameters_binder = namespace["bind_parameters"]
+    binder.__qualname__ = f"{owner_name}._bind_parameters"
+    return binder
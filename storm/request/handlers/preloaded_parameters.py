@@ -0,0 +1,66 @@
+"""
+Request parameters of handlers that were loaded from compiled routing table
+before handlers were imported. When handler class is created, its parameters
+are taken from here instead of inspecting type hints.
+"""
+from typing import NamedTuple, Optional
+
+from .utils import ParameterProperties
+
+
+class PreloadedParameters(NamedTuple):
+    is_static_url: bool
+    query_parameters: dict[str, ParameterProperties]
+    url_parameters: dict[str, ParameterProperties]
+    cookies: dict[str, ParameterProperties]
+    form_parameters: dict[str, ParameterProperties] = {}
+
+
+_preloaded_parameters: dict[str, PreloadedParameters] = {}
+
+
+def get_handler_path(handler: type) -> str:
+    """
+    Gives path by which handler class can be imported.
+
+    :param handler: handler class.
+    :return: string like "package.module:ClassName".
+    """
+    return f"{handler.__module__}:{handler.__qualname__}"
+
+
+def preload_parameters(
+    handler_path: str,
+    parameters: PreloadedParameters
+) -> None:
+    """
+    Stores parameters of handler that isn't imported yet.
+
+    :param handler_path: path of handler class.
+    :param parameters: handlers request parameters.
+    :return: nothing.
+    """
+    _preloaded_parameters[handler_path] = parameters
+
+
+def pop_preloaded_parameters(
+    handler: type
+) -> Optional[PreloadedParameters]:
+    """
+    Gives parameters that were preloaded for handler once.
+
+    :param handler: handler class that is being created.
+    :return: preloaded parameters or None if there are none.
+    """
+    return _preloaded_parameters.pop(get_handler_path(handler), None)
+
+
+def discard_preloaded_parameters(handler_path: str) -> None:
+    """
+    Forgets parameters of handler, that weren't taken by it, like when
+    handler was imported before they were preloaded.
+
+    :param handler_path: path of handler class.
+    :return: nothing.
+    """
+    _preloaded_parameters.pop(handler_path, None)
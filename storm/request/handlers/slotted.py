@@ -0,0 +1,155 @@
+"""
+Support of slotted handlers. Handler declared as
+
+.. code-block:: python
+
+    class ItemHandler(HttpHandler, slotted=True):
+        item_id: URLParameter[int]
+        page: QueryParameter[Optional[int]] = 1
+
+gets __slots__ for its request parameters, so its instances have
+no __dict__ and take less memory while request is processed.
+"""
+from __future__ import annotations
+
+import sys
+from abc import ABCMeta
+from inspect import isclass
+from typing import Any, Callable, Generic, Optional, TypeVar, get_origin
+
+from storm.request.parameters import BaseRequestParameter
+
+T = TypeVar("T")
+
+
+class slot_cached_property(Generic[T]):
+    """
+    Works like functools.cached_property, but keeps computed value in slot
+    named as property with leading underscore, so it works for classes
+    without __dict__. Owner must declare that slot.
+    """
+
+    def __init__(self, func: Callable[[Any], T]):
+        self.func: Callable[[Any], T] = func
+        self.slot_name: str = f"_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot_name = f"_{name}"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot_name)
+
+        except AttributeError:
+            value: T = self.func(instance)
+            setattr(instance, self.slot_name, value)
+            return value
+
+    def is_computed(self, instance: Any) -> bool:
+        """
+        Checks if value was already computed for instance.
+
+        :param instance: instance of owner.
+        :return: is value cached.
+        """
+        return hasattr(instance, self.slot_name)
+
+
+def is_request_parameter_hint(
+    hint: Any,
+    namespace: dict[str, Any]
+) -> bool:
+    """
+    Checks if type hint declares request parameter. String type hints are
+    evaluated in module of class, that is being created.
+
+    :param hint: type hint from class body.
+    :param namespace: namespace of class body.
+    :return: is hint like QueryParameter[int].
+    """
+    if isinstance(hint, str):
+        module = sys.modules.get(namespace.get("__module__", ""))
+        try:
+            hint = eval(hint, getattr(module, "__dict__", {}), namespace)
+
+        except Exception:
+            return False
+
+    origin: Any = get_origin(hint)
+    return isclass(origin) and issubclass(origin, BaseRequestParameter)
+
+
+def get_parameters_names(bases: tuple[type, ...]) -> set[str]:
+    """
+    Gives names of request parameters, that bases of handler have.
+
+    :param bases: bases of class, that is being created.
+    :return: set of parameters names.
+    """
+    return {
+        name
+        for base in bases
+        for properties_name in (
+            "_query_parameters_properties", "_url_parameters_properties",
+            "_cookies_properties", "_form_parameters_properties"
+        )
+        for name in getattr(base, properties_name, {})
+    }
+
+
+class HandlerMeta(ABCMeta):
+    """
+    Metaclass of handlers, that makes __slots__ for request parameters
+    of handlers declared with slotted=True. Default values of optional
+    parameters are moved from class body into _slotted_defaults, since
+    slots can't have class level values.
+    """
+
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        slotted: bool = False,
+        **kwargs: Any
+    ):
+        if slotted:
+            namespace = dict(namespace)
+            inherited_slots: set[str] = {
+                slot
+                for base in bases
+                for klass in base.__mro__
+                for slot in getattr(klass, "__slots__", ())
+            }
+            slots: list[str] = list(namespace.get("__slots__", ()))
+            defaults: dict[str, Any] = {}
+            for base in reversed(bases):
+                defaults.update(getattr(base, "_slotted_defaults", {}))
+
+            for attr_name, hint in namespace.get(
+                "__annotations__", {}
+            ).items():
+                if attr_name in slots or \
+                        not is_request_parameter_hint(hint, namespace):
+                    continue
+
+                if attr_name not in inherited_slots:
+                    slots.append(attr_name)
+
+                if attr_name in namespace:
+                    defaults[attr_name] = namespace.pop(attr_name)
+
+            # Defaults of inherited parameters can be given without type
+            # hint. Left in class body, they would hide slots of bases.
+            for attr_name in get_parameters_names(bases) & inherited_slots:
+                if attr_name in namespace:
+                    defaults[attr_name] = namespace.pop(attr_name)
+
+            namespace["__slots__"] = tuple(slots)
+            namespace["_slotted_defaults"] = defaults
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
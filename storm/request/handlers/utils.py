@@ -1,30 +1,31 @@
+import re
 from dataclasses import dataclass
 from inspect import isclass
 from typing import (
-    Any, Optional,
+    Any, Mapping, Optional,
     get_origin, get_args, Union
 )
 
+from storm.request.parameters.url import compile_type_to_named_group
+from ._compiled_url_return import CompiledUrl
+
 
 @dataclass
 class ParameterProperties:
     """
     Class for storing properties of some request parameter.
     """
+    __slots__ = ("is_optional", "casted_to_type", "default_value")
+
     is_optional: bool
     casted_to_type: Any
-    default_value: Optional[Any] = None
+    default_value: Optional[Any]
 
 
 def is_union_representing_optional(unions_args: tuple[Any, ...]) -> bool:
-    return len(unions_args) == 2 and any(
-        # Here we check that we got exactly one None arg, and one not None arg
-        # so it is optional type hint.
-        (
-            (arg is not None for arg in unions_args),
-            (arg is None for arg in unions_args)
-        )
-    )
+    # Here we check that we got exactly one None arg, and one not None arg
+    # so it is optional type hint.
+    return len(unions_args) == 2 and unions_args.count(type(None)) == 1
 
 
 def get_original_type_from_optional(*args: Any) -> Any:
@@ -33,7 +34,7 @@ def get_original_type_from_optional(*args: Any) -> Any:
     :return: some type that is not none in union
     """
     unions_args: tuple[type, ...] = args[:2]
-    if unions_args[0] is not None:
+    if unions_args[0] is not type(None):
         return unions_args[0]
 
     else:
@@ -69,7 +70,7 @@ def parse_parameter_typehint(
         else:
             is_optional = True
             casted_to_type = get_original_type_from_optional(
-                union_args
+                *union_args
             )
 
     elif isclass(request_parameter_type_hint):
@@ -83,5 +84,109 @@ def parse_parameter_typehint(
 
     return ParameterProperties(
         is_optional=is_optional,
-        casted_to_type=casted_to_type
+        casted_to_type=casted_to_type,
+        default_value=None
+    )
+
+
+def compile_url(
+    url: str,
+    url_parameters_types: Mapping[str, type],
+    owner_name: str
+) -> CompiledUrl:
+    """
+    Compiles url into url_regex that will be used when looking
+    for a route based on url parameters types.
+
+    :param url: url with parameters written as <name>.
+    :param url_parameters_types: types of url parameters by their names.
+    :param owner_name: name of handler, which url is compiled
+        (used in errors).
+    :return: re.compile output after manipulations and is url static.
+    :raises KeyError: if url parameters names are invalid, or some
+        parameters aren't represented in url.
+    """
+    parameters_names_regex = re.compile(r"<(\w+)>")
+    parameters_names: set[str] = set(
+        parameters_names_regex.findall(
+            url
+        )
+    )
+
+    # Validating all names in url
+    invalid_names = []
+    for parameter_name in parameters_names:
+        if not parameter_name.isidentifier():
+            invalid_names.append(parameter_name)
+
+    if invalid_names:
+        raise KeyError(
+            f"Following url parameters are invalid "
+            f"in handler {owner_name}: {invalid_names}. "
+            f"All parameters names must be a valid python identifiers."
+        )
+
+    # We have to make sure all url parameters are used in url
+    url_params_difference = set(
+        url_parameters_types.keys()
+    ).difference(parameters_names)
+
+    if url_params_difference:
+        raise KeyError(
+            "Following url parameters aren't "
+            "represented in handlers url "
+            f"({url}):\n{url_params_difference}"
+        )
+
+    # Literal parts of url are escaped, so static urls are
+    # matched exactly as they were written
+    compiled_url_parts: list[str] = []
+    for index, part in enumerate(parameters_names_regex.split(url)):
+        if index % 2 == 0:
+            compiled_url_parts.append(re.escape(part))
+            continue
+
+        url_parameter_type: Optional[type] = url_parameters_types.get(
+            part
+        )
+
+        if url_parameter_type is None:
+            compiled_url_parts.append(re.escape(f"<{part}>"))
+            continue
+
+        compiled_url_parts.append(
+            compile_type_to_named_group(part, url_parameter_type)
+        )
+
+    has_url_parameters = bool(url_parameters_types)
+    compiled_url_regex = re.compile("".join(compiled_url_parts))
+    return CompiledUrl(
+        url_pattern=compiled_url_regex,
+        is_static_url=not has_url_parameters
     )
+
+
+class MatchedArguments(dict):
+    """
+    Url parameters, found by routers that don't match whole url with
+    single regex. Mimics re.Match.group, so handlers can initialize
+    url parameters the same way with any router.
+    """
+    __slots__ = ()
+
+    def group(self, name: str) -> str:
+        """
+        Gives url parameters value by its name.
+
+        :param name: url parameters name.
+        :return: string that was matched for that parameter.
+        :raises IndexError: if there's no parameter with that name.
+        """
+        try:
+            return self[name]
+
+        except KeyError as err:
+            raise IndexError(f"No such group: {name}") from err
+
+
+UrlArguments = Union[re.Match, MatchedArguments]
@@ -2,4 +2,4 @@ from .base_request_handler import StormBaseHandler
 
 
 class WebSocketHandler(StormBaseHandler):
-    pass
\ No newline at end of file
+    __slots__ = ()
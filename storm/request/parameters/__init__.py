@@ -1,4 +1,5 @@
 from .base_request_parameter import BaseRequestParameter
 from .cookie import CookieParameter
+from .form import FormParameter
 from .query import QueryParameter
 from .url import URLParameter, CompilableUrlParameter
@@ -1,7 +1,7 @@
-from .base_request_parameter import BaseRequestParameter
+from .base_request_parameter import BaseRequestParameter, ParameterType
 
 
-class CookieParameter(BaseRequestParameter):
+class CookieParameter(BaseRequestParameter[ParameterType]):
     """
     Class for treating request cookies as attributes
     with specific types. Name of type hinted argument will match cookie
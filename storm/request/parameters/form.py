@@ -0,0 +1,31 @@
+from .base_request_parameter import BaseRequestParameter, ParameterType
+
+
+class FormParameter(BaseRequestParameter[ParameterType]):
+    """
+    Class for treating text fields of request form as attributes
+    with specific types. Name of type hinted argument will match fields
+    name. Form is read before parameters are set, and it's supported
+    only by http handlers.
+
+    Examples:
+
+    .. code-block:: python
+
+        class A(HttpHandler):
+            q: FormParameter[int]
+
+            def post(self):
+                print(type(self.q))  # int
+
+    .. code-block:: python
+
+        class A(HttpHandler):
+            q: FormParameter[typing.Optional[int]] = 1
+
+            def post(self):
+                # If we got no value in form - we will get default
+                # as value of 1.
+                # If default isn't provided - there will be None.
+                print(self.q)  # 1
+    """
@@ -1,7 +1,7 @@
-from .base_request_parameter import BaseRequestParameter
+from .base_request_parameter import BaseRequestParameter, ParameterType
 
 
-class QueryParameter(BaseRequestParameter):
+class QueryParameter(BaseRequestParameter[ParameterType]):
     """
     Class for treating request query arguments as attributes
     with specific types. Name of type hinted argument will match query
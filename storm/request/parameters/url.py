@@ -1,15 +1,23 @@
 from datetime import datetime, date, time
+from functools import lru_cache
 from pathlib import Path
-from typing import Type, Protocol, runtime_checkable
+from typing import (
+    Any, Callable, NamedTuple, Type,
+    Protocol, Union, runtime_checkable
+)
 from uuid import UUID
 
-from .base_request_parameter import BaseRequestParameter
+from .base_request_parameter import BaseRequestParameter, ParameterType
 
 
 @runtime_checkable
 class CompilableUrlParameter(Protocol):
     """
     Protocol for unsupported by default types.
+
+    Types can also define static method __parse_url_parameter__, which
+    takes matched string and returns value of type. If it's not defined,
+    type is called with matched string.
     """
 
     @staticmethod
@@ -21,7 +29,7 @@ class CompilableUrlParameter(Protocol):
         pass
 
 
-class URLParameter(BaseRequestParameter):
+class URLParameter(BaseRequestParameter[ParameterType]):
     """
     Class that is used to represent url parameters as handlers attribute.
     All names of parameters will be matched to groups names, specified in
@@ -39,50 +47,131 @@ class URLParameter(BaseRequestParameter):
     """
 
 
-def compile_type_to_regex(
-    type_to_compile: type
-) -> str:
+class UrlParameterConverter(NamedTuple):
     """
-    Compiles some type into a regex, that will represent it in url,
-    and later will be used to unpack url params. Be default following types
+    Regex that url parameter of some type is matched with, and function
+    that makes value of that type from matched string.
+    """
+    regex: str
+    parse: Callable[[str], Any]
+
+
+def parse_bool(value: str) -> bool:
+    return value == "true" or value == "1"
+
+
+def make_iso_format_parser(
+    type_to_parse: Type[Union[datetime, date, time]]
+) -> Callable[[str], Any]:
+    """
+    Makes function that parses datetime, date or time from ISO 8601 string.
+
+    :param type_to_parse: datetime, date, time or their subclass.
+    :return: function that takes string and returns instance of type.
+    """
+    from_iso_format: Callable[[str], Any] = type_to_parse.fromisoformat
+
+    def parse_iso_format(value: str) -> Any:
+        # fromisoformat understands "Z" only since python 3.11
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+
+        return from_iso_format(value)
+
+    return parse_iso_format
+
+
+# Regexes of time parts, that are used to make converters of datetime types.
+# Fractions of seconds have 3 or 6 digits, since only those are understood
+# by fromisoformat before python 3.11
+_time_regex: str = (
+    r"\d{2}:\d{2}(?::\d{2}(?:\.\d{3}(?:\d{3})?)?)?(?:Z|[+-]\d{2}:\d{2})?"
+)
+_date_regex: str = r"\d{4}-\d{2}-\d{2}"
+
+# Types supported by default, in order they are checked with issubclass.
+# Second item of value makes parse function for type or its subclass, and
+# third tells if parsed values are immutable and worth caching.
+default_url_parameters_converters: dict[
+    type, tuple[str, Callable[[Any], Callable[[str], Any]], bool]
+] = {
+    bool: (r"true|false|1|0", lambda _: parse_bool, False),
+    int: (r"-?\d+", lambda type_: type_, False),
+    float: (r"[-+]?(?:\d*\.\d+|\d+)", lambda type_: type_, False),
+    str: (r"\w+", lambda type_: type_, False),
+    Path: (r".+", lambda type_: type_, True),
+    datetime: (
+        f"{_date_regex}[T ]{_time_regex}", make_iso_format_parser, True
+    ),
+    date: (_date_regex, make_iso_format_parser, True),
+    time: (_time_regex, make_iso_format_parser, True),
+    UUID: (
+        # Taken from: https://gist.github.com/kgriffs/c20084db6686fee2b363fdc1a8998792
+        r"[a-f0-9]{8}-[a-f0-9]{4}-[1-5][a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}",
+        lambda type_: type_,
+        True
+    ),
+}
+
+# How many recently parsed values are remembered for every type, so
+# ids that repeat across requests aren't parsed again
+url_parameters_cache_size: int = 256
+
+
+@lru_cache(maxsize=None)
+def get_url_parameter_converter(
+    type_to_convert: type
+) -> UrlParameterConverter:
+    """
+    Gives converter of some type, that is used to match it in url and
+    to make its value from matched string. By default following types
     are supported: int, bool, float, str, Path, datetime, date, time, UUID.
     You can add custom types by implementing CompilableUrlParameter protocol.
 
-    :param type_to_compile: some type.
-    :return: regex as string.
+    :param type_to_convert: some type.
+    :return: UrlParameterConverter instance.
     :raises TypeError: if type isn't one of default supported and
         it doesn't implements CompilableUrlParameter protocol
     """
-    if issubclass(type_to_compile, CompilableUrlParameter):
-        return type_to_compile.__compile_to_regex__()
+    if issubclass(type_to_convert, CompilableUrlParameter):
+        return UrlParameterConverter(
+            type_to_convert.__compile_to_regex__(),
+            getattr(
+                type_to_convert, "__parse_url_parameter__", type_to_convert
+            )
+        )
 
-    elif issubclass(
-        type_to_compile, int
-    ) and not issubclass(type_to_compile, bool):
-        return r"-\d+|\d+"
+    for supported_type, (regex, make_parser, is_cached) in \
+            default_url_parameters_converters.items():
+        if not issubclass(type_to_convert, supported_type):
+            continue
 
-    elif issubclass(type_to_compile, float):
-        return r"[-+]?\d*\.\d+|\d+"
+        parse: Callable[[str], Any] = make_parser(type_to_convert)
+        if is_cached and url_parameters_cache_size > 0:
+            parse = lru_cache(maxsize=url_parameters_cache_size)(parse)
 
-    elif issubclass(type_to_compile, str):
-        return r"\w+"
+        return UrlParameterConverter(regex, parse)
 
-    elif issubclass(type_to_compile, Path):
-        return r".+"
+    raise TypeError(
+        f"Unsupported type {type_to_convert}. "
+        f"Please, inherit from this type and CompilableUrlParameter "
+        f"and implement method __compile_to_regex__."
+    )
 
-    elif issubclass(type_to_compile, (datetime, date, time)):
-        return "(.*?)"
 
-    elif issubclass(type_to_compile, UUID):
-        # Taken from: https://gist.github.com/kgriffs/c20084db6686fee2b363fdc1a8998792
-        return r"[a-f0-9]{8}-[a-f0-9]{4}-[1-5][a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}"
+def compile_type_to_regex(
+    type_to_compile: type
+) -> str:
+    """
+    Compiles some type into a regex, that will represent it in url,
+    and later will be used to unpack url params.
 
-    else:
-        raise TypeError(
-            f"Unsupported type {type_to_compile}. "
-            f"Please, inherit from this type and CompilableUrlParameter "
-            f"and implement method __compile_to_regex__."
-        )
+    :param type_to_compile: some type.
+    :return: regex as string.
+    :raises TypeError: if type isn't one of default supported and
+        it doesn't implements CompilableUrlParameter protocol
+    """
+    return get_url_parameter_converter(type_to_compile).regex
 
 
 def compile_type_to_named_group(
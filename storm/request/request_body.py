@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Optional
+
+from storm.internal_types.asgi import receive_typehint
+from storm.responses.http import http_errors
+from .spooled_file import write_spooled
+
+
+class RequestBody:
+    """
+    Body of http request, that is received from ASGI server in chunks
+    only when handler asks for it. Body can be streamed chunk by chunk,
+    read into memory, or spooled into temporary file, that is kept
+    in memory until it grows past spool_threshold.
+    """
+
+    def __init__(
+        self,
+        receive: receive_typehint,
+        max_size: Optional[int] = None,
+        spool_threshold: int = 1024 * 1024,
+        content_length: Optional[int] = None
+    ):
+        """
+        :param receive: method for receiving data.
+        :param max_size: how many bytes body can have. None means no limit.
+        :param spool_threshold: how many bytes spooled body can have
+            before it's written to disk.
+        :param content_length: value of Content-Length header,
+            used to reject too large bodies before receiving them.
+        """
+        self.max_size: Optional[int] = max_size
+        self.spool_threshold: int = spool_threshold
+        self.content_length: Optional[int] = content_length
+        self.received_size: int = 0
+
+        self._receive: receive_typehint = receive
+        self._is_streamed: bool = False
+        self._body: Optional[bytes] = None
+        self._spooled_body: Optional[SpooledTemporaryFile] = None
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.iter_chunks()
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        Receives body chunk by chunk. Body can be received only once.
+
+        :return: async iterator of bytes.
+        :raises RuntimeError: if body was already received.
+        :raises HttpError: PayloadTooLarge if body is larger than max_size,
+            or ClientClosedRequest if client disconnected.
+        """
+        if self._is_streamed:
+            raise RuntimeError("Request body can be received only once")
+
+        self._is_streamed = True
+        if self.max_size is not None and self.content_length is not None \
+                and self.content_length > self.max_size:
+            raise http_errors.PayloadTooLarge()
+
+        while True:
+            message: dict = await self._receive()  # type: ignore
+
+            if message["type"] == "http.disconnect":
+                raise http_errors.ClientClosedRequest()
+
+            chunk: bytes = message.get("body", b"")
+            self.received_size += len(chunk)
+            if self.max_size is not None and \
+                    self.received_size > self.max_size:
+                raise http_errors.PayloadTooLarge()
+
+            if chunk:
+                yield chunk
+
+            if not message.get("more_body", False):
+                break
+
+    async def read(self) -> bytes:
+        """
+        Reads whole body into memory. Use it only for small bodies, and
+        iter_chunks or spool for large ones.
+
+        :return: body bytes.
+        :raises RuntimeError: if body was already streamed or spooled.
+        :raises HttpError: PayloadTooLarge if body is larger than max_size,
+            or ClientClosedRequest if client disconnected.
+        """
+        if self._body is None:
+            self._body = b"".join([chunk async for chunk in self])
+
+        return self._body
+
+    async def spool(self) -> SpooledTemporaryFile:
+        """
+        Receives body into temporary file, which is kept in memory until
+        it's larger than spool_threshold. Once file is on disk, chunks are
+        written in default executor of event loop. File is closed
+        when handler finishes.
+
+        :return: file with body, positioned at its start.
+        :raises RuntimeError: if body was already streamed or read.
+        :raises HttpError: PayloadTooLarge if body is larger than max_size,
+            or ClientClosedRequest if client disconnected.
+        """
+        if self._spooled_body is None:
+            spooled_body: SpooledTemporaryFile = SpooledTemporaryFile(
+                max_size=self.spool_threshold
+            )
+            spooled_size: int = 0
+            try:
+                async for chunk in self:
+                    await write_spooled(
+                        spooled_body, chunk, spooled_size,
+                        self.spool_threshold
+                    )
+                    spooled_size += len(chunk)
+
+            except BaseException:
+                spooled_body.close()
+                raise
+
+            self._spooled_body = spooled_body
+
+        self._spooled_body.seek(0)
+        return self._spooled_body
+
+    def close(self) -> None:
+        """
+        Closes spooled body, which removes its file from disk.
+
+        :return: nothing.
+        """
+        if self._spooled_body is not None:
+            self._spooled_body.close()
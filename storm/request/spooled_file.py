@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+from tempfile import SpooledTemporaryFile
+
+
+async def write_spooled(
+    file: SpooledTemporaryFile,
+    chunk: bytes,
+    size: int,
+    spool_threshold: int
+) -> None:
+    """
+    Appends chunk to spooled temporary file. Chunk, that makes file roll
+    over to disk, and all following ones are written in default executor
+    of event loop, so writing to disk doesn't block event loop. Only
+    public API of file is used, so caller keeps track of files size.
+
+    :param file: file which max_size is spool_threshold.
+    :param chunk: bytes to append.
+    :param size: how many bytes were written to file before.
+    :param spool_threshold: how many bytes file keeps in memory.
+    :return: nothing.
+    """
+    if size + len(chunk) > spool_threshold:
+        await asyncio.get_running_loop().run_in_executor(
+            None, file.write, chunk
+        )
+
+    else:
+        file.write(chunk)
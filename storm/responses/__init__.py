@@ -1,2 +1,5 @@
 from . import http, encoders
-from .http import BaseHttpResponse, http_errors
+from .http import (
+    BaseHttpResponse, EncodedResponse, JsonResponse, StreamingResponse,
+    http_errors
+)
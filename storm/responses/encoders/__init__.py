@@ -1,2 +1,6 @@
 from .response_encoder import BaseResponseEncoder
+from .json_encoder import JsonEncoder
 from .text_encoder import TextEncoder
+from .msgpack_encoder import MsgpackEncoder
+from .cbor_encoder import CborEncoder
+from .content_negotiation import ContentNegotiator, get_default_encoders
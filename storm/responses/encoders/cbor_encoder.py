@@ -0,0 +1,26 @@
+from typing import Any
+
+from .response_encoder import BaseResponseEncoder
+
+try:
+    import cbor2
+
+except ImportError:
+    cbor2 = None
+
+
+class CborEncoder(BaseResponseEncoder):
+    """
+    Encodes responses into CBOR. Requires cbor2 package.
+    """
+    content_type: str = "application/cbor"
+    is_available: bool = cbor2 is not None
+
+    def __init__(self):
+        if cbor2 is None:
+            raise ImportError("CborEncoder requires cbor2 package")
+
+        self._dumps = cbor2.dumps
+
+    def encode(self, data: Any) -> bytes:
+        return self._dumps(data)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence
+
+from .cbor_encoder import CborEncoder
+from .json_encoder import JsonEncoder
+from .msgpack_encoder import MsgpackEncoder
+from .response_encoder import BaseResponseEncoder
+
+
+class MediaRange(NamedTuple):
+    media_type: str
+    quality: float
+
+
+@lru_cache(maxsize=256)
+def parse_accept(accept: str) -> tuple[MediaRange, ...]:
+    """
+    Parses Accept header. Results are cached, since clients send
+    the same header with every request.
+
+    :param accept: value of Accept header.
+    :return: media ranges in order they were given.
+    """
+    media_ranges: list[MediaRange] = []
+    for item in accept.split(","):
+        media_type, *parameters = item.split(";")
+        media_type = media_type.strip().lower()
+        if not media_type:
+            continue
+
+        quality: float = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() != "q":
+                continue
+
+            try:
+                quality = min(max(float(value), 0.0), 1.0)
+
+            except ValueError:
+                quality = 0.0
+
+        media_ranges.append(MediaRange(media_type, quality))
+
+    return tuple(media_ranges)
+
+
+def get_media_type_quality(
+    media_type: str,
+    media_ranges: tuple[MediaRange, ...]
+) -> tuple[float, int]:
+    """
+    Finds how much client wants media type. The most specific of
+    ranges that match media type is used.
+
+    :param media_type: media type like "application/json".
+    :param media_ranges: parsed Accept header.
+    :return: quality and negative position of matched range in header,
+        so earlier ranges are preferred when qualities are equal.
+    """
+    main_type: str = media_type.partition("/")[0]
+    best_specificity: int = -1
+    best_match: tuple[float, int] = (0.0, 0)
+
+    for index, media_range in enumerate(media_ranges):
+        if media_range.media_type == media_type:
+            specificity = 2
+
+        elif media_range.media_type == f"{main_type}/*":
+            specificity = 1
+
+        elif media_range.media_type == "*/*":
+            specificity = 0
+
+        else:
+            continue
+
+        if specificity > best_specificity:
+            best_specificity = specificity
+            best_match = (media_range.quality, -index)
+
+    return best_match
+
+
+def get_default_encoders() -> list[BaseResponseEncoder]:
+    """
+    Gives encoders which libraries are installed, JSON being first.
+
+    :return: list of encoders.
+    """
+    encoders: list[BaseResponseEncoder] = [JsonEncoder()]
+    if MsgpackEncoder.is_available:
+        encoders.append(MsgpackEncoder())
+
+    if CborEncoder.is_available:
+        encoders.append(CborEncoder())
+
+    return encoders
+
+
+class ContentNegotiator:
+    """
+    Chooses encoder of response by Accept header of request. Choice
+    for every Accept header is remembered in LRU cache.
+    """
+
+    def __init__(
+        self,
+        encoders: Sequence[BaseResponseEncoder],
+        cache_size: int = 256
+    ):
+        """
+        :param encoders: encoders in order they are preferred by server.
+            First one is used when client doesn't send Accept header.
+        :param cache_size: how many Accept headers are remembered.
+        """
+        if not encoders:
+            raise ValueError("At least one encoder is required")
+
+        self.encoders: tuple[BaseResponseEncoder, ...] = tuple(encoders)
+        self.default_encoder: BaseResponseEncoder = self.encoders[0]
+        self.choose_encoder = lru_cache(maxsize=cache_size)(
+            self._choose_encoder
+        )
+
+    def _choose_encoder(self, accept: str) -> Optional[BaseResponseEncoder]:
+        """
+        Chooses encoder that client wants the most. If client wants some
+        encoders equally, the one which range is earlier in Accept header
+        is used, and then the one server prefers.
+
+        :param accept: value of Accept header.
+        :return: encoder, or None if client accepts none of them.
+        """
+        if not accept.strip():
+            return self.default_encoder
+
+        media_ranges: tuple[MediaRange, ...] = parse_accept(accept)
+        best_encoder: Optional[BaseResponseEncoder] = None
+        best_match: tuple[float, int] = (0.0, 0)
+
+        for encoder in self.encoders:
+            match: tuple[float, int] = max(
+                get_media_type_quality(media_type, media_ranges)
+                for media_type in encoder.media_types
+            )
+            if match[0] > 0 and (best_encoder is None or match > best_match):
+                best_encoder = encoder
+                best_match = match
+
+        return best_encoder
+
+    @staticmethod
+    def is_acceptable(encoder: BaseResponseEncoder, accept: str) -> bool:
+        """
+        Checks if client accepts responses of encoder.
+
+        :param encoder: some encoder.
+        :param accept: value of Accept header.
+        :return: is encoders media type acceptable.
+        """
+        if not accept.strip():
+            return True
+
+        media_ranges: tuple[MediaRange, ...] = parse_accept(accept)
+        return any(
+            get_media_type_quality(media_type, media_ranges)[0] > 0
+            for media_type in encoder.media_types
+        )
@@ -0,0 +1,18 @@
+from typing import Any
+
+from storm import json_backend
+from .response_encoder import BaseResponseEncoder
+
+
+class JsonEncoder(BaseResponseEncoder):
+    content_type: str = "application/json"
+
+    def __init__(self, default: json_backend.json_default = None):
+        """
+        :param default: function that turns objects, which JSON library
+            can't encode, into something it can.
+        """
+        self.default = default
+
+    def encode(self, data: Any) -> bytes:
+        return json_backend.dumps(data, self.default)
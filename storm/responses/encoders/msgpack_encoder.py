@@ -0,0 +1,30 @@
+from typing import Any
+
+from .response_encoder import BaseResponseEncoder
+
+try:
+    import msgpack
+
+except ImportError:
+    msgpack = None
+
+
+class MsgpackEncoder(BaseResponseEncoder):
+    """
+    Encodes responses into MessagePack. Requires msgpack package.
+    """
+    content_type: str = "application/msgpack"
+    is_available: bool = msgpack is not None
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("MsgpackEncoder requires msgpack package")
+
+        self._packb = msgpack.packb
+
+    def encode(self, data: Any) -> bytes:
+        return self._packb(data, use_bin_type=True)
+
+    @property
+    def media_types(self) -> tuple[str, ...]:
+        return "application/msgpack", "application/x-msgpack"
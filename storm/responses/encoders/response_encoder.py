@@ -3,6 +3,19 @@ from typing import Any
 
 
 class BaseResponseEncoder(ABC):
+    # Value of Content-Type header of encoded responses
+    content_type: str = "application/octet-stream"
+
     @abstractmethod
     def encode(self, data: Any) -> bytes:
         pass
+
+    @property
+    def media_types(self) -> tuple[str, ...]:
+        """
+        Media types which clients can ask for to get response
+        from this encoder.
+
+        :return: media types without parameters.
+        """
+        return (self.content_type.partition(";")[0].strip().lower(),)
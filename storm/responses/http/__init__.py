@@ -1,2 +1,5 @@
 from .base_http_response import BaseHttpResponse, ResponseBody
 from .cookie_same_site_parameter import SameSite
+from .encoded_response import EncodedResponse
+from .json_response import JsonResponse
+from .streaming_response import StreamingResponse
@@ -6,22 +6,41 @@ from storm.headers import Headers
 from storm.internal_types import CustomCookie
 from .cookie_same_site_parameter import SameSite
 from .response_body import ResponseBody
-from ...internal_types.asgi import events
+from ...internal_types.asgi import ASGI_SUPPORTED_TYPES, events
 
 
 class BaseHttpResponse(ABC):
+    __slots__ = ()
+
     status: int
     headers: Headers
     cookies: CustomCookie
+    # Streaming responses are stopped when client disconnects
+    is_streaming: bool = False
 
-    def response_start(self) -> events.HttpResponseStart:
+    def encoded_headers(self) -> list[tuple[bytes, bytes]]:
+        """
+        Gives headers and cookies encoded for ASGI server. Headers and
+        cookies cache their encoded forms, so they are encoded again only
+        if they were changed since response was sent last time.
+        :return: new list of headers names and values.
+        """
         headers: list[tuple[bytes, bytes]] = self.headers.to_list()
-        headers.extend(self.cookies.as_headers_list())
+        if self.cookies:
+            headers.extend(self.cookies.as_headers_list())
 
-        return events.HttpResponseStart(
-            self.status,
-            headers
-        )
+        return headers
+
+    def response_start(self) -> ASGI_SUPPORTED_TYPES:
+        """
+        Gives message that starts response.
+        :return: http.response.start message as plain dict.
+        """
+        return {
+            "type": events.HttpResponseStart.type,
+            "status": self.status,
+            "headers": self.encoded_headers()
+        }
 
     @abstractmethod
     async def get_body(self) -> ResponseBody:
@@ -33,6 +52,13 @@ class BaseHttpResponse(ABC):
         """
         return ResponseBody()
 
+    async def close(self) -> None:
+        """
+        Releases resources of response. Called after response is sent,
+        even if sending failed or client disconnected.
+        :return: nothing.
+        """
+
     def set_cookie(
         self,
         name: str,
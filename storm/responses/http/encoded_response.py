@@ -0,0 +1,51 @@
+from typing import Any, Optional
+
+from storm.headers import Headers
+from storm.internal_types import CustomCookie
+from storm.responses.encoders import BaseResponseEncoder
+from .base_http_response import BaseHttpResponse
+from .response_body import ResponseBody
+
+
+class EncodedResponse(BaseHttpResponse):
+    """
+    Response which body is data encoded by given encoder, with
+    Content-Type header of that encoder. Data is encoded when response is
+    made, so errors of encoder are raised in handler and turn into
+    InternalServerError before anything is sent to client.
+    """
+    __slots__ = ("data", "status", "headers", "cookies", "response_encoder",
+                 "_body")
+
+    def __init__(
+        self,
+        data: Any,
+        response_encoder: BaseResponseEncoder,
+        status: int = 200,
+        headers: Optional[Headers] = None,
+        cookies: Optional[CustomCookie] = None
+    ):
+        """
+        :param data: data to encode.
+        :param response_encoder: encoder of data.
+        :param status: status of response.
+        :param headers: headers of response, which are copied, so headers
+            given to many responses keep no Content-Type of any of them.
+        :param cookies: cookies of response.
+        :raises TypeError: if encoder can't encode data.
+        """
+        self.data = data
+        self.status = status
+        self.headers = Headers(
+            {name: list(values) for name, values in headers.items()}
+        ) if headers else Headers()
+        self.cookies = cookies or CustomCookie()
+        self.response_encoder = response_encoder
+
+        if "content-type" not in self.headers:
+            self.headers["Content-Type"] = response_encoder.content_type
+
+        self._body: bytes = response_encoder.encode(data)
+
+    async def get_body(self) -> ResponseBody:
+        return ResponseBody(self._body)
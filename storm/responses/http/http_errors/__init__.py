@@ -1,104 +1,67 @@
-from functools import partial
-
-from .http_error import HttpError
+from .http_error import (
+    HttpError,
+    HttpErrorResponse,
+    PrebuiltHttpError,
+    SharedHttpError
+)
 
 # Errors with codes 4XX
-BadRequest = partial(HttpError, status=400, message="Bad request")
-Unauthorized = partial(HttpError, status=401, message="Unauthorized")
-PaymentRequired = partial(HttpError, status=402, message="Payment required")
-Forbidden = partial(HttpError, status=403, message="Forbidden")
-NotFound = partial(HttpError, status=404, message="Not found")
-MethodNotAllowed = partial(HttpError, status=405, message="Method not allowed")
-NotAcceptable = partial(HttpError, status=406, message="Not acceptable")
-ProxyAuthenticationRequired = partial(
-    HttpError, status=407, message="Proxy Authentication Required"
-)
-RequestTimeout = partial(HttpError, status=408, message="Request timeout")
-Conflict = partial(HttpError, status=409, message="Conflict")
-Gone = partial(HttpError, status=410, message="Gone")
-LengthRequired = partial(HttpError, status=411, message="Length required")
-PreconditionFailed = partial(
-    HttpError, status=412, message="Precondition failed"
-)
-PayloadTooLarge = partial(HttpError, status=413, message="Payload too large")
-URITooLong = partial(HttpError, status=414, message="Uri too long")
-UnsupportedMediaType = partial(
-    HttpError, status=415, message="Unsupported media type"
-)
-RangeNotSatisfiable = partial(
-    HttpError, status=416, message="Range not satisfiable"
-)
-ExpectationFailed = partial(
-    HttpError, status=417, message="Expectation failed"
-)
-IAmATeapot = partial(HttpError, status=418, message="I am a teapot")
-AuthenticationTimeout = partial(
-    HttpError, status=419, message="Authentication failed"
-)
-MisdirectedRequest = partial(
-    HttpError, status=421, message="Misdirected request"
-)
-UnprocessableEntity = partial(
-    HttpError, status=422, message="Unprocessable entity"
-)
-Locked = partial(HttpError, status=423, message="Locked")
-FailedDependency = partial(HttpError, status=424, message="Failed dependency")
-TooEarly = partial(HttpError, status=425, message="Too early")
-UpgradeRequired = partial(HttpError, status=426, message="Upgrade required")
-PreconditionRequired = partial(
-    HttpError, status=428, message="Precondition required"
-)
-TooManyRequests = partial(HttpError, status=429, message="Too many requests")
-RequestHeaderFieldsTooLarge = partial(
-    HttpError, status=431, message="Request header fields too large"
-)
-RetryWith = partial(HttpError, status=449, message="Retry with")
-UnavailableForLegalReasons = partial(
-    HttpError, status=451, message="Unavailable for legal reasons"
-)
-ClientClosedRequest = partial(
-    HttpError, status=499, message="Client closed request"
-)
+BadRequest = PrebuiltHttpError(400, "Bad request")
+Unauthorized = PrebuiltHttpError(401, "Unauthorized")
+PaymentRequired = PrebuiltHttpError(402, "Payment required")
+Forbidden = PrebuiltHttpError(403, "Forbidden")
+NotFound = PrebuiltHttpError(404, "Not found")
+MethodNotAllowed = PrebuiltHttpError(405, "Method not allowed")
+NotAcceptable = PrebuiltHttpError(406, "Not acceptable")
+ProxyAuthenticationRequired = PrebuiltHttpError(
+    407, "Proxy Authentication Required"
+)
+RequestTimeout = PrebuiltHttpError(408, "Request timeout")
+Conflict = PrebuiltHttpError(409, "Conflict")
+Gone = PrebuiltHttpError(410, "Gone")
+LengthRequired = PrebuiltHttpError(411, "Length required")
+PreconditionFailed = PrebuiltHttpError(412, "Precondition failed")
+PayloadTooLarge = PrebuiltHttpError(413, "Payload too large")
+URITooLong = PrebuiltHttpError(414, "Uri too long")
+UnsupportedMediaType = PrebuiltHttpError(415, "Unsupported media type")
+RangeNotSatisfiable = PrebuiltHttpError(416, "Range not satisfiable")
+ExpectationFailed = PrebuiltHttpError(417, "Expectation failed")
+IAmATeapot = PrebuiltHttpError(418, "I am a teapot")
+AuthenticationTimeout = PrebuiltHttpError(419, "Authentication failed")
+MisdirectedRequest = PrebuiltHttpError(421, "Misdirected request")
+UnprocessableEntity = PrebuiltHttpError(422, "Unprocessable entity")
+Locked = PrebuiltHttpError(423, "Locked")
+FailedDependency = PrebuiltHttpError(424, "Failed dependency")
+TooEarly = PrebuiltHttpError(425, "Too early")
+UpgradeRequired = PrebuiltHttpError(426, "Upgrade required")
+PreconditionRequired = PrebuiltHttpError(428, "Precondition required")
+TooManyRequests = PrebuiltHttpError(429, "Too many requests")
+RequestHeaderFieldsTooLarge = PrebuiltHttpError(
+    431, "Request header fields too large"
+)
+RetryWith = PrebuiltHttpError(449, "Retry with")
+UnavailableForLegalReasons = PrebuiltHttpError(
+    451, "Unavailable for legal reasons"
+)
+ClientClosedRequest = PrebuiltHttpError(499, "Client closed request")
 
 # Errors with codes 5XX
-InternalServerError = partial(
-    HttpError, status=500, message="Internal server error"
-)
-NotImplementedHTTP = partial(HttpError, status=501, message="Not implemented")
-BadGateway = partial(HttpError, status=502, message="Bad gateway")
-ServiceUnavailable = partial(
-    HttpError, status=503, message="Service unavailable"
-)
-GatewayTimeout = partial(HttpError, status=504, message="Gateway timeout")
-HTTPVersionNotSupported = partial(
-    HttpError, status=505, message="HTTP version not supported"
-)
-VariantAlsoNegotiates = partial(
-    HttpError, status=506, message="Variant also negotiates"
-)
-InsufficientStorage = partial(
-    HttpError, status=507, message="Insufficient storage"
-)
-LoopDetected = partial(HttpError, status=508, message="Loop detected")
-BandwidthLimitExceeded = partial(
-    HttpError, status=509, message="Bandwidth limit exceeded"
-)
-NotExtended = partial(HttpError, status=510, message="Not extended")
-NetworkAuthenticationRequired = partial(
-    HttpError, status=511, message="Network authentication required"
-)
-UnknownError = partial(
-    HttpError, status=520, message="Unknown error"
-)
-WebServerIsDown = partial(
-    HttpError, status=521, message="Web server is down"
-)
-ConnectionTimedOut = partial(
-    HttpError, status=522, message="Connection timed out"
-)
-OriginIsUnreachable = partial(
-    HttpError, status=523, message="Origin is unreachable"
-)
-ATimeoutOccurred = partial(
-    HttpError, status=524, message="A timeout occurred"
-)
+InternalServerError = PrebuiltHttpError(500, "Internal server error")
+NotImplementedHTTP = PrebuiltHttpError(501, "Not implemented")
+BadGateway = PrebuiltHttpError(502, "Bad gateway")
+ServiceUnavailable = PrebuiltHttpError(503, "Service unavailable")
+GatewayTimeout = PrebuiltHttpError(504, "Gateway timeout")
+HTTPVersionNotSupported = PrebuiltHttpError(505, "HTTP version not supported")
+VariantAlsoNegotiates = PrebuiltHttpError(506, "Variant also negotiates")
+InsufficientStorage = PrebuiltHttpError(507, "Insufficient storage")
+LoopDetected = PrebuiltHttpError(508, "Loop detected")
+BandwidthLimitExceeded = PrebuiltHttpError(509, "Bandwidth limit exceeded")
+NotExtended = PrebuiltHttpError(510, "Not extended")
+NetworkAuthenticationRequired = PrebuiltHttpError(
+    511, "Network authentication required"
+)
+UnknownError = PrebuiltHttpError(520, "Unknown error")
+WebServerIsDown = PrebuiltHttpError(521, "Web server is down")
+ConnectionTimedOut = PrebuiltHttpError(522, "Connection timed out")
+OriginIsUnreachable = PrebuiltHttpError(523, "Origin is unreachable")
+ATimeoutOccurred = PrebuiltHttpError(524, "A timeout occurred")
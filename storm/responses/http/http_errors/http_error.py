@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Any, Optional
 
 from storm.headers import Headers
@@ -7,27 +9,316 @@ from storm.responses.encoders import TextEncoder
 from storm.responses.http import ResponseBody
 from ..base_http_response import BaseHttpResponse
 
+default_text_encoder = TextEncoder()
+# Marks arguments that weren't given, since message can be None
+_not_given: Any = object()
+
+
+class HttpErrorResponse(BaseHttpResponse):
+    """
+    Response with error status, which message is encoded by its encoder.
+    """
 
-class HttpError(Exception, BaseHttpResponse):
     def __init__(
         self,
         status: int,
         headers: Optional[Headers] = None,
         cookies: Optional[CustomCookie] = None,
         message: Optional[Any] = None,
-        response_encoder: BaseResponseEncoder = TextEncoder()
+        response_encoder: BaseResponseEncoder = default_text_encoder
     ):
         self.status = status
         self.headers = headers or Headers()
         self.cookies = cookies or CustomCookie()
         self.message = message
         self.response_encoder = response_encoder
+        # Message, encoder and body, so message is encoded once
+        self._encoded_body: Optional[
+            tuple[Any, BaseResponseEncoder, ResponseBody]
+        ] = None
+
+    def with_encoder(
+        self,
+        response_encoder: BaseResponseEncoder
+    ) -> HttpErrorResponse:
+        """
+        Gives copy of error which message is encoded by other encoder.
+        Error itself isn't changed, since same instance can be returned
+        for many requests.
+
+        :param response_encoder: encoder of message.
+        :return: new instance or the same one if encoder is the same.
+        """
+        if response_encoder is self.response_encoder:
+            return self
+
+        error: HttpErrorResponse = type(self).__new__(type(self))
+        error.__dict__.update(self.__dict__)
+        error.response_encoder = response_encoder
+        return error
+
+    def encoded_headers(self) -> list[tuple[bytes, bytes]]:
+        headers: list[tuple[bytes, bytes]] = super().encoded_headers()
+        if self.message is not None and "content-type" not in self.headers:
+            headers.append((
+                b"content-type",
+                self.response_encoder.content_type.encode("latin-1")
+            ))
+
+        return headers
 
     async def get_body(self) -> ResponseBody:
-        if self.message is not None:
-            return ResponseBody(
-                body=self.message.encode('utf-8')
-            )
+        return self.encode_body()
 
-        else:
+    def encode_body(self) -> ResponseBody:
+        """
+        Encodes message. Encoded body is kept until message
+        or encoder is changed.
+
+        :return: ResponseBody instance.
+        """
+        if self.message is None:
             return ResponseBody()
+
+        encoded_body = self._encoded_body
+        if encoded_body is None or \
+                encoded_body[0] is not self.message or \
+                encoded_body[1] is not self.response_encoder:
+            encoded_body = self._encoded_body = (
+                self.message,
+                self.response_encoder,
+                ResponseBody(self.response_encoder.encode(self.message))
+            )
+
+        return encoded_body[2]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(status={self.status}, "
+            f"message={self.message!r})"
+        )
+
+
+class HttpError(Exception, HttpErrorResponse):
+    """
+    Error response that can be raised from handler.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Optional[Headers] = None,
+        cookies: Optional[CustomCookie] = None,
+        message: Optional[Any] = None,
+        response_encoder: BaseResponseEncoder = default_text_encoder
+    ):
+        HttpErrorResponse.__init__(
+            self, status, headers, cookies, message, response_encoder
+        )
+
+    def with_encoder(self, response_encoder: BaseResponseEncoder) -> HttpError:
+        error: HttpError = super().with_encoder(  # type: ignore
+            response_encoder
+        )
+        error.args = self.args
+        return error
+
+    # Exception defines its own __repr__, which comes first in MRO
+    __repr__ = HttpErrorResponse.__repr__
+
+
+class PrebuiltHttpError(HttpErrorResponse):
+    """
+    Error response which headers and body are encoded once, when it's
+    made, and which can't be changed afterwards, so it can be shared by
+    all requests. It can be returned from handler as it is, and calling it
+    gives error that can be raised:
+
+    .. code-block:: python
+
+        raise NotFound()
+        raise NotFound(message="No such item")
+
+    Without arguments light copy is given, that shares everything with
+    prebuilt error. Other message, headers or cookies give new HttpError.
+    Prebuilt error itself isn't exception, since raising it would store
+    traceback of every request in the object they all share.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        message: Optional[Any] = None,
+        headers: Optional[Headers] = None,
+        response_encoder: BaseResponseEncoder = default_text_encoder
+    ):
+        super().__init__(
+            status, headers, None, message, response_encoder
+        )
+        self.prebuilt_headers: list[tuple[bytes, bytes]] = \
+            super().encoded_headers()
+        self.prebuilt_body: ResponseBody = self.encode_body()
+        # Prebuilt variants of error for other encoders
+        self._variants: dict[BaseResponseEncoder, PrebuiltHttpError] = {}
+        self._is_built: bool = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_is_built", False):
+            raise AttributeError(
+                f"{self!r} is shared and can't be changed, "
+                "call it to get copy with other message or headers"
+            )
+
+        super().__setattr__(name, value)
+
+    def __call__(
+        self,
+        status: Optional[int] = None,
+        headers: Optional[Headers] = None,
+        cookies: Optional[CustomCookie] = None,
+        message: Optional[Any] = _not_given,
+        response_encoder: Optional[BaseResponseEncoder] = None
+    ) -> HttpError:
+        """
+        Gives error that can be raised or returned from handler.
+
+        :param status: other status.
+        :param headers: headers that are added to headers of error.
+        :param cookies: cookies of error.
+        :param message: other message.
+        :param response_encoder: other encoder of message.
+        :return: SharedHttpError if nothing but encoder is given,
+            or new HttpError instance.
+        """
+        if status is None and headers is None and cookies is None and \
+                message is _not_given:
+            if response_encoder is None:
+                return SharedHttpError(self)
+
+            return SharedHttpError(self.with_encoder(response_encoder))
+
+        error_headers = Headers()
+        for key, values in self.headers.items():
+            for value in values:
+                error_headers[key] = value
+
+        for key, values in (headers or {}).items():
+            for value in values:
+                error_headers[key] = value
+
+        return HttpError(
+            self.status if status is None else status,
+            error_headers,
+            cookies,
+            self.message if message is _not_given else message,
+            response_encoder or self.response_encoder
+        )
+
+    def with_encoder(
+        self,
+        response_encoder: BaseResponseEncoder
+    ) -> PrebuiltHttpError:
+        """
+        Gives prebuilt error which message is encoded by other encoder.
+        Variant for every encoder is built once.
+
+        :param response_encoder: encoder of message.
+        :return: PrebuiltHttpError instance.
+        """
+        if response_encoder is self.response_encoder:
+            return self
+
+        try:
+            return self._variants[response_encoder]
+
+        except KeyError:
+            variant = PrebuiltHttpError(
+                self.status, self.message, self.headers, response_encoder
+            )
+            self._variants[response_encoder] = variant
+            return variant
+
+    def encoded_headers(self) -> list[tuple[bytes, bytes]]:
+        return list(self.prebuilt_headers)
+
+    async def get_body(self) -> ResponseBody:
+        return self.prebuilt_body
+
+
+class SharedHttpError(HttpError):
+    """
+    Light copy of prebuilt error, which can be raised. It uses headers
+    and body of prebuilt error until its own headers or cookies are
+    accessed, which copies them.
+    """
+
+    def __init__(self, prebuilt: PrebuiltHttpError):  # noqa: no super call
+        self.prebuilt: PrebuiltHttpError = prebuilt
+        self.status = prebuilt.status
+        self.message = prebuilt.message
+        self.response_encoder = prebuilt.response_encoder
+        self._encoded_body = None
+        self._headers: Optional[Headers] = None
+        self._cookies: Optional[CustomCookie] = None
+
+    @property  # type: ignore
+    def headers(self) -> Headers:  # type: ignore
+        if self._headers is None:
+            self._headers = Headers()
+            for key, values in self.prebuilt.headers.items():
+                for value in values:
+                    self._headers[key] = value
+
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: Headers) -> None:
+        self._headers = headers
+
+    @property  # type: ignore
+    def cookies(self) -> CustomCookie:  # type: ignore
+        if self._cookies is None:
+            self._cookies = CustomCookie()
+
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, cookies: CustomCookie) -> None:
+        self._cookies = cookies
+
+    @property
+    def is_prebuilt(self) -> bool:
+        """
+        Tells if error is the same as prebuilt one.
+
+        :return: can prebuilt headers and body be used.
+        """
+        return (
+            self._headers is None and self._cookies is None and
+            self.status == self.prebuilt.status and
+            self.message is self.prebuilt.message and
+            self.response_encoder is self.prebuilt.response_encoder
+        )
+
+    def with_encoder(self, response_encoder: BaseResponseEncoder) -> HttpError:
+        if response_encoder is self.response_encoder:
+            return self
+
+        if self.is_prebuilt:
+            return SharedHttpError(
+                self.prebuilt.with_encoder(response_encoder)
+            )
+
+        return super().with_encoder(response_encoder)
+
+    def encoded_headers(self) -> list[tuple[bytes, bytes]]:
+        if self.is_prebuilt:
+            return list(self.prebuilt.prebuilt_headers)
+
+        return super().encoded_headers()
+
+    async def get_body(self) -> ResponseBody:
+        if self.is_prebuilt:
+            return self.prebuilt.prebuilt_body
+
+        return self.encode_body()
@@ -0,0 +1,26 @@
+from typing import Any, Optional
+
+from storm.headers import Headers
+from storm.internal_types import CustomCookie
+from storm.responses.encoders import BaseResponseEncoder, JsonEncoder
+from .encoded_response import EncodedResponse
+
+default_json_encoder = JsonEncoder()
+
+
+class JsonResponse(EncodedResponse):
+    """
+    Response which body is data encoded as JSON by the fastest
+    JSON library that is installed.
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        data: Any,
+        status: int = 200,
+        headers: Optional[Headers] = None,
+        cookies: Optional[CustomCookie] = None,
+        response_encoder: BaseResponseEncoder = default_json_encoder
+    ):
+        super().__init__(data, response_encoder, status, headers, cookies)
@@ -1,4 +1,7 @@
-from typing import NamedTuple
+from typing import NamedTuple, Union
+
+# Parts of body are sent as they are, without copying them into bytes
+body_chunk = Union[bytes, bytearray, memoryview]
 
 
 class ResponseBody(NamedTuple):
@@ -7,5 +10,5 @@ class ResponseBody(NamedTuple):
     sent is everything we have to send, and to deliver what bytes should
     be sent.
     """
-    body: bytes = b""
+    body: body_chunk = b""
     more_body: bool = False
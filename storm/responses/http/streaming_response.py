@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterable, Iterable, Iterator, Optional, Union
+
+from storm.headers import Headers
+from storm.internal_types import CustomCookie
+from .base_http_response import BaseHttpResponse
+from .response_body import ResponseBody, body_chunk
+
+# Marks end of sync iterator, that is iterated in thread
+_iterator_end = object()
+
+
+class StreamingResponse(BaseHttpResponse):
+    """
+    Response which body is sent chunk by chunk, as iterator gives them.
+    Next chunk is requested only after previous one was sent, so slow
+    clients slow down iterator instead of making chunks pile up in memory.
+    Chunks can be bytes, bytearray or memoryview and are sent as they are.
+
+    Sync iterators are iterated in default executor of event loop, since
+    they can block, like iterators that read from files or databases.
+    """
+    __slots__ = (
+        "status", "headers", "cookies", "iterate_in_thread",
+        "_chunks", "_is_finished", "_pending"
+    )
+    # App stops streaming when client disconnects
+    is_streaming: bool = True
+
+    def __init__(
+        self,
+        chunks: Union[AsyncIterable[body_chunk], Iterable[body_chunk]],
+        status: int = 200,
+        headers: Optional[Headers] = None,
+        cookies: Optional[CustomCookie] = None,
+        content_type: str = "application/octet-stream",
+        iterate_in_thread: bool = True
+    ):
+        """
+        :param chunks: async or sync iterable of body chunks.
+        :param status: status of response.
+        :param headers: headers of response.
+        :param cookies: cookies of response.
+        :param content_type: value of Content-Type header, which is set
+            if headers don't have it.
+        :param iterate_in_thread: if set to False, sync iterator is
+            iterated right on event loop, which is faster for iterators
+            that never block.
+        """
+        self.status = status
+        self.headers = headers or Headers()
+        self.cookies = cookies or CustomCookie()
+        self.iterate_in_thread: bool = iterate_in_thread
+
+        if "content-type" not in self.headers:
+            self.headers["Content-Type"] = content_type
+
+        self._chunks: Union[AsyncIterable[body_chunk], Iterator[body_chunk]]
+        if isinstance(chunks, AsyncIterable):
+            self._chunks = chunks.__aiter__()
+
+        else:
+            self._chunks = iter(chunks)
+
+        self._is_finished: bool = False
+        # Chunk that is being taken from sync iterator in thread
+        self._pending: Optional[asyncio.Future] = None
+
+    async def _next_chunk(self) -> Optional[body_chunk]:
+        """
+        Gives next chunk of iterator.
+
+        :return: chunk or None if iterator is exhausted.
+        """
+        if not isinstance(self._chunks, Iterator):
+            try:
+                return await self._chunks.__anext__()  # type: ignore
+
+            except StopAsyncIteration:
+                return None
+
+        if not self.iterate_in_thread:
+            return next(self._chunks, None)
+
+        self._pending = asyncio.get_running_loop().run_in_executor(
+            None, next, self._chunks, _iterator_end
+        )
+        # Thread can't be stopped, so if sending is cancelled, iterator is
+        # closed only after thread is done with it
+        chunk = await asyncio.shield(self._pending)
+        return None if chunk is _iterator_end else chunk
+
+    async def get_body(self) -> ResponseBody:
+        """
+        Gives next non empty chunk of body.
+
+        :return: ResponseBody with chunk and more_body set,
+            or empty one when iterator is exhausted.
+        """
+        while not self._is_finished:
+            chunk: Optional[body_chunk] = await self._next_chunk()
+            if chunk is None:
+                self._is_finished = True
+                break
+
+            if chunk:
+                return ResponseBody(chunk, more_body=True)
+
+        return ResponseBody()
+
+    async def close(self) -> None:
+        """
+        Closes iterator, so its finally blocks run even if client
+        disconnected before body was sent.
+
+        :return: nothing.
+        """
+        self._is_finished = True
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+            return
+
+        if self._pending is not None and not self._pending.done():
+            await asyncio.wait((self._pending,))
+
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
@@ -1,3 +1,7 @@
+from .compiled_router import CompiledRegexRouter
+from .radix_router import RadixRouter
 from .router import Router
-from .routing_exceptions import HandlerNotFound
+from .routing_dispatch import RoutingDispatch
+from .routing_exceptions import HandlerNotFound, StaleRoutingTable
+from .routing_table import RoutingTable, CompiledRoute
 from .rule import RegexRule, MatchedHandler
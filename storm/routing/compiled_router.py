@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import re
+from typing import Optional, Type, Union
+
+from storm.internal_types.asgi import (
+    HttpASGIConnectionScope,
+    WebSocketASGIConnectionScope
+)
+from storm.request.handlers import HttpHandler, WebSocketHandler
+from storm.request.handlers.utils import MatchedArguments
+from .router import Router
+from .routing_exceptions import HandlerNotFound
+from .rule import RegexRule, MatchedHandler, HandlerType
+
+named_group_regex = re.compile(r"\(\?P(?P<kind>[<=])(?P<name>\w+)")
+# Numbered backreferences and conditionals, like \1 or (?(1)...), that are
+# not preceded by escaped backslash
+numbered_reference_regex = re.compile(
+    r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d+\))"
+)
+
+
+class CompiledRoutes:
+    """
+    Rules merged into single alternation regex. Every rule gets its own
+    marker group, and its url parameters groups are renamed to be unique
+    among all rules. Groups are renamed, but not renumbered, so regexes
+    that refer to groups by number are rejected.
+    """
+    url_regex: Optional[re.Pattern]
+    routes: dict[str, tuple[RegexRule, tuple[tuple[str, str], ...]]]
+
+    def __init__(self, rules: list[RegexRule[HandlerType]]):
+        """
+        :param rules: rules in order they must be matched.
+        :raises ValueError: if some rules regex refers to groups by number.
+        """
+        self.routes = {}
+        alternatives: list[str] = []
+
+        for index, rule in enumerate(rules):
+            if numbered_reference_regex.search(rule.url_regex.pattern):
+                raise ValueError(
+                    f"Url {rule.url} of {rule.handler_name} refers to "
+                    "groups by number, which would point to other groups "
+                    "once rules are merged. Use named groups and (?P=name) "
+                    "in __compile_to_regex__ instead."
+                )
+
+            marker: str = f"_r{index}"
+            groups_names: list[tuple[str, str]] = []
+
+            def rename_group(group_match: re.Match) -> str:
+                namespaced_name = f"{marker}_{group_match['name']}"
+                if group_match["kind"] == "<":
+                    groups_names.append(
+                        (group_match["name"], namespaced_name)
+                    )
+
+                return f"(?P{group_match['kind']}{namespaced_name}"
+
+            rule_regex: str = named_group_regex.sub(
+                rename_group, rule.url_regex.pattern
+            )
+            alternatives.append(f"(?P<{marker}>{rule_regex})")
+            self.routes[marker] = (rule, tuple(groups_names))
+
+        self.url_regex = None
+        if alternatives:
+            self.url_regex = re.compile("|".join(alternatives))
+
+    def match(
+        self,
+        scope: Union[HttpASGIConnectionScope, WebSocketASGIConnectionScope]
+    ) -> MatchedHandler:
+        """
+        Matches path against all rules at once.
+
+        :param scope: instance of scope.
+        :return: MatchedHandler with url parameters under their
+            original names.
+        :raises HandlerNotFound: if none of rules matched.
+        """
+        if self.url_regex is None:
+            raise HandlerNotFound()
+
+        url_match: Optional[re.Match] = self.url_regex.fullmatch(scope.path)
+        if url_match is None:
+            raise HandlerNotFound()
+
+        rule, groups_names = self.routes[url_match.lastgroup]  # type: ignore
+        return rule.make_matched_handler(
+            MatchedArguments(
+                {
+                    name: url_match.group(namespaced_name)
+                    for name, namespaced_name in groups_names
+                }
+            )
+        )
+
+
+class CompiledRegexRouter(Router):
+    """
+    Router that merges regexes of all rules with url parameters into one
+    alternation, so the handler and its url parameters are found by single
+    fullmatch call. Rules keep their priority from order_routes.
+    Regexes of custom url parameters types can't use numbered
+    backreferences, since numbers of groups change when regexes
+    are merged. Named backreferences are renamed with their groups.
+    """
+    _compiled_http_routes: CompiledRoutes
+    _compiled_ws_routes: CompiledRoutes
+
+    def __init__(
+        self,
+        match_cache_size: int = 1024,
+        miss_cache_size: int = 1024
+    ):
+        self._compiled_http_routes = CompiledRoutes([])
+        self._compiled_ws_routes = CompiledRoutes([])
+        super().__init__(match_cache_size, miss_cache_size)
+
+    def _build_indexes(self) -> None:
+        super()._build_indexes()
+        self._compiled_http_routes = CompiledRoutes(self._dynamic_http_rules)
+        self._compiled_ws_routes = CompiledRoutes(self._dynamic_ws_rules)
+
+    def _find_dynamic_http_handler(
+        self,
+        scope: HttpASGIConnectionScope
+    ) -> MatchedHandler[Type[HttpHandler]]:
+        return self._compiled_http_routes.match(scope)
+
+    def _find_dynamic_ws_handler(
+        self,
+        scope: WebSocketASGIConnectionScope
+    ) -> MatchedHandler[Type[WebSocketHandler]]:
+        return self._compiled_ws_routes.match(scope)
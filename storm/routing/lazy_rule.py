@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from importlib import import_module
+from types import TracebackType
+from typing import Optional, Type
+
+from storm.request.handlers import StormBaseHandler
+from storm.request.handlers._compiled_url_return import CompiledUrl
+from storm.request.handlers.utils import UrlArguments, compile_url
+from .rule import RegexRule, MatchedHandler
+
+
+def import_handler(handler_path: str) -> Type[StormBaseHandler]:
+    """
+    Imports handler class by its path.
+
+    :param handler_path: string like "package.module:ClassName".
+    :return: handler class.
+    :raises ImportError: if module can't be imported.
+    :raises AttributeError: if there's no such class in module.
+    """
+    module_name, _, qualname = handler_path.partition(":")
+    handler: object = import_module(module_name)
+    for name in qualname.split("."):
+        handler = getattr(handler, name)
+
+    return handler  # type: ignore
+
+
+class LazyMatchedHandler(MatchedHandler):
+    """
+    MatchedHandler of lazy rule, which imports handler
+    only when it is asked for.
+    """
+    __slots__ = ("rule",)
+
+    def __init__(self, rule: LazyRegexRule, arguments: UrlArguments):
+        self.rule = rule
+        self.arguments = arguments
+
+    @property  # type: ignore
+    def handler(self) -> Type[StormBaseHandler]:  # type: ignore
+        return self.rule.handler
+
+
+class LazyRegexRule(RegexRule):
+    """
+    Rule that knows only path of its handler and types of url parameters.
+    Handlers module is imported when rule is matched for the first time.
+    If import fails, error is remembered and raised again on next accesses
+    without importing module again.
+    """
+    __slots__ = (
+        "handler_path", "handler_base", "_url_parameters_types", "_handler",
+        "_import_error", "_import_traceback"
+    )
+
+    def __init__(
+        self,
+        handler_path: str,
+        url: str,
+        url_parameters_types: dict[str, type],
+        handler_base: Type[StormBaseHandler],
+        compiled_url: Optional[CompiledUrl] = None
+    ):
+        """
+        :param handler_path: string like "package.module:ClassName".
+        :param url: url that handler is bound to.
+        :param url_parameters_types: declared types of url parameters
+            by their names.
+        :param handler_base: class that handler must be subclass of.
+        :param compiled_url: already compiled url.
+        """
+        if ":" not in handler_path:
+            raise ValueError(
+                f"Handler path must look like module:ClassName "
+                f"(got {handler_path})"
+            )
+
+        self.url: str = url
+        self.handler_path: str = handler_path
+        self.handler_base: Type[StormBaseHandler] = handler_base
+        self._url_parameters_types: dict[str, type] = dict(
+            url_parameters_types
+        )
+        self._handler: Optional[Type[StormBaseHandler]] = None
+        self._import_error: Optional[Exception] = None
+        self._import_traceback: Optional[TracebackType] = None
+
+        if compiled_url is None:
+            compiled_url = compile_url(
+                url, self._url_parameters_types, handler_path
+            )
+
+        url_regex, is_static = compiled_url
+        self.url_regex = url_regex
+        self.is_static = is_static
+
+    @property  # type: ignore
+    def handler(self) -> Type[StormBaseHandler]:  # type: ignore
+        """
+        Imports handler on first access.
+
+        :return: handler class.
+        :raises ImportError: if module can't be imported.
+        :raises AttributeError: if there's no such class in module.
+        :raises TypeError: if imported class doesn't match declaration.
+        """
+        if self._handler is None:
+            if self._import_error is not None:
+                # Traceback of first failure is given back, so error
+                # doesn't collect frames of every following request
+                raise self._import_error.with_traceback(
+                    self._import_traceback
+                )
+
+            try:
+                self._handler = self._import_handler()
+
+            except Exception as err:
+                self._import_error = err
+                self._import_traceback = err.__traceback__
+                raise
+
+        return self._handler
+
+    @property
+    def is_imported(self) -> bool:
+        return self._handler is not None
+
+    @property
+    def url_parameters_types(self) -> dict[str, type]:
+        return self._url_parameters_types
+
+    @property
+    def handler_name(self) -> str:
+        return self.handler_path
+
+    def is_rule_for(self, handler_base: Type[StormBaseHandler]) -> bool:
+        return issubclass(self.handler_base, handler_base)
+
+    def make_matched_handler(self, arguments: UrlArguments) -> MatchedHandler:
+        if self._handler is not None:
+            return MatchedHandler(self._handler, arguments)
+
+        return LazyMatchedHandler(self, arguments)
+
+    def _import_handler(self) -> Type[StormBaseHandler]:
+        handler = import_handler(self.handler_path)
+        if not isinstance(handler, type) or \
+                not issubclass(handler, self.handler_base):
+            raise TypeError(
+                f"{self.handler_path} is not subclass "
+                f"of {self.handler_base.__name__}"
+            )
+
+        handler_parameters_types: dict[str, type] = {
+            name: properties.casted_to_type
+            for name, properties in
+            handler._url_parameters_properties.items()
+        }
+        if handler_parameters_types != self._url_parameters_types:
+            raise TypeError(
+                f"Url parameters declared for {self.handler_path} "
+                f"({self._url_parameters_types}) don't match "
+                f"ones of handler ({handler_parameters_types})"
+            )
+
+        return handler
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import NamedTuple, Union
+
+from .rule import MatchedHandler
+
+
+class NotCached:
+    """
+    Marker of path that isn't known to cache.
+    """
+
+
+NOT_CACHED = NotCached()
+
+
+class MatchCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    current_size: int
+    enabled: bool
+
+
+class MatchCache:
+    """
+    Bounded LRU cache of paths and handlers found for them. Only matched
+    paths are stored, since paths that didn't match any rule are
+    remembered by MissCache.
+
+    Cache measures its hit ratio in windows of max_size lookups, that
+    ended with matched handler, so requests to unknown paths don't make
+    cache look useless. If ratio is lower than min_hit_ratio, space of
+    urls with parameters is considered too large to be cached and cache
+    disables itself. Disabled cache still counts matched lookups and is
+    enabled again after reprobe_windows windows, so short bursts of unique
+    paths don't disable it for the whole life of process.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        min_hit_ratio: float = 0.1,
+        reprobe_windows: int = 16
+    ):
+        """
+        :param max_size: how many paths are remembered. Set 0 to disable
+            cache.
+        :param min_hit_ratio: lowest ratio of hits in window, that keeps
+            cache enabled.
+        :param reprobe_windows: after how many windows of lookups disabled
+            cache is enabled again.
+        """
+        self.max_size: int = max_size
+        self.min_hit_ratio: float = min_hit_ratio
+        self.reprobe_windows: int = reprobe_windows
+        self.hits: int = 0
+        self.misses: int = 0
+        self.enabled: bool = max_size > 0
+
+        self._entries: OrderedDict[str, MatchedHandler] = OrderedDict()
+        self._window_hits: int = 0
+        self._window_lookups: int = 0
+        self._disabled_lookups: int = 0
+
+    def get(self, path: str) -> Union[MatchedHandler, NotCached]:
+        """
+        Gives handler that was found for path previously.
+
+        :param path: requested path.
+        :return: MatchedHandler, or NOT_CACHED if path isn't in cache.
+        """
+        if not self.enabled:
+            return NOT_CACHED
+
+        try:
+            matched_handler: MatchedHandler = self._entries[path]
+            self._entries.move_to_end(path)
+
+        except KeyError:
+            # Miss is counted when handler is found for path
+            return NOT_CACHED
+
+        self.hits += 1
+        self._count_lookup(is_hit=True)
+        return matched_handler
+
+    def put(self, path: str, matched_handler: MatchedHandler) -> None:
+        """
+        Stores handler found for path, which wasn't in cache, and counts
+        lookup of path as miss.
+
+        :param path: requested path.
+        :param matched_handler: found handler.
+        :return: nothing.
+        """
+        if not self.enabled:
+            self._count_disabled_lookup()
+            return
+
+        self._entries[path] = matched_handler
+        if len(self._entries) > self.max_size:
+            try:
+                self._entries.popitem(last=False)
+
+            except KeyError:
+                # Cache been cleared from other thread
+                pass
+
+        self.misses += 1
+        self._count_lookup(is_hit=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and enables cache back.
+
+        :return: nothing.
+        """
+        self._entries.clear()
+        self._window_hits = 0
+        self._window_lookups = 0
+        self._disabled_lookups = 0
+        self.enabled = self.max_size > 0
+
+    def cache_info(self) -> MatchCacheInfo:
+        """
+        Gives statistics of cache usage.
+
+        :return: MatchCacheInfo instance.
+        """
+        return MatchCacheInfo(
+            self.hits, self.misses, self.max_size,
+            len(self._entries), self.enabled
+        )
+
+    def _count_lookup(self, is_hit: bool) -> None:
+        self._window_hits += is_hit
+        self._window_lookups += 1
+
+        if self._window_lookups < self.max_size:
+            return
+
+        if self._window_hits / self._window_lookups < self.min_hit_ratio:
+            self.enabled = False
+            self._entries.clear()
+
+        self._window_hits = 0
+        self._window_lookups = 0
+
+    def _count_disabled_lookup(self) -> None:
+        if self.max_size <= 0:
+            return
+
+        self._disabled_lookups += 1
+        if self._disabled_lookups >= self.max_size * self.reprobe_windows:
+            self._disabled_lookups = 0
+            self.enabled = True
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple, Optional
+
+from .rule import RegexRule
+
+
+class MissCacheInfo(NamedTuple):
+    misses: int
+    rejected: int
+    max_size: int
+    current_size: int
+    is_segment_filter_enabled: bool
+
+
+def get_first_segment(path: str) -> str:
+    """
+    Gives part of path between first and second slash.
+
+    :param path: requested path or url of rule, which starts with "/".
+    :return: first segment of path.
+    """
+    return path[1:].partition("/")[0]
+
+
+class MissCache:
+    """
+    Remembers requests that didn't match any rule, so they are rejected
+    without matching rules again.
+
+    Recently missed paths are kept in bounded set. Paths are also
+    checked against first segments of urls of all known rules, so requests
+    to paths like "/wp-admin/..." are rejected even when every one of
+    them is unique. That check is disabled if any url has parameter
+    in its first segment.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size: int = max_size
+        # Lookups that went through rules and didn't match anything
+        self.misses: int = 0
+        # Lookups that were rejected without matching rules
+        self.rejected: int = 0
+
+        self._paths: dict[str, None] = {}
+        self._first_segments: Optional[frozenset[str]] = None
+
+    def is_known_miss(self, path: str) -> bool:
+        """
+        Checks if path can't match any rule.
+
+        :param path: requested path.
+        :return: is path known to not match anything.
+        """
+        if path in self._paths or (
+            self._first_segments is not None and
+            get_first_segment(path) not in self._first_segments
+        ):
+            self.rejected += 1
+            return True
+
+        return False
+
+    def add(self, path: str) -> None:
+        """
+        Stores path that didn't match any rule. Oldest paths are
+        forgotten first.
+
+        :param path: requested path.
+        :return: nothing.
+        """
+        self.misses += 1
+        if self.max_size <= 0:
+            return
+
+        self._paths[path] = None
+        if len(self._paths) > self.max_size:
+            try:
+                del self._paths[next(iter(self._paths))]
+
+            except (KeyError, StopIteration, RuntimeError):
+                # Cache been cleared or changed from other thread
+                pass
+
+    def index_rules(self, rules: Iterable[RegexRule]) -> None:
+        """
+        Remembers first segments of rules urls and forgets missed paths,
+        because they may match new rules.
+
+        :param rules: all rules of router.
+        :return: nothing.
+        """
+        first_segments: set[str] = set()
+        for rule in rules:
+            if not rule.url.startswith("/"):
+                self._first_segments = None
+                break
+
+            first_segment: str = get_first_segment(rule.url)
+            if "<" in first_segment:
+                self._first_segments = None
+                break
+
+            first_segments.add(first_segment)
+
+        else:
+            self._first_segments = frozenset(first_segments)
+
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Forgets all missed paths.
+
+        :return: nothing.
+        """
+        self._paths.clear()
+
+    def cache_info(self) -> MissCacheInfo:
+        """
+        Gives statistics of rejected requests, that can be used
+        for monitoring.
+
+        :return: MissCacheInfo instance.
+        """
+        return MissCacheInfo(
+            self.misses, self.rejected, self.max_size,
+            len(self._paths), self._first_segments is not None
+        )
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Optional, Type, Union
+from uuid import UUID
+
+from storm.internal_types.asgi import (
+    HttpASGIConnectionScope,
+    WebSocketASGIConnectionScope
+)
+from storm.request.handlers import HttpHandler, WebSocketHandler
+from storm.request.handlers.utils import MatchedArguments
+from storm.request.parameters import CompilableUrlParameter
+from storm.request.parameters.url import compile_type_to_named_group
+from .router import Router
+from .routing_exceptions import HandlerNotFound
+from .rule import RegexRule, MatchedHandler, HandlerType
+
+url_parameter_regex = re.compile(r"<(\w+)>")
+
+
+class RadixNode:
+    """
+    Node of compressed prefix tree, that is built from urls split by "/".
+    Chains of literal segments without any branching are stored in single
+    node as its prefix.
+    """
+    prefix: tuple[str, ...]
+    literal_children: dict[str, RadixNode]
+    pattern_children: list[tuple[re.Pattern, RadixNode]]
+    tail_rules: list[RegexRule]
+    rule: Optional[RegexRule]
+
+    def __init__(self, prefix: tuple[str, ...] = ()):
+        self.prefix = prefix
+        self.literal_children = {}
+        self.pattern_children = []
+        self.tail_rules = []
+        self.rule = None
+
+    def get_pattern_child(self, segment_regex: re.Pattern) -> RadixNode:
+        """
+        Gives child node that is bound to segment regex, or creates new one.
+
+        :param segment_regex: compiled regex of url segment.
+        :return: child node.
+        """
+        for pattern, child in self.pattern_children:
+            if pattern == segment_regex:
+                return child
+
+        child = RadixNode()
+        self.pattern_children.append((segment_regex, child))
+        return child
+
+    def compress(self) -> None:
+        """
+        Merges chains of literal nodes that have nothing
+        but single literal child into one node.
+
+        :return: nothing.
+        """
+        for segment, child in self.literal_children.items():
+            while (
+                child.rule is None and
+                not child.pattern_children and
+                not child.tail_rules and
+                len(child.literal_children) == 1
+            ):
+                grandchild: RadixNode = next(
+                    iter(child.literal_children.values())
+                )
+                child.prefix += grandchild.prefix
+                child.literal_children = grandchild.literal_children
+                child.pattern_children = grandchild.pattern_children
+                child.tail_rules = grandchild.tail_rules
+                child.rule = grandchild.rule
+
+            child.compress()
+
+        for _, child in self.pattern_children:
+            child.compress()
+
+
+class RadixRouter(Router):
+    """
+    Router that stores rules with url parameters in compressed prefix tree,
+    so lookup time depends on how deep url is, and not on how many
+    routes are known to router.
+    Literal segments are always tried before segments with url parameters.
+    Parameters which values may contain "/" (like Path) are matched with
+    rules regex from the node where tree can't go deeper.
+    """
+    segment_safe_types: tuple[type, ...] = (
+        bool, int, float, str, UUID, datetime, date, time
+    )
+
+    _http_tree: RadixNode
+    _ws_tree: RadixNode
+
+    def __init__(
+        self,
+        match_cache_size: int = 1024,
+        miss_cache_size: int = 1024
+    ):
+        self._http_tree = RadixNode()
+        self._ws_tree = RadixNode()
+        super().__init__(match_cache_size, miss_cache_size)
+
+    def _build_indexes(self) -> None:
+        super()._build_indexes()
+        self._http_tree = self._build_tree(self._dynamic_http_rules)
+        self._ws_tree = self._build_tree(self._dynamic_ws_rules)
+
+    def _find_dynamic_http_handler(
+        self,
+        scope: HttpASGIConnectionScope
+    ) -> MatchedHandler[Type[HttpHandler]]:
+        return self._find_in_tree(self._http_tree, scope)
+
+    def _find_dynamic_ws_handler(
+        self,
+        scope: WebSocketASGIConnectionScope
+    ) -> MatchedHandler[Type[WebSocketHandler]]:
+        return self._find_in_tree(self._ws_tree, scope)
+
+    def _build_tree(self, rules: list[RegexRule[HandlerType]]) -> RadixNode:
+        """
+        Builds compressed prefix tree from list of rules.
+
+        :param rules: rules in order they must be matched.
+        :return: root of tree.
+        """
+        root = RadixNode()
+        for rule in rules:
+            node: RadixNode = root
+
+            for segment in rule.url.split("/"):
+                segment_regex: Optional[re.Pattern] = self._compile_segment(
+                    segment, rule.url_parameters_types
+                )
+
+                if segment_regex is None:
+                    node = node.literal_children.setdefault(
+                        segment, RadixNode((segment,))
+                    )
+
+                elif segment_regex.pattern == "":
+                    # Segment can't be matched separately from the rest
+                    # of url, so whole rules regex will be used
+                    node.tail_rules.append(rule)
+                    break
+
+                else:
+                    node = node.get_pattern_child(segment_regex)
+
+            else:
+                if node.rule is None:
+                    node.rule = rule
+
+                else:
+                    node.tail_rules.append(rule)
+
+        root.compress()
+        return root
+
+    def _compile_segment(
+        self,
+        segment: str,
+        url_parameters_types: dict[str, type]
+    ) -> Optional[re.Pattern]:
+        """
+        Compiles single segment of url.
+
+        :param segment: part of url between slashes.
+        :param url_parameters_types: types of rules url parameters.
+        :return: None if segment is literal, empty pattern if
+            segment can't be matched on its own, or segments regex.
+        """
+        parts: list[str] = url_parameter_regex.split(segment)
+        if len(parts) == 1:
+            return None
+
+        compiled_parts: list[str] = []
+        has_parameters: bool = False
+        for index, part in enumerate(parts):
+            if index % 2 == 0:
+                compiled_parts.append(re.escape(part))
+                continue
+
+            parameter_type: Optional[type] = url_parameters_types.get(part)
+
+            if parameter_type is None:
+                compiled_parts.append(re.escape(f"<{part}>"))
+                continue
+
+            if not self._is_segment_safe(parameter_type):
+                return re.compile("")
+
+            has_parameters = True
+            compiled_parts.append(
+                compile_type_to_named_group(part, parameter_type)
+            )
+
+        if not has_parameters:
+            return None
+
+        return re.compile("".join(compiled_parts))
+
+    def _is_segment_safe(self, type_to_check: type) -> bool:
+        """
+        Checks if values of type can never contain "/" in url.
+
+        :param type_to_check: url parameters type.
+        :return: can parameter be matched inside of single segment.
+        """
+        return (
+            issubclass(type_to_check, self.segment_safe_types) and
+            not issubclass(type_to_check, (CompilableUrlParameter, Path))
+        )
+
+    def _find_in_tree(
+        self,
+        tree: RadixNode,
+        scope: Union[HttpASGIConnectionScope, WebSocketASGIConnectionScope]
+    ) -> MatchedHandler:
+        """
+        Looks for handler in prefix tree.
+
+        :param tree: root of prefix tree.
+        :param scope: instance of scope.
+        :return: MatchedHandler instance.
+        :raises HandlerNotFound: if nothing matched.
+        """
+        matched_handler: Optional[MatchedHandler] = self._walk(
+            tree, tuple(scope.path.split("/")), 0, {}, scope.path
+        )
+
+        if matched_handler is None:
+            raise HandlerNotFound()
+
+        return matched_handler
+
+    def _walk(
+        self,
+        node: RadixNode,
+        segments: tuple[str, ...],
+        index: int,
+        arguments: dict[str, str],
+        path: str
+    ) -> Optional[MatchedHandler]:
+        """
+        Walks down the tree, trying literal edges before parameters.
+
+        :param node: current node, which prefix is already consumed.
+        :param segments: url split by "/".
+        :param index: index of first not consumed segment.
+        :param arguments: url parameters found on the way to that node.
+        :param path: requested path.
+        :return: MatchedHandler if something matched or None.
+        """
+        if index == len(segments):
+            if node.rule is not None:
+                return node.rule.make_matched_handler(
+                    MatchedArguments(arguments)
+                )
+
+        else:
+            segment: str = segments[index]
+            child: Optional[RadixNode] = node.literal_children.get(segment)
+
+            if child is not None:
+                prefix_end: int = index + len(child.prefix)
+                if segments[index:prefix_end] == child.prefix:
+                    matched = self._walk(
+                        child, segments, prefix_end, arguments, path
+                    )
+                    if matched is not None:
+                        return matched
+
+            for segment_regex, child in node.pattern_children:
+                segment_match: Optional[re.Match] = segment_regex.fullmatch(
+                    segment
+                )
+
+                if segment_match is None:
+                    continue
+
+                matched = self._walk(
+                    child, segments, index + 1,
+                    {**arguments, **segment_match.groupdict()}, path
+                )
+                if matched is not None:
+                    return matched
+
+        for rule in node.tail_rules:
+            url_parameters: Optional[re.Match] = rule.url_regex.fullmatch(
+                path
+            )
+            if url_parameters is not None:
+                return rule.make_matched_handler(url_parameters)
+
+        return None
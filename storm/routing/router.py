@@ -1,31 +1,79 @@
 from __future__ import annotations
 
-from typing import Type
+import pickle
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Type, TypeVar, Union
 
 from storm.internal_types.asgi import (
     HttpASGIConnectionScope,
     WebSocketASGIConnectionScope
 )
+from storm.loggers import events_logger
 from storm.request.handlers import (
     HttpHandler,
     WebSocketHandler,
     StormBaseHandler
 )
+from .lazy_rule import LazyRegexRule
+from .match_cache import MatchCache, NotCached, NOT_CACHED
+from .miss_cache import MissCache
 from .routing_exceptions import (
     NotMatchingRule,
     HandlerNotFound,
-    NotUniqueHandlerUrl
+    NotUniqueHandlerUrl,
+    StaleRoutingTable
 )
-from .rule import RegexRule, MatchedHandler
+from .routing_table import RoutingTable
+from .rule import RegexRule, MatchedHandler, HandlerType
+
+RouterType = TypeVar("RouterType", bound="Router")
 
 
 class Router:
+    # Marks router which lookups are too slow to be done on event loop
+    is_expensive: bool = False
+
     ws_rules: list[RegexRule[Type[WebSocketHandler]]]
     http_rules: list[RegexRule[Type[HttpHandler]]]
 
-    def __init__(self):
+    _static_ws_handlers: dict[str, MatchedHandler[Type[WebSocketHandler]]]
+    _static_http_handlers: dict[str, MatchedHandler[Type[HttpHandler]]]
+    _dynamic_ws_rules: list[RegexRule[Type[WebSocketHandler]]]
+    _dynamic_http_rules: list[RegexRule[Type[HttpHandler]]]
+
+    def __init__(
+        self,
+        match_cache_size: int = 1024,
+        miss_cache_size: int = 1024
+    ):
+        """
+        :param match_cache_size: how many paths matched with rules that have
+            url parameters will be remembered. Set 0 to disable cache.
+        :param miss_cache_size: how many paths that didn't match any rule
+            will be remembered. Set 0 to disable cache.
+        """
         self.ws_rules = []
         self.http_rules = []
+        self.http_match_cache: MatchCache = MatchCache(match_cache_size)
+        self.ws_match_cache: MatchCache = MatchCache(match_cache_size)
+        self.http_miss_cache: MissCache = MissCache(miss_cache_size)
+        self.ws_miss_cache: MissCache = MissCache(miss_cache_size)
+
+        self._static_ws_handlers = {}
+        self._static_http_handlers = {}
+        self._dynamic_ws_rules = []
+        self._dynamic_http_rules = []
+
+        # Rules are added one by one, so indexes are rebuilt only
+        # once before next lookup, and not on every added rule
+        self._are_indexes_stale: bool = False
+        # Indexes are rebuilt by first lookup after rules were changed,
+        # which may run in routing executor of app
+        self._indexes_lock: threading.RLock = threading.RLock()
+        self._known_ws_rules: set[RegexRule] = set()
+        self._known_http_rules: set[RegexRule] = set()
 
     def find_http_handler(
         self,
@@ -39,16 +87,38 @@ class Router:
         :raises HandlerNotFound: if didn't found any handler inside of
             router.
         """
-        for rule in self.http_rules:
-            try:
-                return rule.match(scope)
+        if self._are_indexes_stale:
+            self._rebuild_stale_indexes()
 
-            except NotMatchingRule:
-                continue
+        static_handler: Optional[
+            MatchedHandler[Type[HttpHandler]]
+        ] = self._static_http_handlers.get(scope.path)
 
-        else:
+        if static_handler is not None:
+            return static_handler
+
+        if self.http_miss_cache.is_known_miss(scope.path):
             raise HandlerNotFound()
 
+        cached_handler: Union[
+            MatchedHandler[Type[HttpHandler]], NotCached
+        ] = self.http_match_cache.get(scope.path)
+
+        if cached_handler is not NOT_CACHED:
+            return cached_handler  # type: ignore
+
+        try:
+            matched_handler: MatchedHandler[
+                Type[HttpHandler]
+            ] = self._find_dynamic_http_handler(scope)
+
+        except HandlerNotFound:
+            self.http_miss_cache.add(scope.path)
+            raise
+
+        self.http_match_cache.put(scope.path, matched_handler)
+        return matched_handler
+
     def find_ws_handler(
         self,
         scope: WebSocketASGIConnectionScope
@@ -61,7 +131,78 @@ class Router:
         :raises HandlerNotFound: if didn't found any handler inside of
             router.
         """
-        for rule in self.ws_rules:
+        if self._are_indexes_stale:
+            self._rebuild_stale_indexes()
+
+        static_handler: Optional[
+            MatchedHandler[Type[WebSocketHandler]]
+        ] = self._static_ws_handlers.get(scope.path)
+
+        if static_handler is not None:
+            return static_handler
+
+        if self.ws_miss_cache.is_known_miss(scope.path):
+            raise HandlerNotFound()
+
+        cached_handler: Union[
+            MatchedHandler[Type[WebSocketHandler]], NotCached
+        ] = self.ws_match_cache.get(scope.path)
+
+        if cached_handler is not NOT_CACHED:
+            return cached_handler  # type: ignore
+
+        try:
+            matched_handler: MatchedHandler[
+                Type[WebSocketHandler]
+            ] = self._find_dynamic_ws_handler(scope)
+
+        except HandlerNotFound:
+            self.ws_miss_cache.add(scope.path)
+            raise
+
+        self.ws_match_cache.put(scope.path, matched_handler)
+        return matched_handler
+
+    def _find_dynamic_http_handler(
+        self,
+        scope: HttpASGIConnectionScope
+    ) -> MatchedHandler[Type[HttpHandler]]:
+        """
+        Looks for http handler among rules that have url parameters.
+
+        :param scope: instance of scope.
+        :return: MatchedHandler instance.
+        :raises HandlerNotFound: if none of rules matched.
+        """
+        return self._match_rules(self._dynamic_http_rules, scope)
+
+    def _find_dynamic_ws_handler(
+        self,
+        scope: WebSocketASGIConnectionScope
+    ) -> MatchedHandler[Type[WebSocketHandler]]:
+        """
+        Looks for websocket handler among rules that have url parameters.
+
+        :param scope: instance of scope.
+        :return: MatchedHandler instance.
+        :raises HandlerNotFound: if none of rules matched.
+        """
+        return self._match_rules(self._dynamic_ws_rules, scope)
+
+    @staticmethod
+    def _match_rules(
+        rules: list[RegexRule[HandlerType]],
+        scope: Union[HttpASGIConnectionScope, WebSocketASGIConnectionScope]
+    ) -> MatchedHandler[HandlerType]:
+        """
+        Matches rules one by one in order they are given.
+
+        :param rules: list of rules.
+        :param scope: instance of scope.
+        :return: MatchedHandler instance of first matched rule.
+        :raises HandlerNotFound: if none of rules matched.
+        """
+        for rule in rules:
             try:
                 return rule.match(scope)
 
@@ -71,26 +212,50 @@ class Router:
         else:
             raise HandlerNotFound()
 
-    def add_handler(self, handler_type: type, url: str) -> None:
+    def add_handler(
+        self,
+        handler_type: Union[type, str],
+        url: str,
+        url_parameters: Optional[dict[str, type]] = None,
+        is_websocket: bool = False
+    ) -> None:
         """
         Adds other handler inside of router.
 
-        :param handler_type: handlers type.
+        :param handler_type: handlers type, or path to it like
+            "package.module:ClassName". Handlers given by path are imported
+            when their url is requested for the first time.
         :param url: url that handler will be bound to.
+        :param url_parameters: types of url parameters by their names.
+            Used only with handlers given by path, because they can't be
+            inspected before they are imported.
+        :param is_websocket: tells that handler given by path
+            is websocket handler.
         :return: nothing.
         """
+        rule: RegexRule
+        rules: list[RegexRule]
+        known_rules: set[RegexRule]
 
-        if issubclass(handler_type, HttpHandler):
-            if handler_type in self.http_rules:
-                raise NotUniqueHandlerUrl()
+        if isinstance(handler_type, str):
+            handler_base: Type[StormBaseHandler] = \
+                WebSocketHandler if is_websocket else HttpHandler
+            rule = LazyRegexRule(
+                handler_type, url, url_parameters or {}, handler_base
+            )
+            rules = self.ws_rules if is_websocket else self.http_rules
+            known_rules = self._known_ws_rules if is_websocket \
+                else self._known_http_rules
 
-            self.http_rules.append(RegexRule(handler_type, url))
+        elif issubclass(handler_type, HttpHandler):
+            rule = RegexRule(handler_type, url)
+            rules = self.http_rules
+            known_rules = self._known_http_rules
 
         elif issubclass(handler_type, WebSocketHandler):
-            if handler_type in self.ws_rules:
-                raise NotUniqueHandlerUrl()
-
-            self.ws_rules.append(RegexRule(handler_type, url))
+            rule = RegexRule(handler_type, url)
+            rules = self.ws_rules
+            known_rules = self._known_ws_rules
 
         else:
             raise ValueError(
@@ -98,6 +263,28 @@ class Router:
                 "is not subclass of StormBaseHandler"
             )
 
+        if rule in known_rules:
+            raise NotUniqueHandlerUrl(
+                f"Duplicate url {url} has been found "
+                f"in handler: {rule.handler_name}"
+            )
+
+        rules.append(rule)
+        known_rules.add(rule)
+        self._invalidate_indexes()
+
+    def import_lazy_handlers(self) -> None:
+        """
+        Imports all handlers that were given to router by path.
+
+        :return: nothing.
+        """
+        for rule in (*self.http_rules, *self.ws_rules):
+            if isinstance(rule, LazyRegexRule):
+                rule.handler
+
+        self._rebuild_indexes()
+
     def merge_router(self, another_router: Router) -> None:
         """
         Merges passed router into current one.
@@ -105,32 +292,119 @@ class Router:
         :return: nothing.
         """
         for http_rule in another_router.http_rules:
-            if http_rule.handler in self.http_rules:
+            if http_rule in self._known_http_rules:
                 raise NotUniqueHandlerUrl(
                     f"Duplicate url {http_rule.url} has been found "
                     "in handlers:"
-                    f" {type(http_rule.handler).__name__}"
+                    f" {http_rule.handler_name}"
                 )
 
             else:
-                assert issubclass(http_rule.handler, HttpHandler), (
+                assert http_rule.is_rule_for(HttpHandler), (
                     "Router.ws_rules must only contain http handler types"
                 )
                 self.http_rules.append(http_rule)
+                self._known_http_rules.add(http_rule)
 
         for ws_rule in another_router.ws_rules:
-            if ws_rule in self.ws_rules:
+            if ws_rule in self._known_ws_rules:
                 raise NotUniqueHandlerUrl(
                     f"Duplicate url {ws_rule.url} has been found "
                     "in handlers:"
-                    f" {type(ws_rule.handler).__name__}"
+                    f" {ws_rule.handler_name}"
                 )
 
             else:
-                assert issubclass(ws_rule.handler, WebSocketHandler), (
+                assert ws_rule.is_rule_for(WebSocketHandler), (
                     "Router.ws_rules must only contain websocket handler types"
                 )
                 self.ws_rules.append(ws_rule)
+                self._known_ws_rules.add(ws_rule)
+
+        self._invalidate_indexes()
+
+    def compile(self) -> RoutingTable:
+        """
+        Makes immutable routing table from rules of this router, which can
+        be saved to file and used to restore router faster.
+
+        :return: RoutingTable instance.
+        """
+        self.order_routes()
+        return RoutingTable.from_rules(self.http_rules, self.ws_rules)
+
+    @classmethod
+    def from_routing_table(
+        cls: Type[RouterType],
+        table: RoutingTable
+    ) -> RouterType:
+        """
+        Restores router from routing table. Handlers parameters are given
+        to handlers before they are imported, and urls aren't compiled again.
+
+        :param table: routing table.
+        :return: router instance.
+        :raises StaleRoutingTable: if some handler of table can't
+            be imported.
+        """
+        table.install_parameters()
+        router = cls()
+        try:
+            router.http_rules = table.make_http_rules()
+            router.ws_rules = table.make_ws_rules()
+
+        except (ImportError, AttributeError) as err:
+            raise StaleRoutingTable(
+                "Handlers of routing table can't be imported"
+            ) from err
+
+        finally:
+            # Handlers, that were imported before table was installed,
+            # never take their parameters
+            table.discard_parameters()
+
+        router._rebuild_indexes()
+        return router
+
+    @classmethod
+    def load_compiled(
+        cls: Type[RouterType],
+        path: Union[str, Path],
+        build_router: Callable[[], Router]
+    ) -> RouterType:
+        """
+        Restores router from routing table saved in file. If there's no
+        such file, or table is outdated, router is built with
+        build_router and its table is saved to that path.
+        Table is unpickled, which can run any code, so file must be
+        writable only by those who are trusted to run code of application.
+
+        :param path: path to routing table file.
+        :param build_router: function that imports handlers and makes
+            router the usual way.
+        :return: router instance.
+        """
+        try:
+            return cls.from_routing_table(RoutingTable.load(path))
+
+        except (FileNotFoundError, StaleRoutingTable) as err:
+            events_logger.info(f"Routing table will be rebuilt: {err}")
+
+        router: Router = build_router()
+        routing_table: RoutingTable = router.compile()
+        try:
+            routing_table.save(path)
+
+        except (OSError, pickle.PicklingError, TypeError,
+                AttributeError) as err:
+            events_logger.warning(
+                f"Failed to save routing table to {path}", exc_info=err
+            )
+
+        if type(router) is not cls:
+            return cls.from_routing_table(routing_table)
+
+        return router  # type: ignore
 
     def order_routes(self) -> None:
         self.ws_rules.sort(
@@ -139,3 +413,98 @@ class Router:
         self.http_rules.sort(
             key=lambda v: (v.is_static is True, v.url)
         )
+        self._rebuild_indexes()
+
+    def _invalidate_indexes(self) -> None:
+        """
+        Marks indexes as outdated, so they are rebuilt before next lookup.
+
+        :return: nothing.
+        """
+        with self._indexes_lock:
+            self._are_indexes_stale = True
+            self.http_match_cache.clear()
+            self.ws_match_cache.clear()
+            self.http_miss_cache.clear()
+            self.ws_miss_cache.clear()
+
+    def _rebuild_indexes(self) -> None:
+        """
+        Rebuilds lookup structures and caches from rules lists. Indexes
+        are marked as fresh only after everything is rebuilt, so other
+        threads never look up new paths in old indexes and remember them
+        as missed.
+
+        :return: nothing.
+        """
+        with self._indexes_lock:
+            self._build_indexes()
+            self.http_match_cache.clear()
+            self.ws_match_cache.clear()
+            self.http_miss_cache.index_rules(self.http_rules)
+            self.ws_miss_cache.index_rules(self.ws_rules)
+            self._are_indexes_stale = False
+
+    def _rebuild_stale_indexes(self) -> None:
+        """
+        Rebuilds indexes, if other thread didn't rebuild them yet.
+
+        :return: nothing.
+        """
+        with self._indexes_lock:
+            if self._are_indexes_stale:
+                self._rebuild_indexes()
+
+    def _build_indexes(self) -> None:
+        """
+        Builds lookup structures from rules lists. Static rules are
+        put in dictionary by their exact url, so they are found with
+        single lookup, and only rules with url parameters are left to be
+        matched one by one. Subclasses extend it to build their own
+        structures.
+
+        :return: nothing.
+        """
+        self._static_http_handlers, self._dynamic_http_rules = \
+            self._split_rules(self.http_rules)
+        self._static_ws_handlers, self._dynamic_ws_rules = \
+            self._split_rules(self.ws_rules)
+        self._known_http_rules = set(self.http_rules)
+        self._known_ws_rules = set(self.ws_rules)
+
+    @staticmethod
+    def _split_rules(
+        rules: list[RegexRule[HandlerType]]
+    ) -> tuple[
+        dict[str, MatchedHandler[HandlerType]],
+        list[RegexRule[HandlerType]]
+    ]:
+        """
+        Splits rules into index of static urls and list of rules
+        that must be matched with regex.
+
+        :param rules: list of rules in order they must be matched.
+        :return: static urls index and dynamic rules list.
+        """
+        static_handlers: dict[str, MatchedHandler[HandlerType]] = {}
+        dynamic_rules: list[RegexRule[HandlerType]] = []
+
+        for rule in rules:
+            if not rule.is_static:
+                dynamic_rules.append(rule)
+                continue
+
+            # Static urls are escaped when compiled,
+            # so they always match themselves
+            static_match: Optional[re.Match] = rule.url_regex.fullmatch(
+                rule.url
+            )
+            if static_match is None or rule.url in static_handlers:
+                dynamic_rules.append(rule)
+                continue
+
+            static_handlers[rule.url] = rule.make_matched_handler(
+                static_match
+            )
+
+        return static_handlers, dynamic_rules
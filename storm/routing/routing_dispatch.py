@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class RoutingDispatch(Enum):
+    """
+    Sets where app looks for handlers of incoming requests.
+
+    inline - lookup runs right on event loop.
+    executor - lookup always runs in apps routing executor.
+    auto - lookup runs on event loop, unless router is marked as expensive.
+    """
+    inline = "inline"
+    executor = "executor"
+    auto = "auto"
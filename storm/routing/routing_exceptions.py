@@ -14,3 +14,10 @@ class NotUniqueHandlerUrl(ValueError):
     """
     Raised when there are two handlers bound to the router.
     """
+
+
+class StaleRoutingTable(ValueError):
+    """
+    Raised when saved routing table can't be used, because handlers
+    changed since it was made.
+    """
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional, Type, Union
+
+import storm
+from storm.request.handlers import (
+    HttpHandler,
+    StormBaseHandler,
+    WebSocketHandler
+)
+from storm.request.handlers._compiled_url_return import CompiledUrl
+from storm.request.handlers.preloaded_parameters import (
+    PreloadedParameters,
+    discard_preloaded_parameters,
+    get_handler_path,
+    preload_parameters
+)
+from .lazy_rule import LazyRegexRule, import_handler
+from .routing_exceptions import StaleRoutingTable
+from .rule import RegexRule
+
+
+@lru_cache(maxsize=None)
+def get_module_source_hash(module_name: str) -> Optional[str]:
+    """
+    Hashes source file of module without importing it.
+
+    :param module_name: full name of module.
+    :return: sha256 hex digest of modules source or None if module
+        has no source file.
+    """
+    try:
+        spec = find_spec(module_name)
+
+    except (ImportError, ValueError):
+        return None
+
+    if spec is None or spec.origin is None or not os.path.isfile(spec.origin):
+        return None
+
+    with open(spec.origin, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
+
+
+def get_modules_source_hash(modules_names: tuple[str, ...]) -> Optional[str]:
+    """
+    Hashes source files of several modules together.
+
+    :param modules_names: full names of modules.
+    :return: sha256 hex digest or None if any of modules has no source file.
+    """
+    sources_hash = hashlib.sha256()
+    for module_name in modules_names:
+        module_hash: Optional[str] = get_module_source_hash(module_name)
+        if module_hash is None:
+            return None
+
+        sources_hash.update(module_hash.encode())
+
+    return sources_hash.hexdigest()
+
+
+def get_handler_modules(handler: Type[StormBaseHandler]) -> tuple[str, ...]:
+    """
+    Gives names of modules where handler and its base handlers are defined,
+    because any of them can change handlers parameters.
+
+    :param handler: handler class.
+    :return: modules names.
+    """
+    return tuple(dict.fromkeys(
+        base.__module__
+        for base in handler.__mro__
+        if issubclass(base, StormBaseHandler)
+    ))
+
+
+@dataclass(frozen=True)
+class CompiledRoute:
+    """
+    Everything that is needed to restore routers rule
+    without inspecting handler. Routes of lazy rules have no parameters,
+    because their handlers aren't imported to compile table.
+    """
+    handler_path: str
+    source_modules: tuple[str, ...]
+    source_hash: Optional[str]
+    url: str
+    url_regex: str
+    is_static: bool
+    url_parameters_types: dict[str, type]
+    parameters: Optional[PreloadedParameters]
+
+    @classmethod
+    def from_rule(cls, rule: RegexRule) -> CompiledRoute:
+        if isinstance(rule, LazyRegexRule) and not rule.is_imported:
+            source_modules: tuple[str, ...] = (
+                rule.handler_path.partition(":")[0],
+            )
+            return cls(
+                handler_path=rule.handler_path,
+                source_modules=source_modules,
+                source_hash=get_modules_source_hash(source_modules),
+                url=rule.url,
+                url_regex=rule.url_regex.pattern,
+                is_static=rule.is_static,
+                url_parameters_types=rule.url_parameters_types,
+                parameters=None
+            )
+
+        handler: Type[StormBaseHandler] = rule.handler
+        source_modules = get_handler_modules(handler)
+        return cls(
+            handler_path=get_handler_path(handler),
+            source_modules=source_modules,
+            source_hash=get_modules_source_hash(source_modules),
+            url=rule.url,
+            url_regex=rule.url_regex.pattern,
+            is_static=rule.is_static,
+            url_parameters_types=rule.url_parameters_types,
+            parameters=PreloadedParameters(
+                is_static_url=handler.is_static_url,
+                query_parameters=dict(handler._query_parameters_properties),
+                url_parameters=dict(handler._url_parameters_properties),
+                cookies=dict(handler._cookies_properties),
+                form_parameters=dict(handler._form_parameters_properties)
+            )
+        )
+
+    def is_stale(self) -> bool:
+        """
+        Checks if source of handlers modules has changed since
+        route was compiled.
+
+        :return: is route outdated.
+        """
+        return (
+            self.source_hash is None or
+            self.source_hash != get_modules_source_hash(self.source_modules)
+        )
+
+
+@dataclass(frozen=True)
+class RoutingTable:
+    """
+    Immutable routing table that is made by Router.compile and can be
+    saved to file, so workers can restore router from it without compiling
+    urls and inspecting handlers type hints.
+    """
+    storm_version: str
+    http_routes: tuple[CompiledRoute, ...]
+    ws_routes: tuple[CompiledRoute, ...]
+
+    @classmethod
+    def from_rules(
+        cls,
+        http_rules: list[RegexRule],
+        ws_rules: list[RegexRule]
+    ) -> RoutingTable:
+        """
+        Makes routing table from ordered rules.
+
+        :param http_rules: http rules in order they must be matched.
+        :param ws_rules: websocket rules in order they must be matched.
+        :return: RoutingTable instance.
+        """
+        return cls(
+            storm_version=storm.__version__,
+            http_routes=tuple(
+                CompiledRoute.from_rule(rule) for rule in http_rules
+            ),
+            ws_routes=tuple(
+                CompiledRoute.from_rule(rule) for rule in ws_rules
+            )
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Saves routing table to file. File is replaced atomically, so
+        workers never read partially written table.
+
+        :param path: path to file.
+        :return: nothing.
+        """
+        directory: str = os.path.dirname(os.path.abspath(path))
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as table_file:
+                pickle.dump(self, table_file, pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, path)
+
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> RoutingTable:
+        """
+        Loads routing table from file. Table is unpickled, which can run
+        any code, so file must be writable only by those who are trusted
+        to run code of application.
+
+        :param path: path to file.
+        :return: RoutingTable instance.
+        :raises StaleRoutingTable: if file can't be used with this
+            version of storm, or table is outdated.
+        :raises FileNotFoundError: if there's no such file.
+        """
+        with open(path, "rb") as table_file:
+            try:
+                table = pickle.load(table_file)
+
+            except (pickle.UnpicklingError, EOFError, AttributeError,
+                    ImportError) as err:
+                raise StaleRoutingTable(
+                    f"Routing table {path} can not be loaded"
+                ) from err
+
+        if not isinstance(table, cls) or \
+                table.storm_version != storm.__version__:
+            raise StaleRoutingTable(
+                f"Routing table {path} was made by other version of storm"
+            )
+
+        if table.is_stale():
+            raise StaleRoutingTable(
+                f"Handlers source changed since routing table {path} was made"
+            )
+
+        return table
+
+    @property
+    def routes(self) -> tuple[CompiledRoute, ...]:
+        return self.http_routes + self.ws_routes
+
+    def is_stale(self) -> bool:
+        """
+        Checks if source of any handlers module has changed since
+        table was made.
+
+        :return: is table outdated.
+        """
+        return any(route.is_stale() for route in self.routes)
+
+    def install_parameters(self) -> None:
+        """
+        Gives handlers parameters to handlers, which aren't imported yet,
+        so they won't inspect their type hints once imported.
+
+        :return: nothing.
+        """
+        for route in self.routes:
+            if route.parameters is not None:
+                preload_parameters(route.handler_path, route.parameters)
+
+    def discard_parameters(self) -> None:
+        """
+        Forgets parameters given by install_parameters, that weren't
+        taken by handlers.
+
+        :return: nothing.
+        """
+        for route in self.routes:
+            if route.parameters is not None:
+                discard_preloaded_parameters(route.handler_path)
+
+    def make_rules(
+        self,
+        routes: tuple[CompiledRoute, ...],
+        handler_base: Type[StormBaseHandler]
+    ) -> list[RegexRule]:
+        """
+        Restores routers rules from compiled routes.
+
+        :param routes: compiled routes.
+        :param handler_base: class that handlers of routes are subclasses of.
+        :return: list of rules in same order.
+        """
+        rules: list[RegexRule] = []
+        for route in routes:
+            compiled_url = CompiledUrl(
+                re.compile(route.url_regex), route.is_static
+            )
+
+            if route.parameters is None:
+                rules.append(
+                    LazyRegexRule(
+                        route.handler_path, route.url,
+                        route.url_parameters_types, handler_base,
+                        compiled_url
+                    )
+                )
+
+            else:
+                rules.append(
+                    RegexRule(
+                        import_handler(route.handler_path),
+                        route.url,
+                        compiled_url
+                    )
+                )
+
+        return rules
+
+    def make_http_rules(self) -> list[RegexRule]:
+        return self.make_rules(self.http_routes, HttpHandler)
+
+    def make_ws_rules(self) -> list[RegexRule]:
+        return self.make_rules(self.ws_routes, WebSocketHandler)
@@ -3,28 +3,28 @@ from __future__ import annotations
 import re
 from typing import (
     Union, Type, TypeVar, Any,
-    Generic, overload
+    Generic, Optional
 )
 
 from storm.internal_types.asgi import (
     HttpASGIConnectionScope,
     WebSocketASGIConnectionScope
 )
-from storm.request.handlers import (
-    HttpHandler,
-    WebSocketHandler,
-    StormBaseHandler
-)
+from storm.request.handlers import StormBaseHandler
+from storm.request.handlers._compiled_url_return import CompiledUrl
+from storm.request.handlers.utils import UrlArguments
 from .routing_exceptions import NotMatchingRule
 
 HandlerType = TypeVar("HandlerType", bound=Type[StormBaseHandler])
 
 
 class MatchedHandler(Generic[HandlerType]):
+    __slots__ = ("handler", "arguments")
+
     handler: HandlerType
-    arguments: re.Match
+    arguments: UrlArguments
 
-    def __init__(self, handler: HandlerType, arguments: re.Match):
+    def __init__(self, handler: HandlerType, arguments: UrlArguments):
         self.handler = handler
         self.arguments = arguments
 
@@ -34,13 +34,29 @@ class RegexRule(Generic[HandlerType]):
     Class that is used internally to find if handler known to this
     rule is one that been asked for.
     """
-    def __init__(self, handler: HandlerType, url: str):
+    __slots__ = ("url", "handler", "url_regex", "is_static")
+
+    def __init__(
+        self,
+        handler: HandlerType,
+        url: str,
+        compiled_url: Optional[CompiledUrl] = None
+    ):
+        """
+        :param handler: handler class.
+        :param url: url that handler is bound to.
+        :param compiled_url: already compiled url (for example, loaded
+            from routing table). If not given, url will be compiled.
+        """
         self.url: str = url
         self.handler: HandlerType = handler
-        url_regex, is_static = handler._compile_url_regex(  # noqa:
-            # this is internal stuff, but we don't need end users to see it
-            handler, url
-        )
+        if compiled_url is None:
+            compiled_url = handler._compile_url_regex(  # noqa:
+                # this is internal stuff, but we don't need end users to see it
+                handler, url
+            )
+
+        url_regex, is_static = compiled_url
         self.url_regex: re.Pattern = url_regex
         self.is_static: bool = is_static
 
@@ -59,11 +75,52 @@ class RegexRule(Generic[HandlerType]):
         if url_parameters is None:
             raise NotMatchingRule()
 
-        return MatchedHandler(self.handler, url_parameters)
+        return self.make_matched_handler(url_parameters)
+
+    def make_matched_handler(
+        self,
+        arguments: UrlArguments
+    ) -> MatchedHandler[HandlerType]:
+        """
+        Makes MatchedHandler for this rules handler.
+
+        :param arguments: url parameters found in path.
+        :return: MatchedHandler instance.
+        """
+        return MatchedHandler(self.handler, arguments)
+
+    @property
+    def url_parameters_types(self) -> dict[str, type]:
+        """
+        Types of url parameters by their names.
+
+        :return: dictionary of types.
+        """
+        return {
+            name: properties.casted_to_type
+            for name, properties in
+            self.handler._url_parameters_properties.items()
+        }
+
+    @property
+    def handler_name(self) -> str:
+        return self.handler.__name__
+
+    def is_rule_for(self, handler_base: Type[StormBaseHandler]) -> bool:
+        """
+        Checks if rules handler is subclass of given handler type.
+
+        :param handler_base: some handler class.
+        :return: is handler subclass of handler_base.
+        """
+        return issubclass(self.handler, handler_base)
 
     def __eq__(self, other: Any) -> bool:
         if issubclass(type(other), RegexRule):
             return other.url_regex == self.url_regex
 
         else:
-            raise ValueError(f"Can not compare RegexRule instance and {other}")
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.url_regex)
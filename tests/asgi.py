@@ -0,0 +1,68 @@
+"""
+Helpers, that send requests to app like ASGI server does.
+"""
+import asyncio
+from typing import Optional
+
+from storm.app import StormApp
+from storm.routing import Router
+
+
+def make_app(router: Router, **kwargs) -> StormApp:
+    return StormApp(router, {}, debug=False, **kwargs)
+
+
+def make_raw_scope(
+    method: str = "GET",
+    path: str = "/",
+    query_string: bytes = b"",
+    headers: Optional[list] = None
+) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "https",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(b"host", b"localhost")] + (headers or []),
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+        "state": {},
+    }
+
+
+def request(
+    app: StormApp,
+    method: str = "GET",
+    path: str = "/",
+    query_string: bytes = b"",
+    headers: Optional[list] = None,
+    body: bytes = b""
+) -> tuple:
+    """
+    Sends request to app.
+
+    :return: status, headers and body of response.
+    """
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(
+        app(make_raw_scope(method, path, query_string, headers), receive, send)
+    )
+    assert sent, "app sent nothing"
+    start = sent[0]
+    return (
+        start["status"],
+        dict(start["headers"]),
+        b"".join(message.get("body", b"") for message in sent[1:])
+    )
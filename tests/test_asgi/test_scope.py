@@ -0,0 +1,127 @@
+import asyncio
+import sys
+import tracemalloc
+
+import pytest
+
+from storm.internal_types.asgi import (
+    ASGIApp,
+    HttpASGIConnectionScope,
+    WebSocketASGIConnectionScope,
+    check_asgi_version
+)
+
+SCOPES_COUNT = 10_000
+
+
+def make_raw_scope() -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "https",
+        "path": "/api/items/1",
+        "raw_path": b"/api/items/1",
+        "root_path": "",
+        "query_string": b"page=1",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+        "state": {},
+    }
+
+
+class RecordingApp(ASGIApp):
+    def __init__(self):
+        self.scopes = []
+
+    async def http_asgi_app(self, scope, receive, send):
+        self.scopes.append(scope)
+
+    async def websocket_asgi_app(self, scope, receive, send):
+        self.scopes.append(scope)
+
+    async def lifetime_asgi_app(self, scope, receive, send):
+        self.scopes.append(scope)
+
+
+def test_scope_wraps_servers_dict():
+    raw_scope = make_raw_scope()
+    scope = HttpASGIConnectionScope(raw_scope)
+
+    assert scope.raw is raw_scope
+    assert scope.path == "/api/items/1"
+    assert scope.method == "GET"
+    assert scope.scheme == "https"
+    assert scope.headers is raw_scope["headers"]
+    assert not hasattr(scope, "__dict__")
+
+    scope.path = "/other"
+    assert raw_scope["path"] == "/other"
+
+
+def test_missing_fields_have_defaults():
+    scope = WebSocketASGIConnectionScope({"type": "websocket", "path": "/"})
+
+    assert scope.scheme == "ws"
+    assert scope.root_path == ""
+    assert scope.query_string == b""
+    assert tuple(scope.subprotocols) == ()
+    assert scope.http_version == "1.1"
+
+
+def test_scope_from_fields():
+    scope = HttpASGIConnectionScope(type="http", path="/", method="POST")
+
+    assert scope.raw == {"type": "http", "path": "/", "method": "POST"}
+    assert scope.method == "POST"
+
+    with pytest.raises(TypeError):
+        HttpASGIConnectionScope(make_raw_scope(), path="/")
+
+
+def test_wrapping_scope_does_not_copy_it():
+    raw_scope = make_raw_scope()
+    scope_size = sys.getsizeof(HttpASGIConnectionScope(raw_scope))
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        scopes = [
+            HttpASGIConnectionScope(raw_scope) for _ in range(SCOPES_COUNT)
+        ]
+        after, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    # Every scope takes only its own slots and a pointer in the list
+    bytes_per_scope = (after - before) / len(scopes)
+    assert bytes_per_scope <= scope_size + 16
+    assert bytes_per_scope < sys.getsizeof(dict(raw_scope))
+
+
+def test_asgi_version_is_checked_once():
+    app = RecordingApp()
+    raw_scope = make_raw_scope()
+
+    asyncio.run(app(raw_scope, None, None))
+    assert app.scopes[0].raw is raw_scope
+
+    # Version isn't checked for following requests
+    raw_scope["asgi"] = {"version": "2.0"}
+    asyncio.run(app(raw_scope, None, None))
+    assert len(app.scopes) == 2
+
+
+def test_unsupported_asgi_version_is_rejected():
+    app = RecordingApp()
+    raw_scope = make_raw_scope()
+    raw_scope["asgi"] = {"version": "2.0"}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(app(raw_scope, None, None))
+
+    with pytest.raises(RuntimeError):
+        check_asgi_version({"version": "3.0", "spec_version": "1.0"})
@@ -0,0 +1,86 @@
+import pytest
+
+from storm.i18n import (
+    LocaleNegotiator,
+    normalize_locale,
+    parse_accept_language
+)
+from storm.internal_types import LocaleProbability
+
+
+@pytest.mark.parametrize("locale, normalized", [
+    ("en", "en"),
+    ("EN-us", "en_US"),
+    (" pt_br ", "pt_BR"),
+])
+def test_normalize_locale(locale, normalized):
+    assert normalize_locale(locale) == normalized
+
+
+def test_locales_are_sorted_by_weight():
+    assert parse_accept_language("da, en-gb;q=0.8, en;q=0.7") == (
+        LocaleProbability("da", 1.0),
+        LocaleProbability("en_GB", 0.8),
+        LocaleProbability("en", 0.7),
+    )
+
+
+def test_equal_weights_keep_order():
+    assert parse_accept_language("fr;q=0.5, de;q=0.9, es;q=0.5") == (
+        LocaleProbability("de", 0.9),
+        LocaleProbability("fr", 0.5),
+        LocaleProbability("es", 0.5),
+    )
+
+
+@pytest.mark.parametrize("accept_language, locales", [
+    # Zero and invalid weights aren't acceptable
+    ("en;q=0, ru", ("ru",)),
+    ("en;q=high, ru;q=0.5", ("ru",)),
+    ("en;q=-1, ru;q=nan", ()),
+    # Weight is capped by 1 and other parameters are ignored
+    ("en;q=0.5, ru;level=1;q=7", ("ru", "en")),
+    (" , ;q=1, de", ("de",)),
+    ("", ()),
+])
+def test_invalid_weights(accept_language, locales):
+    assert tuple(
+        locale for locale, _ in parse_accept_language(accept_language)
+    ) == locales
+
+
+def test_wildcard_is_kept():
+    assert parse_accept_language("*;q=0.1, ja") == (
+        LocaleProbability("ja", 1.0),
+        LocaleProbability("*", 0.1),
+    )
+
+
+@pytest.fixture
+def negotiator():
+    return LocaleNegotiator(["en_US", "en_GB", "ru", "pt-BR"], "en_US")
+
+
+@pytest.mark.parametrize("accept_language, locale", [
+    ("ru-RU, en;q=0.5", "ru"),
+    ("en-GB", "en_GB"),
+    # Locale of the same language is used, default one if there are many
+    ("en-AU", "en_US"),
+    ("pt", "pt_BR"),
+    ("de, pt-PT;q=0.3", "pt_BR"),
+    # Wildcard and unknown locales give default locale
+    ("de, *;q=0.5, ru;q=0.1", "en_US"),
+    ("de", "en_US"),
+    ("ru;q=0", "en_US"),
+    ("", "en_US"),
+])
+def test_negotiation(negotiator, accept_language, locale):
+    assert negotiator.negotiate(accept_language) == locale
+
+
+def test_locale_without_region_is_preferred():
+    negotiator = LocaleNegotiator(["en_GB", "en", "en_AU"], "ru")
+
+    assert negotiator.negotiate("en-US") == "en"
+    assert negotiator.find_supported_locale("en_NZ") == "en"
+    assert negotiator.find_supported_locale("de") is None
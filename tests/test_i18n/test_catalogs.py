@@ -0,0 +1,116 @@
+import gettext
+import struct
+
+import pytest
+
+from storm.i18n import TranslationCatalog, Translations
+
+HEADER = (
+    "Content-Type: text/plain; charset=UTF-8\n"
+    "Plural-Forms: nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : "
+    "n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);\n"
+)
+RU_MESSAGES = {
+    "": HEADER,
+    "Hello": "Привет",
+    "menu\x04Open": "Открыть меню",
+    "file\0files": "файл\0файла\0файлов",
+}
+
+
+def make_mo(messages: dict) -> bytes:
+    """
+    Compiles messages into .mo file, like msgfmt does.
+    """
+    ids = sorted(messages)
+    encoded_ids = [message_id.encode() for message_id in ids]
+    encoded_messages = [messages[message_id].encode() for message_id in ids]
+
+    header_size = 7 * 4
+    ids_table = header_size
+    messages_table = ids_table + len(ids) * 8
+    data_offset = messages_table + len(ids) * 8
+
+    tables = [[], []]
+    data = b""
+    for table, strings in zip(tables, (encoded_ids, encoded_messages)):
+        for string in strings:
+            table.append((len(string), data_offset + len(data)))
+            data += string + b"\0"
+
+    return (
+        struct.pack(
+            "<7I", 0x950412de, 0, len(ids), ids_table, messages_table, 0, 0
+        )
+        + b"".join(struct.pack("<2I", *entry) for entry in tables[0])
+        + b"".join(struct.pack("<2I", *entry) for entry in tables[1])
+        + data
+    )
+
+
+@pytest.fixture
+def locale_dir(tmp_path):
+    for directory, messages in (
+        ("ru", RU_MESSAGES),
+        ("en-GB", {"": HEADER, "Hello": "Hiya"}),
+    ):
+        messages_dir = tmp_path / directory / "LC_MESSAGES"
+        messages_dir.mkdir(parents=True)
+        (messages_dir / "messages.mo").write_bytes(make_mo(messages))
+
+    # Directory without catalog of domain isn't a locale
+    (tmp_path / "de").mkdir()
+    return str(tmp_path)
+
+
+def test_catalogs_are_loaded(locale_dir):
+    translations = Translations(locale_dir, default_locale="en_US")
+    translations.load()
+
+    assert translations.supported_locales == {"ru", "en_GB", "en_US"}
+
+    ru = translations.get_catalog("ru")
+    assert ru.gettext("Hello") == "Привет"
+    assert ru.gettext("Unknown") == "Unknown"
+    assert ru.pgettext("menu", "Open") == "Открыть меню"
+    assert ru.pgettext("file", "Open") == "Open"
+    assert [ru.ngettext("file", "files", n) for n in (1, 3, 5)] == \
+        ["файл", "файла", "файлов"]
+
+    assert translations.get_catalog("en_GB").gettext("Hello") == "Hiya"
+    # Default locale has no catalog and keeps messages untranslated
+    assert translations.get_catalog("en_US").gettext("Hello") == "Hello"
+
+
+def test_catalog_of_other_locale_is_found(locale_dir):
+    translations = Translations(
+        locale_dir, supported_locales=["ru"], default_locale="en"
+    )
+
+    assert translations.get_catalog("ru_RU").locale == "ru"
+    assert translations.get_catalog("de").locale == "en"
+    assert translations.negotiate_locale("de, ru-RU;q=0.5") == "ru"
+
+
+def test_missing_locale_dir():
+    translations = Translations("/nonexistent", default_locale="en")
+
+    assert translations.supported_locales == {"en"}
+    assert translations.get_catalog("en").gettext("Hello") == "Hello"
+
+
+class UpperTranslations(gettext.NullTranslations):
+    def gettext(self, message):
+        if message.startswith("menu\x04"):
+            return message.upper()
+
+        return message.upper() if message == "Hello" else message
+
+
+def test_translations_without_catalog_are_asked():
+    catalog = TranslationCatalog("en", UpperTranslations())
+
+    assert catalog.gettext("Hello") == "HELLO"
+    assert catalog.gettext("Bye") == "Bye"
+    assert catalog.pgettext("menu", "Open") == "MENU\x04OPEN"
+    assert catalog.pgettext("file", "Open") == "Open"
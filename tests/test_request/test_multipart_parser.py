@@ -0,0 +1,205 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from storm.request.form import MultipartParseError, MultipartParser, read_form
+from storm.request.form.multipart_parser import (
+    FORM_END,
+    PART_END,
+    PartHeaders
+)
+from storm.responses.http.http_errors import HttpError
+
+BOUNDARY = b"x-boundary"
+CONTENT_TYPE = "multipart/form-data; boundary=x-boundary"
+BODY = (
+    b"preamble\r\n"
+    b"--x-boundary\r\n"
+    b'Content-Disposition: form-data; name="title"\r\n'
+    b"\r\n"
+    b"Quarterly report\r\n"
+    b"--x-boundary\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="r.csv"\r\n'
+    b"Content-Type: text/csv\r\n"
+    b"\r\n"
+    b"id,total\r\n1,--x-bound\r\n2,\r\n-x-boundary\r\n"
+    b"--x-boundary--\r\n"
+    b"epilogue"
+)
+
+
+def parse(body: bytes, chunk_size: int, parser: MultipartParser = None):
+    """
+    Feeds body to parser in chunks and joins neighbouring data events,
+    so events don't depend on how body was split.
+    """
+    parser = parser or MultipartParser(BOUNDARY)
+    events = []
+    for start in range(0, len(body), chunk_size):
+        for event in parser.feed(body[start:start + chunk_size]):
+            if isinstance(event, bytes) and events and \
+                    isinstance(events[-1], bytes):
+                events[-1] += event
+
+            else:
+                events.append(event)
+
+    return events, parser
+
+
+async def iterate_chunks(body: bytes, chunk_size: int):
+    for start in range(0, len(body), chunk_size):
+        yield body[start:start + chunk_size]
+
+
+def test_parses_parts():
+    events, parser = parse(BODY, len(BODY))
+
+    assert parser.is_finished
+    assert events == [
+        PartHeaders({"content-disposition": 'form-data; name="title"'}),
+        b"Quarterly report",
+        PART_END,
+        PartHeaders({
+            "content-disposition":
+                'form-data; name="file"; filename="r.csv"',
+            "content-type": "text/csv",
+        }),
+        b"id,total\r\n1,--x-bound\r\n2,\r\n-x-boundary",
+        PART_END,
+        FORM_END,
+    ]
+    assert events[3].disposition_parameters == {
+        "name": "file", "filename": "r.csv"
+    }
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(BODY) + 1))
+def test_events_do_not_depend_on_chunk_size(chunk_size):
+    expected, _ = parse(BODY, len(BODY))
+    events, parser = parse(BODY, chunk_size)
+
+    assert parser.is_finished
+    assert events == expected
+
+
+def test_boundary_split_across_chunks():
+    split_at = BODY.index(b"\r\n--x-boundary--") + 6
+    parser = MultipartParser(BOUNDARY)
+
+    parser.feed(BODY[:split_at])
+    assert not parser.is_finished
+    assert parser.feed(BODY[split_at:])[-2:] == [PART_END, FORM_END]
+    assert parser.is_finished
+
+
+def test_part_without_headers():
+    events, _ = parse(b"--x-boundary\r\n\r\nvalue\r\n--x-boundary--", 1)
+
+    assert events == [PartHeaders({}), b"value", PART_END, FORM_END]
+
+
+def test_invalid_byte_after_boundary():
+    with pytest.raises(MultipartParseError):
+        parse(b"--x-boundary\r\n\r\nvalue\r\n--x-boundaryX\r\n", 4)
+
+
+def test_oversized_headers():
+    body = b"--x-boundary\r\nX-Padding: " + b"a" * 64
+
+    with pytest.raises(MultipartParseError):
+        parse(body, 8, MultipartParser(BOUNDARY, max_headers_size=32))
+
+    with pytest.raises(MultipartParseError):
+        parse(
+            body + b"\r\n\r\nvalue",
+            len(body) + 9,
+            MultipartParser(BOUNDARY, max_headers_size=32)
+        )
+
+
+def test_invalid_header():
+    with pytest.raises(MultipartParseError):
+        parse(b"--x-boundary\r\nno colon\r\n\r\nvalue", 16)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(BODY)])
+def test_form_is_read(chunk_size):
+    form = asyncio.run(
+        read_form(iterate_chunks(BODY, chunk_size), CONTENT_TYPE)
+    )
+    try:
+        assert form.fields == {"title": ["Quarterly report"]}
+        uploaded_file = form.files["file"][0]
+        assert uploaded_file.filename == "r.csv"
+        assert uploaded_file.content_type == "text/csv"
+        assert uploaded_file.file.read() == \
+            b"id,total\r\n1,--x-bound\r\n2,\r\n-x-boundary"
+
+    finally:
+        form.close()
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.parametrize("spool_threshold", [10, 1024])
+def test_rolled_over_file_is_written_in_executor(spool_threshold):
+    executor = CountingExecutor()
+
+    async def read():
+        asyncio.get_running_loop().set_default_executor(executor)
+        return await read_form(
+            iterate_chunks(BODY, 7), CONTENT_TYPE,
+            spool_threshold=spool_threshold
+        )
+
+    form = asyncio.run(read())
+    try:
+        uploaded_file = form.files["file"][0]
+        assert uploaded_file.file.read() == \
+            b"id,total\r\n1,--x-bound\r\n2,\r\n-x-boundary"
+        assert uploaded_file.is_rolled_over == (spool_threshold == 10)
+        assert bool(executor.submitted) == uploaded_file.is_rolled_over
+
+    finally:
+        form.close()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        BODY[:BODY.index(b"--x-boundary--")],
+        BODY[:BODY.index(b"Quarterly")],
+        b"--x-boundary\r\n\r\nvalue\r\n--x-boundaryX",
+    ]
+)
+def test_malformed_body_is_bad_request(body):
+    with pytest.raises(HttpError) as error:
+        asyncio.run(read_form(iterate_chunks(body, 5), CONTENT_TYPE))
+
+    assert error.value.status == 400
+
+
+def test_too_many_parts_and_files():
+    with pytest.raises(HttpError) as error:
+        asyncio.run(
+            read_form(iterate_chunks(BODY, 5), CONTENT_TYPE, max_parts=1)
+        )
+
+    assert error.value.status == 413
+
+    with pytest.raises(HttpError) as error:
+        asyncio.run(
+            read_form(iterate_chunks(BODY, 5), CONTENT_TYPE, max_files=0)
+        )
+
+    assert error.value.status == 413
@@ -0,0 +1,135 @@
+import json
+from datetime import date
+from typing import Optional
+
+import pytest
+
+from storm.request.handlers import HttpHandler
+from storm.request.parameters import (
+    CookieParameter,
+    FormParameter,
+    QueryParameter,
+    URLParameter
+)
+from storm.responses import JsonResponse
+from storm.routing import Router
+from tests.asgi import make_app, request
+
+FORM_HEADERS = [(b"content-type", b"application/x-www-form-urlencoded")]
+
+
+class EventsHandler(HttpHandler):
+    day: URLParameter[date]
+    page: QueryParameter[int]
+    per_page: QueryParameter[Optional[int]] = 20
+    session: CookieParameter[Optional[str]] = None
+    title: FormParameter[Optional[str]] = "Untitled"
+
+    async def get(self):
+        return JsonResponse({
+            "day": self.day.isoformat(),
+            "page": self.page,
+            "per_page": self.per_page,
+            "session": self.session,
+            "title": self.title
+        })
+
+    post = get
+
+
+class SlottedEventsHandler(HttpHandler, slotted=True):
+    day: URLParameter[date]
+    page: QueryParameter[int]
+    per_page: QueryParameter[Optional[int]] = 20
+    session: CookieParameter[Optional[str]] = None
+    title: FormParameter[Optional[str]] = "Untitled"
+
+    get = EventsHandler.get
+    post = EventsHandler.get
+
+
+class RequiredFieldsHandler(HttpHandler):
+    title: FormParameter[str]
+    session: CookieParameter[str]
+
+    async def post(self):
+        return JsonResponse({"title": self.title})
+
+
+@pytest.fixture(params=[EventsHandler, SlottedEventsHandler])
+def app(request):
+    router = Router()
+    router.add_handler(request.param, "/events/<day>")
+    router.add_handler(RequiredFieldsHandler, "/required")
+    return make_app(router)
+
+
+def test_values_are_cast(app):
+    status, _, body = request(
+        app, path="/events/2024-02-29", query_string=b"page=2&per_page=5",
+        headers=[(b"cookie", b"session=abc")]
+    )
+
+    assert status == 200
+    assert json.loads(body) == {
+        "day": "2024-02-29", "page": 2, "per_page": 5,
+        "session": "abc", "title": "Untitled"
+    }
+
+
+def test_optional_parameters_get_defaults(app):
+    status, _, body = request(
+        app, path="/events/2024-02-29", query_string=b"page=1"
+    )
+
+    assert status == 200
+    assert json.loads(body) == {
+        "day": "2024-02-29", "page": 1, "per_page": 20,
+        "session": None, "title": "Untitled"
+    }
+
+
+def test_last_sent_value_is_used(app):
+    status, _, body = request(
+        app, method="POST", path="/events/2024-02-29",
+        query_string=b"page=1&page=3", headers=FORM_HEADERS,
+        body=b"title=First&title=Second"
+    )
+
+    assert status == 200
+    assert json.loads(body)["page"] == 3
+    assert json.loads(body)["title"] == "Second"
+
+
+def test_missing_required_parameter_is_bad_request(app):
+    status, _, body = request(app, path="/events/2024-02-29")
+
+    assert status == 400
+    assert body == b"Query parameter page is required"
+
+
+def test_missing_required_form_field_is_bad_request(app):
+    status, _, body = request(
+        app, method="POST", path="/required",
+        headers=[*FORM_HEADERS, (b"cookie", b"session=abc")],
+        body=b"other=1"
+    )
+
+    assert status == 400
+    assert body == b"Form field title is required"
+
+
+def test_invalid_query_value_is_bad_request(app):
+    status, _, body = request(
+        app, path="/events/2024-02-29", query_string=b"page=first"
+    )
+
+    assert status == 400
+    assert body == b"Query parameter page has invalid value"
+
+
+@pytest.mark.parametrize("day", ["2024-13-45", "2023-02-29"])
+def test_unparseable_url_parameter_is_not_found(app, day):
+    status, _, _ = request(app, path=f"/events/{day}", query_string=b"page=1")
+
+    assert status == 404
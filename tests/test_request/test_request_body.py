@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from storm.request.request_body import RequestBody
+
+CHUNKS = [b"a" * 4, b"b" * 4, b"c" * 4, b"d" * 4]
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def make_receive(chunks):
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": True}
+        for chunk in chunks
+    ]
+    messages[-1]["more_body"] = False
+
+    async def receive():
+        return messages.pop(0)
+
+    return receive
+
+
+@pytest.mark.parametrize("spool_threshold, written_in_executor", [
+    # Chunk, that crosses threshold, and following ones go to executor
+    (10, 2),
+    (16, 0),
+])
+def test_spooled_body_is_written_in_executor(
+    spool_threshold, written_in_executor
+):
+    executor = CountingExecutor()
+    body = RequestBody(make_receive(CHUNKS), spool_threshold=spool_threshold)
+
+    async def spool():
+        asyncio.get_running_loop().set_default_executor(executor)
+        return await body.spool()
+
+    spooled_body = asyncio.run(spool())
+    try:
+        assert spooled_body.read() == b"".join(CHUNKS)
+        assert executor.submitted == written_in_executor
+
+    finally:
+        body.close()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from typing import Optional
+
+import pytest
+
+from storm.i18n import Translations
+from storm.internal_types.asgi import HttpASGIConnectionScope
+from storm.request.handlers import HttpHandler
+from storm.request.parameters import QueryParameter, URLParameter
+from storm.responses import JsonResponse
+from storm.routing import Router
+from tests.asgi import make_app, make_raw_scope, request
+
+
+class ProfileHandler(HttpHandler):
+    user_id: URLParameter[int]
+    tab: QueryParameter[Optional[str]] = "posts"
+
+    async def get(self):
+        return JsonResponse({
+            "user_id": self.user_id,
+            "tab": self.tab,
+            "body": (await self.body.read()).decode(),
+            "is_body_cached": self.body is self.body,
+            "session": self.cookies["session"],
+            "locale": self.locale,
+        })
+
+
+class SlottedProfileHandler(HttpHandler, slotted=True):
+    user_id: URLParameter[int]
+    tab: QueryParameter[Optional[str]] = "posts"
+
+    get = ProfileHandler.get
+
+
+class SlottedFriendsHandler(SlottedProfileHandler, slotted=True):
+    tab: QueryParameter[Optional[str]] = "friends"
+    page: QueryParameter[Optional[int]] = 1
+
+    async def get(self):
+        response = await super().get()
+        response.data["page"] = self.page
+        return JsonResponse(response.data)
+
+
+class SlottedArchiveHandler(SlottedProfileHandler, slotted=True):
+    # Default of inherited parameter, given without type hint
+    tab = "archive"
+
+
+def make_handler(handler_type):
+    scope = HttpASGIConnectionScope(make_raw_scope(path="/users/1"))
+    return handler_type(make_app(Router()), scope, None, None)
+
+
+def test_slotted_handler_has_no_dict():
+    assert set(SlottedProfileHandler.__slots__) == {"user_id", "tab"}
+    assert SlottedProfileHandler._slotted_defaults == {"tab": "posts"}
+    assert not hasattr(make_handler(SlottedProfileHandler), "__dict__")
+    assert hasattr(make_handler(ProfileHandler), "__dict__")
+
+
+def test_slotted_subclass():
+    # Slots of base aren't declared again
+    assert set(SlottedFriendsHandler.__slots__) == {"page"}
+    assert SlottedFriendsHandler._slotted_defaults == \
+        {"tab": "friends", "page": 1}
+    assert SlottedProfileHandler._slotted_defaults == {"tab": "posts"}
+    assert SlottedArchiveHandler._slotted_defaults == {"tab": "archive"}
+    assert SlottedArchiveHandler.__slots__ == ()
+    assert not hasattr(make_handler(SlottedFriendsHandler), "__dict__")
+
+
+@pytest.mark.parametrize("handler_type, data", [
+    (ProfileHandler, {"tab": "posts"}),
+    (SlottedProfileHandler, {"tab": "posts"}),
+    (SlottedFriendsHandler, {"tab": "friends", "page": 1}),
+    (SlottedArchiveHandler, {"tab": "archive"}),
+])
+def test_handlers_are_executed(tmp_path, handler_type, data):
+    router = Router()
+    router.add_handler(handler_type, "/users/<user_id>")
+    app = make_app(
+        router,
+        translations=Translations(
+            str(tmp_path), supported_locales=["en", "ru"], default_locale="en"
+        )
+    )
+
+    status, _, body = request(
+        app, path="/users/7", body=b"hello",
+        headers=[
+            (b"cookie", b"session=abc"), (b"accept-language", b"ru-RU")
+        ]
+    )
+
+    assert status == 200
+    assert json.loads(body) == {
+        "user_id": 7, "body": "hello", "is_body_cached": True,
+        "session": "abc", "locale": "ru", **data
+    }
+
+
+@pytest.mark.parametrize(
+    "handler_type", [ProfileHandler, SlottedProfileHandler]
+)
+def test_slot_cached_properties(handler_type):
+    handler = make_handler(handler_type)
+
+    assert not HttpHandler.body.is_computed(handler)
+    body = handler.body
+    assert HttpHandler.body.is_computed(handler)
+    assert handler.body is body
+    assert handler.cookies is handler.cookies
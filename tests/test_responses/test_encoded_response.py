@@ -0,0 +1,67 @@
+import json
+from typing import NamedTuple
+
+import pytest
+
+from storm import json_backend
+from storm.headers import Headers
+from storm.request.handlers import HttpHandler
+from storm.responses import EncodedResponse, JsonResponse
+from storm.responses.encoders import TextEncoder
+from storm.routing import Router
+from tests.asgi import make_app, request
+
+
+class LocaleProbability(NamedTuple):
+    locale: str
+    probability: float
+
+
+class UnencodableHandler(HttpHandler):
+    async def get(self):
+        return JsonResponse({"locale": object()})
+
+
+def test_data_is_encoded_when_response_is_made():
+    with pytest.raises(TypeError):
+        JsonResponse(object())
+
+
+def test_encoding_error_is_internal_server_error():
+    router = Router()
+    router.add_handler(UnencodableHandler, "/locale")
+
+    status, _, _ = request(make_app(router), path="/locale")
+
+    assert status == 500
+
+
+def test_given_headers_are_not_changed():
+    headers = Headers()
+    headers["X-Request-Id"] = "1"
+
+    json_response = JsonResponse({}, headers=headers)
+    text_response = EncodedResponse("", TextEncoder(), headers=headers)
+    text_response.headers["X-Request-Id"] = "2"
+
+    assert headers == {"x-request-id": ["1"]}
+    assert json_response.headers["content-type"] == ["application/json"]
+    assert text_response.headers["content-type"] == \
+        ["text/plain; charset=utf-8"]
+
+
+@pytest.mark.parametrize("data", [
+    {1: "a", 2.5: "b", None: "c"},
+    LocaleProbability("en", 0.5),
+    {"locales": [LocaleProbability("ru", 1.0)]},
+])
+def test_json_backend_encodes_what_json_encodes(data):
+    assert json.loads(json_backend.dumps(data)) == json.loads(json.dumps(data))
+
+
+def test_json_backend_default():
+    assert json.loads(json_backend.dumps({"ids": {1}}, default=sorted)) == \
+        {"ids": [1]}
+
+    with pytest.raises(TypeError):
+        json_backend.dumps(object())
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from storm.headers import Headers
+from storm.responses.encoders import JsonEncoder
+from storm.responses.http import http_errors
+from storm.responses.http.http_errors import (
+    HttpError,
+    PrebuiltHttpError,
+    SharedHttpError
+)
+
+
+def get_body(error) -> bytes:
+    return asyncio.run(error.get_body()).body
+
+
+def test_prebuilt_error_is_frozen():
+    with pytest.raises(AttributeError):
+        http_errors.NotFound.message = "Other"
+
+    with pytest.raises(AttributeError):
+        http_errors.NotFound.status = 410
+
+    assert http_errors.NotFound.status == 404
+    assert get_body(http_errors.NotFound) == b"Not found"
+
+
+def test_prebuilt_error_can_not_be_raised():
+    with pytest.raises(TypeError):
+        raise http_errors.NotFound
+
+    assert not isinstance(http_errors.NotFound, BaseException)
+
+
+def test_raising_called_error_keeps_prebuilt_untouched():
+    def raise_not_found():
+        raise http_errors.NotFound()
+
+    with pytest.raises(HttpError) as error:
+        raise_not_found()
+
+    assert isinstance(error.value, SharedHttpError)
+    assert error.value.__traceback__ is not None
+    assert error.value.is_prebuilt
+    assert error.value.encoded_headers() == \
+        http_errors.NotFound.prebuilt_headers
+    assert get_body(error.value) is http_errors.NotFound.prebuilt_body.body
+    # Each call gives its own exception
+    assert http_errors.NotFound() is not http_errors.NotFound()
+
+
+def test_overrides_give_new_error():
+    headers = Headers()
+    headers["Retry-After"] = "10"
+    error = http_errors.ServiceUnavailable(
+        message="Try later", headers=headers
+    )
+
+    assert type(error) is HttpError
+    assert error.status == 503
+    assert get_body(error) == b"Try later"
+    assert (b"retry-after", b"10") in error.encoded_headers()
+    assert get_body(http_errors.ServiceUnavailable) == b"Service unavailable"
+    assert "retry-after" not in http_errors.ServiceUnavailable.headers
+
+
+def test_changing_shared_error_copies_headers():
+    error = http_errors.Unauthorized()
+    error.headers["WWW-Authenticate"] = "Bearer"
+
+    assert not error.is_prebuilt
+    assert (b"www-authenticate", b"Bearer") in error.encoded_headers()
+    assert "www-authenticate" not in http_errors.Unauthorized.headers
+    assert http_errors.Unauthorized().is_prebuilt
+
+
+def test_encoder_variants_are_prebuilt_once():
+    encoder = JsonEncoder()
+    variant = http_errors.BadRequest.with_encoder(encoder)
+
+    assert isinstance(variant, PrebuiltHttpError)
+    assert http_errors.BadRequest.with_encoder(encoder) is variant
+    assert get_body(variant) == b'"Bad request"'
+    assert (b"content-type", b"application/json") in \
+        variant.encoded_headers()
+
+    error = http_errors.BadRequest(response_encoder=encoder)
+    assert error.is_prebuilt
+    assert error.prebuilt is variant
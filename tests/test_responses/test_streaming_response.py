@@ -0,0 +1,197 @@
+import asyncio
+import threading
+
+from storm.app import StormApp
+from storm.responses import StreamingResponse
+
+
+async def never_disconnect():
+    await asyncio.sleep(3600)
+
+
+def stream(response, send, receive=never_disconnect, send_body=True):
+    asyncio.run(
+        StormApp.send_http_response(
+            send, response, send_body=send_body, receive=receive
+        )
+    )
+
+
+def test_next_chunk_is_pulled_after_send_returns():
+    log = []
+    view = memoryview(b"view")
+
+    async def chunks():
+        for chunk in (b"bytes", b"", bytearray(b"array"), view):
+            log.append("pull")
+            yield chunk
+
+    async def send(message):
+        await asyncio.sleep(0)
+        log.append("sent")
+        if message["type"] == "http.response.body":
+            sent_bodies.append(message["body"])
+
+    sent_bodies = []
+    stream(StreamingResponse(chunks()), send)
+
+    # Empty chunk is skipped, and nothing is pulled while send is waiting
+    assert log == [
+        "sent", "pull", "sent", "pull", "pull", "sent", "pull", "sent", "sent"
+    ]
+    assert sent_bodies[:-1] == [b"bytes", bytearray(b"array"), view]
+    assert sent_bodies[2] is view
+    assert sent_bodies[-1] == b""
+
+
+def test_sync_iterators():
+    for iterate_in_thread in (True, False):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        stream(
+            StreamingResponse(
+                iter([b"a", b"b"]), iterate_in_thread=iterate_in_thread
+            ),
+            send
+        )
+        assert [message.get("body") for message in sent[1:]] == \
+            [b"a", b"b", b""]
+        assert sent[-1]["more_body"] is False
+
+
+def test_iterator_is_closed_when_client_disconnects():
+    closed = []
+    sent = []
+
+    async def chunks():
+        try:
+            while True:
+                await asyncio.sleep(0.01)
+                yield b"chunk"
+
+        finally:
+            closed.append(True)
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    stream(StreamingResponse(chunks()), send, receive)
+
+    assert closed == [True]
+    assert all(message.get("more_body", True) for message in sent)
+
+
+def test_request_body_is_skipped_while_waiting_for_disconnect():
+    messages = [
+        {"type": "http.request", "body": b"unread", "more_body": False},
+        {"type": "http.disconnect"},
+    ]
+    closed = []
+
+    async def chunks():
+        try:
+            while True:
+                await asyncio.sleep(0.01)
+                yield b"chunk"
+
+        finally:
+            closed.append(True)
+
+    async def send(message):
+        pass
+
+    async def receive():
+        await asyncio.sleep(0.02)
+        return messages.pop(0)
+
+    stream(StreamingResponse(chunks()), send, receive)
+
+    assert not messages
+    assert closed == [True]
+
+
+def test_iterator_is_closed_when_send_fails():
+    closed = []
+
+    async def chunks():
+        try:
+            while True:
+                yield b"chunk"
+
+        finally:
+            closed.append(True)
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            raise OSError("Connection lost")
+
+    stream(StreamingResponse(chunks()), send)
+
+    assert closed == [True]
+
+
+def test_iterator_is_closed_when_body_is_not_sent():
+    closed = []
+    sent = []
+
+    def chunks():
+        try:
+            yield b"first"
+            yield b"second"
+
+        finally:
+            closed.append(True)
+
+    async def send(message):
+        sent.append(message)
+
+    iterator = chunks()
+    first_chunk = next(iterator)
+    stream(StreamingResponse(iterator), send, send_body=False)
+
+    assert first_chunk == b"first"
+    assert closed == [True]
+    assert sent[-1] == {
+        "type": "http.response.body", "body": b"", "more_body": False
+    }
+
+
+def test_close_waits_for_iterator_running_in_thread():
+    started = threading.Event()
+    release = threading.Event()
+    events = []
+
+    def chunks():
+        try:
+            yield b"first"
+            started.set()
+            release.wait(5)
+            events.append("next returned")
+            yield b"late"
+
+        finally:
+            events.append("closed")
+
+    async def send(message):
+        if message.get("body") == b"late":
+            events.append("late chunk sent")
+
+    async def receive():
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, started.wait, 5)
+        # Thread is still inside of next when stream is cancelled
+        loop.call_later(0.05, release.set)
+        return {"type": "http.disconnect"}
+
+    stream(StreamingResponse(chunks()), send, receive)
+
+    # Generator is closed only after thread gave it back, so closing
+    # doesn't fail with "generator already executing"
+    assert events == ["next returned", "closed"]
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+
+from storm.routing import Router, lazy_rule
+from tests.asgi import make_app, make_raw_scope, request
+
+
+def test_failed_import_is_internal_server_error(caplog):
+    router = Router()
+    router.add_handler("nonexistent.module:Handler", "/missing")
+    app = make_app(router)
+
+    with caplog.at_level(logging.ERROR):
+        status, _, body = request(app, path="/missing")
+
+    assert status == 500
+    assert body == b"Internal server error"
+    assert any(
+        isinstance(record.exc_info[1], ModuleNotFoundError)
+        for record in caplog.records if record.exc_info
+    )
+
+
+def test_failed_import_is_not_retried(monkeypatch):
+    imports = []
+
+    def counting_import_handler(handler_path):
+        imports.append(handler_path)
+        return original_import_handler(handler_path)
+
+    original_import_handler = lazy_rule.import_handler
+    monkeypatch.setattr(lazy_rule, "import_handler", counting_import_handler)
+
+    router = Router()
+    router.add_handler("tests.asgi:MissingHandler", "/missing")
+    app = make_app(router)
+
+    for method in ("GET", "GET", "HEAD"):
+        status, _, body = request(app, method=method, path="/missing")
+        assert status == 500
+
+    assert body == b""
+    assert imports == ["tests.asgi:MissingHandler"]
+
+
+def test_failed_websocket_import_closes_connection():
+    router = Router()
+    router.add_handler(
+        "nonexistent.module:Handler", "/missing", is_websocket=True
+    )
+    app = make_app(router)
+    scope = dict(make_raw_scope(path="/missing"), type="websocket")
+    sent = []
+
+    async def receive():
+        return {"type": "websocket.connect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+
+    assert sent == [{"type": "websocket.close", "code": 1011}]
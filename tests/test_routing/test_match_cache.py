@@ -0,0 +1,85 @@
+import pytest
+
+from storm.internal_types.asgi import HttpASGIConnectionScope
+from storm.request.handlers import HttpHandler
+from storm.request.parameters import URLParameter
+from storm.routing import HandlerNotFound, Router
+from storm.routing.match_cache import NOT_CACHED, MatchCache
+from storm.routing.rule import MatchedHandler
+
+
+class ItemHandler(HttpHandler):
+    item_id: URLParameter[int]
+
+
+def http_scope(path: str) -> HttpASGIConnectionScope:
+    return HttpASGIConnectionScope(type="http", path=path, method="GET")
+
+
+def make_router(match_cache_size: int = 4) -> Router:
+    router = Router(match_cache_size=match_cache_size)
+    router.add_handler(ItemHandler, "/items/<item_id>")
+    router.order_routes()
+    return router
+
+
+def test_hits_and_misses_are_counted():
+    router = make_router()
+
+    for _ in range(3):
+        matched_handler = router.find_http_handler(http_scope("/items/1"))
+        assert matched_handler.handler is ItemHandler
+
+    info = router.http_match_cache.cache_info()
+    assert (info.hits, info.misses, info.current_size) == (2, 1, 1)
+
+
+def test_not_found_paths_are_not_counted():
+    router = make_router()
+    router.find_http_handler(http_scope("/items/1"))
+
+    for number in range(100):
+        with pytest.raises(HandlerNotFound):
+            router.find_http_handler(http_scope(f"/scan/{number}"))
+
+    info = router.http_match_cache.cache_info()
+    assert (info.hits, info.misses, info.enabled) == (0, 1, True)
+
+
+def test_cache_is_disabled_and_enabled_again():
+    match_cache = MatchCache(max_size=4, min_hit_ratio=0.5, reprobe_windows=2)
+    matched_handler = MatchedHandler(ItemHandler, {})
+
+    # Window of unique paths disables cache
+    for number in range(4):
+        assert match_cache.get(str(number)) is NOT_CACHED
+        match_cache.put(str(number), matched_handler)
+
+    assert not match_cache.enabled
+    assert match_cache.cache_info().current_size == 0
+
+    match_cache.put("hot", matched_handler)
+    assert match_cache.get("hot") is NOT_CACHED
+
+    # Two windows of matched lookups later cache is probed again
+    for number in range(6):
+        match_cache.put(str(number), matched_handler)
+
+    assert not match_cache.enabled
+    match_cache.put("hot", matched_handler)
+    assert match_cache.enabled
+
+    match_cache.put("hot", matched_handler)
+    assert match_cache.get("hot") is matched_handler
+
+
+def test_skewed_traffic_keeps_cache_enabled():
+    router = make_router(match_cache_size=8)
+
+    for number in range(1000):
+        item_id = number % 4 if number % 3 else number
+        router.find_http_handler(http_scope(f"/items/{item_id}"))
+
+    info = router.http_match_cache.cache_info()
+    assert info.enabled
+    assert info.hits > info.misses
@@ -0,0 +1,66 @@
+import re
+from datetime import date
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from storm.request.handlers.utils import compile_url
+from storm.request.parameters.url import compile_type_to_named_group
+
+
+def test_static_url_is_escaped():
+    url_regex, is_static = compile_url("/api/v1.0/items+", {}, "Handler")
+
+    assert is_static
+    assert url_regex.fullmatch("/api/v1.0/items+")
+    assert url_regex.fullmatch("/api/v1x0/items") is None
+
+
+def test_url_parameters_become_named_groups():
+    url_regex, is_static = compile_url(
+        "/users/<user_id>/files/<file_path>",
+        {"user_id": int, "file_path": Path},
+        "Handler"
+    )
+
+    assert not is_static
+    url_match = url_regex.fullmatch("/users/-3/files/a/b.txt")
+    assert url_match.groupdict() == {
+        "user_id": "-3", "file_path": "a/b.txt"
+    }
+    assert url_regex.fullmatch("/users/x/files/a") is None
+
+
+def test_unknown_parameters_are_kept_literally():
+    url_regex, is_static = compile_url("/items/<item_id>", {}, "Handler")
+
+    assert is_static
+    assert url_regex.fullmatch("/items/<item_id>")
+
+
+def test_parameters_missing_in_url_are_rejected():
+    with pytest.raises(KeyError):
+        compile_url("/items", {"item_id": int}, "Handler")
+
+
+@pytest.mark.parametrize(
+    "type_, value",
+    [
+        (int, "12"),
+        (bool, "true"),
+        (float, "-1.5"),
+        (date, "2024-02-29"),
+        (UUID, "12345678-1234-4234-8234-123456789abc"),
+    ]
+)
+def test_types_regexes(type_, value):
+    group_regex = compile_type_to_named_group("value", type_)
+
+    assert group_regex.startswith("(?P<value>")
+    assert re.fullmatch(group_regex, value)
+
+
+def test_group_name_must_be_identifier():
+    with pytest.raises(ValueError):
+        compile_type_to_named_group("1value", int)
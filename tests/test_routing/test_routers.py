@@ -0,0 +1,287 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from storm.internal_types.asgi import (
+    HttpASGIConnectionScope,
+    WebSocketASGIConnectionScope
+)
+from storm.request.handlers import HttpHandler, WebSocketHandler
+from storm.request.parameters import URLParameter
+from storm.routing import (
+    CompiledRegexRouter,
+    HandlerNotFound,
+    RadixRouter,
+    Router
+)
+
+ROUTERS = (Router, RadixRouter, CompiledRegexRouter)
+
+
+class Version:
+    @staticmethod
+    def __compile_to_regex__() -> str:
+        return r"v\d+"
+
+    @staticmethod
+    def __parse_url_parameter__(value: str) -> int:
+        return int(value[1:])
+
+
+class Palindrome:
+    @staticmethod
+    def __compile_to_regex__() -> str:
+        # Groups are numbered across whole url regex, where this regex
+        # is wrapped in group of url parameter
+        return r"(\w)\w*\2"
+
+
+class UsersHandler(HttpHandler):
+    pass
+
+
+class CurrentUserHandler(HttpHandler):
+    pass
+
+
+class UserHandler(HttpHandler):
+    user_id: URLParameter[int]
+
+
+class UserByNameHandler(HttpHandler):
+    name: URLParameter[str]
+
+
+class UserPostHandler(HttpHandler):
+    user_id: URLParameter[int]
+    post_id: URLParameter[int]
+
+
+class FileHandler(HttpHandler):
+    file_path: URLParameter[Path]
+
+
+class FileInfoHandler(HttpHandler):
+    file_id: URLParameter[int]
+
+
+class ApiHandler(HttpHandler):
+    version: URLParameter[Version]
+
+
+class DeepHandler(HttpHandler):
+    item_id: URLParameter[int]
+
+
+class PalindromeHandler(HttpHandler):
+    word: URLParameter[Palindrome]
+
+
+class ChatHandler(WebSocketHandler):
+    room_id: URLParameter[int]
+
+
+HTTP_RULES = (
+    (UsersHandler, "/users"),
+    (CurrentUserHandler, "/users/me"),
+    (UserHandler, "/users/<user_id>"),
+    (UserByNameHandler, "/users/by-name/<name>"),
+    (UserPostHandler, "/users/<user_id>/posts/<post_id>"),
+    (FileInfoHandler, "/files/<file_id>/info"),
+    (FileHandler, "/files/<file_path>"),
+    (ApiHandler, "/api/<version>/status"),
+    (DeepHandler, "/deep/nested/static/chain/<item_id>"),
+)
+
+HTTP_PATHS = (
+    "/users",
+    "/users/me",
+    "/users/42",
+    "/users/-1",
+    "/users/by-name/alice",
+    "/users/by-name/",
+    "/users/42/posts/7",
+    "/users/42/posts/",
+    "/users/42/posts/7/",
+    "/users/me/posts/7",
+    "/files/12/info",
+    "/files/docs/report.csv",
+    "/files/12",
+    "/files/",
+    "/api/v2/status",
+    "/api/2/status",
+    "/api/v2",
+    "/deep/nested/static/chain/5",
+    "/deep/nested/static/5",
+    "/deep/nested/static/chain/x",
+    "/unknown",
+    "/",
+    "",
+)
+
+
+def make_router(router_type, rules=HTTP_RULES):
+    router = router_type()
+    for handler, url in rules:
+        router.add_handler(handler, url)
+
+    router.add_handler(ChatHandler, "/chat/<room_id>")
+    return router
+
+
+def http_scope(path: str) -> HttpASGIConnectionScope:
+    return HttpASGIConnectionScope(type="http", path=path, method="GET")
+
+
+def find(router, path: str):
+    """
+    Gives handler and its url parameters, or None if nothing matched.
+    """
+    try:
+        matched = router.find_http_handler(http_scope(path))
+
+    except HandlerNotFound:
+        return None
+
+    return matched.handler, {
+        name: matched.arguments.group(name)
+        for name in matched.handler._url_parameters_properties
+    }
+
+
+@pytest.mark.parametrize("router_type", ROUTERS[1:])
+@pytest.mark.parametrize("path", HTTP_PATHS)
+def test_same_handlers_as_router(router_type, path):
+    expected = find(make_router(Router), path)
+    router = make_router(router_type)
+
+    assert find(router, path) == expected
+    # Cached lookups give the same result
+    assert find(router, path) == expected
+
+
+@pytest.mark.parametrize("router_type", ROUTERS)
+def test_static_rules_win_over_dynamic(router_type):
+    # Dynamic rule is added before static one and still loses
+    router = make_router(router_type, (
+        (UserByNameHandler, "/users/<name>"),
+        (CurrentUserHandler, "/users/me"),
+    ))
+
+    assert find(router, "/users/me") == (CurrentUserHandler, {})
+    assert find(router, "/users/bob") == (
+        UserByNameHandler, {"name": "bob"}
+    )
+
+
+@pytest.mark.parametrize("router_type", ROUTERS)
+def test_path_parameters_take_rest_of_url(router_type):
+    router = make_router(router_type)
+
+    assert find(router, "/files/a/b/c.txt") == (
+        FileHandler, {"file_path": "a/b/c.txt"}
+    )
+    assert find(router, "/files/12/info") == (
+        FileInfoHandler, {"file_id": "12"}
+    )
+
+
+@pytest.mark.parametrize("router_type", ROUTERS)
+def test_custom_parameter_types(router_type):
+    router = make_router(router_type)
+
+    assert find(router, "/api/v10/status") == (
+        ApiHandler, {"version": "v10"}
+    )
+    assert find(router, "/api/10/status") is None
+
+
+@pytest.mark.parametrize("router_type", ROUTERS)
+def test_websocket_rules(router_type):
+    router = make_router(router_type)
+    scope = WebSocketASGIConnectionScope(type="websocket", path="/chat/3")
+
+    matched = router.find_ws_handler(scope)
+    assert matched.handler is ChatHandler
+    assert matched.arguments.group("room_id") == "3"
+
+    with pytest.raises(HandlerNotFound):
+        router.find_http_handler(http_scope("/chat/3"))
+
+
+def test_radix_tree_is_compressed():
+    router = make_router(RadixRouter)
+    router.import_lazy_handlers()
+    root = router._http_tree.literal_children[""]
+
+    # Chain of literal segments without branching is one node
+    deep = root.literal_children["deep"]
+    assert deep.prefix == ("deep", "nested", "static", "chain")
+    assert len(deep.pattern_children) == 1
+
+    # Branching nodes are kept
+    users = root.literal_children["users"]
+    assert users.prefix == ("users",)
+    assert set(users.literal_children) == {"by-name"}
+
+    assert find(router, "/deep/nested/static/chain/5") == (
+        DeepHandler, {"item_id": "5"}
+    )
+    assert find(router, "/deep/nested/chain/5") is None
+
+
+def test_numbered_backreferences_are_rejected_by_compiled_router():
+    rules = ((PalindromeHandler, "/words/<word>"),)
+
+    # Single rule regex still works in plain router
+    assert find(make_router(Router, rules), "/words/abca") == (
+        PalindromeHandler, {"word": "abca"}
+    )
+
+    with pytest.raises(ValueError):
+        find(make_router(CompiledRegexRouter, rules), "/words/abca")
+
+
+@pytest.mark.parametrize("router_type", ROUTERS)
+def test_route_added_after_lookups_is_found(router_type):
+    router = router_type()
+    for number in range(200):
+        router.add_handler(UserHandler, f"/section{number}/<user_id>")
+
+    router.order_routes()
+    assert find(router, "/section7/1") == (UserHandler, {"user_id": "1"})
+    # Path is remembered by miss cache, before its route is added
+    assert find(router, "/late/1") is None
+
+    router.add_handler(UserHandler, "/late/<user_id>")
+    router.add_handler(UsersHandler, "/late")
+
+    assert find(router, "/late/1") == (UserHandler, {"user_id": "1"})
+    assert find(router, "/late") == (UsersHandler, {})
+    assert find(router, "/section199/2") == (UserHandler, {"user_id": "2"})
+
+
+@pytest.mark.parametrize("router_type", ROUTERS)
+def test_indexes_are_rebuilt_once_by_concurrent_lookups(router_type):
+    router = make_router(router_type)
+    router.find_http_handler(http_scope("/users"))
+    router.add_handler(UserHandler, "/late/<user_id>")
+
+    rebuilds = []
+    build_indexes = router._build_indexes
+
+    def slow_build_indexes():
+        rebuilds.append(threading.current_thread())
+        time.sleep(0.05)
+        build_indexes()
+
+    router._build_indexes = slow_build_indexes
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(find, [router] * 8, ["/late/1"] * 8))
+
+    assert len(rebuilds) == 1
+    assert results == [(UserHandler, {"user_id": "1"})] * 8
+    assert router.http_miss_cache.cache_info().current_size == 0